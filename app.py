@@ -1,15 +1,35 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-import shutil
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
 import os
-import uuid
+import threading
 from typing import Optional
-from researcher_system.core.pipeline import run_pipeline
+from researcher_system.core.config import (
+    WARMUP_MODELS, RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL_SECONDS, JOB_WORKERS, JOB_RETENTION_SECONDS,
+    JOB_MAX_QUEUED, MAX_UPLOAD_BYTES, INFERENCE_SERVER_SOCKET, REPORT_RETENTION_SECONDS, REPORT_REAP_INTERVAL_SECONDS
+)
+from researcher_system.core.model_registry import registry
+from researcher_system.core.result_cache import ResultCache, upload_key
+from researcher_system.core.job_manager import JobManager, JobQueueFull
+from researcher_system.core.report_job import reap_reports
+from researcher_system.nlp.document_source import DocumentSource, UploadTooLarge
 
 app = FastAPI()
 
+# Keep multipart uploads up to the size limit in memory instead of spooling them to disk
+MultiPartParser.spool_max_size = MAX_UPLOAD_BYTES
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    # Refuse before the body is read when the declared size is already over the limit
+    length = request.headers.get("content-length")
+    if request.method == "POST" and length and length.isdigit() and int(length) > MAX_UPLOAD_BYTES + 64 * 1024:
+        return JSONResponse(status_code=413, content={"detail": f"Request exceeds the {MAX_UPLOAD_BYTES} byte upload limit."})
+    return await call_next(request)
+
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
@@ -19,10 +39,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from researcher_system.utils.pdf_highlighter import highlight_text_in_pdf, merge_pdfs
-from researcher_system.utils.pdf_report_generator import generate_summary_page
-from researcher_system.utils.converter_utils import convert_docx_to_pdf
-
 # Ensure uploads directory exists
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -31,95 +47,140 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
+# Identical uploads reuse the stored result and report PDF
+result_cache = ResultCache(RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL_SECONDS)
+
+# Analyses run on worker processes; /jobs exposes them asynchronously, /analyze waits for one
+jobs = JobManager(JOB_WORKERS, UPLOAD_DIR, result_cache, JOB_RETENTION_SECONDS, WARMUP_MODELS, JOB_MAX_QUEUED)
+
+# Opt-in eager model loading (inside the job workers); by default every model loads lazily on first use
+warmup_state = {"requested": [], "status": {}, "done": True}
+
+def _warm_up():
+    try:
+        warmup_state["status"] = jobs.warm_up()
+    except Exception as e:
+        warmup_state["status"] = {"error": str(e)}
+    warmup_state["done"] = True
+
+@app.on_event("startup")
+def start_warm_up():
+    if not WARMUP_MODELS:
+        return
+    names = registry.memory_report()["registered"] if WARMUP_MODELS == "all" else [n.strip() for n in WARMUP_MODELS.split(",") if n.strip()]
+    warmup_state.update({"requested": names, "status": {}, "done": False})
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+# Reports outlive the cache entries and jobs that point at them; they are removed by age only
+reaper_stop = threading.Event()
+
+def _reap_reports_periodically():
+    while not reaper_stop.wait(REPORT_REAP_INTERVAL_SECONDS):
+        reap_reports(UPLOAD_DIR, REPORT_RETENTION_SECONDS)
+
+@app.on_event("startup")
+def start_report_reaper():
+    reap_reports(UPLOAD_DIR, REPORT_RETENTION_SECONDS)
+    threading.Thread(target=_reap_reports_periodically, daemon=True, name="report-reaper").start()
+
+@app.on_event("shutdown")
+def stop_jobs():
+    reaper_stop.set()
+    jobs.shutdown()
+
 @app.get("/")
 def read_root():
     return JSONResponse(content={"message": "Welcome to Researcher System API."})
 
-@app.post("/analyze")
-async def analyze_pdf(file: UploadFile = File(...), doi: Optional[str] = Form(None)):
+@app.get("/ready")
+def readiness():
+    """
+    Readiness probe: 200 once the requested warm-up has finished (immediately when
+    no warm-up is configured), 503 while the job workers are still loading models.
+    """
+    content = {
+        "ready": warmup_state["done"],
+        "warmup": warmup_state,
+        "job_workers": JOB_WORKERS,
+        "inference_server": INFERENCE_SERVER_SOCKET
+    }
+    return JSONResponse(status_code=200 if warmup_state["done"] else 503, content=content)
+
+def _read_upload(file):
+    """
+    Validates the upload and reads it into a DocumentSource without touching disk.
+    Returns (source, content sha256).
+    """
     ext = file.filename.lower()
     if not (ext.endswith(".pdf") or ext.endswith(".docx")):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed.")
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File exceeds the {MAX_UPLOAD_BYTES} byte upload limit.")
+    try:
+        return DocumentSource.from_upload(file.filename, file.file, MAX_UPLOAD_BYTES)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+def _submit_upload(file, doi):
+    source, content_hash = _read_upload(file)
+    try:
+        return jobs.submit(source, doi, upload_key(content_hash, doi, file.filename))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
 
-    file_id = str(uuid.uuid4())
-    original_filename = file.filename
-    temp_path = os.path.join(UPLOAD_DIR, f"temp_{file_id}_{original_filename}")
-    
+@app.post("/jobs")
+async def create_job(file: UploadFile = File(...), doi: Optional[str] = Form(None)):
+    """
+    Stores the upload and queues its analysis; returns the job id immediately.
+    """
     try:
-        file.file.seek(0)
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # 1. Processing Pathway (Conversion if needed)
-        analysis_path = temp_path
-        working_pdf_path = temp_path if ext.endswith(".pdf") else None
-        
-        if ext.endswith(".docx"):
-            working_pdf_path = convert_docx_to_pdf(temp_path, UPLOAD_DIR)
-            if not working_pdf_path:
-                raise Exception("Conversion to PDF failed.")
-        
-        # 2. Run Pipeline
-        result = run_pipeline(temp_path, doi=doi, filename=original_filename)
-        
-        # 3. Comprehensive Highlighting Schema
-        highlights = []
-        
-        # Red: False Citations and Vague Claims (Risks)
-        accent_red = (0.93, 0.26, 0.26)
-        for fc in result.get('false_citations', []):
-            highlights.append((fc['context'], accent_red))
-        for vc in result.get('vague_claims_list', []):
-            highlights.append((vc['text'][:150], accent_red))
-            
-        # Green: Novelty & Contributions
-        accent_green = (0.06, 0.72, 0.5)
-        novelty = result.get('system_review', {}).get('novelty', {}) or {}
-        contributions = result.get('novelty', {}).get('contributions', []) if isinstance(result.get('novelty'), dict) else []
-        for c_text in contributions:
-            highlights.append((c_text[:150], accent_green))
-            
-        # Blue: Rigor (Ablation, Baselines)
-        accent_blue = (0.23, 0.51, 0.96)
-        # Pull from rigor_analyzer findings if possible (we might need to store direct text matches in result)
-        # For now, we'll highlight solid claims if they aren't processed as novelty
-        for sc in result.get('solid_claims', []):
-            highlights.append((sc['text'][:150], accent_blue))
-            
-        # Purple: Datasets
-        accent_purple = (0.54, 0.36, 0.96)
-        for ds in result.get('datasets_found', []):
-            highlights.append((ds, accent_purple))
-
-        # 4. Generate Highlighted Body
-        highlighted_body_path = os.path.join(UPLOAD_DIR, f"hbody_{file_id}.pdf")
-        if highlights and working_pdf_path:
-            highlight_text_in_pdf(working_pdf_path, highlights, highlighted_body_path)
-        else:
-            highlighted_body_path = working_pdf_path if working_pdf_path else None
-
-        # 5. Generate Summary Page
-        summary_page_path = os.path.join(UPLOAD_DIR, f"summary_{file_id}.pdf")
-        generate_summary_page(result, summary_page_path)
-
-        # 6. Merge Summary + Body
-        final_filename = f"report_{file_id}_{original_filename.rsplit('.', 1)[0]}.pdf"
-        final_path = os.path.join(UPLOAD_DIR, final_filename)
-        
-        merge_pdfs([summary_page_path, highlighted_body_path], final_path)
-        
-        result["highlighted_pdf_url"] = f"/uploads/{final_filename}"
-        
-        # Cleanup temp files
-        for p in [temp_path, working_pdf_path, highlighted_body_path, summary_page_path]:
-            if p and os.path.exists(p) and p != final_path:
-                try: os.remove(p)
-                except: pass
+        # Reading, hashing and handing the upload to the pool would otherwise block the event loop
+        job_id = await run_in_threadpool(_submit_upload, file, doi)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": str(e)})
+    return JSONResponse(status_code=202, content={
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}",
+        "result_url": f"/jobs/{job_id}/result"
+    })
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    status = jobs.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown job.")
+    return JSONResponse(content=status)
+
+@app.get("/jobs/{job_id}/result")
+def job_result(job_id: str):
+    outcome = jobs.result(job_id)
+    if outcome is None:
+        raise HTTPException(status_code=404, detail="Unknown job.")
+    status, result, error = outcome
+    if status == "error":
+        return JSONResponse(status_code=500, content={"error": error})
+    if status != "done":
+        return JSONResponse(status_code=202, content={"status": status, "status_url": f"/jobs/{job_id}"})
+    return JSONResponse(content=result)
 
+@app.post("/analyze")
+async def analyze_pdf(file: UploadFile = File(...), doi: Optional[str] = Form(None)):
+    """
+    Blocking compatibility wrapper around the job API: queues the upload and
+    waits for its result without holding up the event loop.
+    """
+    try:
+        job_id = await run_in_threadpool(_submit_upload, file, doi)
+        status, result, error = await run_in_threadpool(jobs.wait, job_id)
+        if status == "error":
+            return JSONResponse(status_code=500, content={"error": error})
         return JSONResponse(content=result)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        if os.path.exists(temp_path): os.remove(temp_path)
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+PAPER_EXTENSIONS = (".pdf", ".docx")
+
+def load_tasks(inputs, recursive=False):
+    """
+    Papers to analyze as (path, doi) pairs, from directories and/or manifests.
+    A manifest is a .txt file with one path per line or a .jsonl file with
+    {"path": ..., "doi": ...} objects; relative paths resolve against the manifest.
+    """
+    tasks = []
+    for item in inputs:
+        if os.path.isdir(item):
+            walker = os.walk(item) if recursive else [(item, [], os.listdir(item))]
+            for root, _, names in walker:
+                tasks.extend((os.path.join(root, n), None) for n in sorted(names) if n.lower().endswith(PAPER_EXTENSIONS))
+        elif item.lower().endswith(PAPER_EXTENSIONS):
+            tasks.append((item, None))
+        else:
+            base = os.path.dirname(os.path.abspath(item))
+            with open(item) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    if item.lower().endswith(".jsonl"):
+                        entry = json.loads(line)
+                        path, doi = entry["path"], entry.get("doi")
+                    else:
+                        path, doi = line, None
+                    tasks.append((path if os.path.isabs(path) else os.path.join(base, path), doi))
+    # Same paper listed twice is analyzed once, keeping a DOI if any listing gave one
+    unique = {}
+    for path, doi in tasks:
+        unique[path] = unique.get(path) or doi
+    return list(unique.items())
+
+def read_checkpoint(path):
+    """
+    { paper path: status } for every paper a previous run finished.
+    """
+    done = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                paper, _, status = line.rstrip("\n").rpartition("\t")
+                if paper:
+                    done[paper] = status
+    return done
+
+def _init_worker(warmup):
+    if warmup:
+        from researcher_system.core.model_registry import registry
+        names = registry.memory_report()["registered"] if warmup == "all" else [n.strip() for n in warmup.split(",") if n.strip()]
+        registry.warm_up(names)
+
+def analyze_one(path, doi):
+    # Runs in a worker process; the pipeline's models stay loaded between papers
+    start = time.perf_counter()
+    try:
+        from researcher_system.core.pipeline import run_pipeline
+        result = run_pipeline(path, doi=doi, filename=os.path.basename(path))
+        status, payload = ("error", result["error"]) if "error" in result else ("ok", result)
+    except Exception as e:
+        status, payload = "error", f"{type(e).__name__}: {e}"
+    record = {"path": path, "doi": doi, "status": status, "elapsed": round(time.perf_counter() - start, 2)}
+    record["result" if status == "ok" else "error"] = payload
+    return record
+
+def _crashed(path, doi):
+    return {"path": path, "doi": doi, "status": "error", "error": "Worker process crashed."}
+
+class BatchRun:
+    """
+    Feeds papers to a process pool with a bounded number in flight and records
+    each finished paper in the JSONL output, then in the checkpoint file, so an
+    interrupted run resumes after the last recorded paper (at-least-once: a
+    paper finished right before a crash may appear twice in the output).
+    """
+
+    def __init__(self, tasks, out_path, checkpoint_path, workers, warmup="", report_every=1):
+        self.tasks = tasks
+        self.out_path = out_path
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers
+        self.warmup = warmup
+        self.report_every = report_every
+        self.done = 0
+        self.errors = 0
+
+    def _pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(self.warmup,))
+
+    def _record(self, out, checkpoint, record):
+        out.write(json.dumps(record, default=str) + "\n")
+        out.flush()
+        os.fsync(out.fileno())
+        checkpoint.write(f"{record['path']}\t{record['status']}\n")
+        checkpoint.flush()
+        self.done += 1
+        self.errors += record["status"] != "ok"
+
+    def _report(self, start):
+        elapsed = time.perf_counter() - start
+        rate = self.done / elapsed * 60 if elapsed > 0 else 0.0
+        remaining = len(self.tasks) - self.done
+        eta = f"{remaining / rate:.0f} min" if rate > 0 else "?"
+        print(f"[batch] {self.done}/{len(self.tasks)} done ({self.errors} errors)  {rate:.1f} papers/min  ETA {eta}", flush=True)
+
+    def run(self):
+        start = time.perf_counter()
+        pending = iter(self.tasks)
+        max_in_flight = self.workers * 2
+        with open(self.out_path, "a") as out, open(self.checkpoint_path, "a") as checkpoint:
+            pool = self._pool()
+            in_flight = {}
+            try:
+                while True:
+                    for path, doi in pending:
+                        in_flight[pool.submit(analyze_one, path, doi)] = (path, doi)
+                        if len(in_flight) >= max_in_flight:
+                            break
+                    if not in_flight:
+                        break
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    broken = False
+                    for future in finished:
+                        path, doi = in_flight.pop(future)
+                        try:
+                            record = future.result()
+                        except BrokenProcessPool:
+                            broken = True
+                            record = _crashed(path, doi)
+                        self._record(out, checkpoint, record)
+                        if self.done % self.report_every == 0:
+                            self._report(start)
+                    if broken:
+                        # A worker died (e.g. out of memory): papers it shared the pool with
+                        # fail too, and a fresh pool takes the rest of the batch
+                        for path, doi in in_flight.values():
+                            self._record(out, checkpoint, _crashed(path, doi))
+                        in_flight.clear()
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        pool = self._pool()
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+        if self.done % self.report_every:
+            self._report(start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the analysis pipeline over many papers, writing one JSON result per line.")
+    parser.add_argument("inputs", nargs="+", help="Directories of PDF/DOCX papers and/or manifests (.txt paths or .jsonl {path, doi})")
+    parser.add_argument("--out", default="batch_results.jsonl", help="JSONL output file (appended to)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <out>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes; each loads the models once")
+    parser.add_argument("--recursive", action="store_true", help="Descend into subdirectories")
+    parser.add_argument("--retry-errors", action="store_true", help="Re-run papers that failed in a previous run")
+    parser.add_argument("--warmup", default=os.environ.get("WARMUP_MODELS", ""), help="Models each worker loads before its first paper")
+    parser.add_argument("--report-every", type=int, default=1, help="Print throughput every N papers")
+    args = parser.parse_args()
+
+    checkpoint_path = args.checkpoint or args.out + ".checkpoint"
+    tasks = load_tasks(args.inputs, args.recursive)
+    finished = read_checkpoint(checkpoint_path)
+    todo = [(path, doi) for path, doi in tasks
+            if path not in finished or (args.retry_errors and finished[path] != "ok")]
+    print(f"[batch] {len(tasks)} papers, {len(tasks) - len(todo)} already done, {len(todo)} to run on {args.workers} workers", flush=True)
+    if todo:
+        BatchRun(todo, args.out, checkpoint_path, args.workers, args.warmup, args.report_every).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from researcher_system.analysis import dataset_analyzer
+from researcher_system.analysis.dataset_analyzer import DatasetKB
+
+KB_SIZE = 10000
+DOC_CHARS = 60000
+DOMAINS = ["Computer Vision", "NLP", "Speech", "Biometrics", "Graphs", "Robotics"]
+FILLER = "We evaluate the proposed model against strong baselines and report mean accuracy over five runs. "
+
+def make_kb(n):
+    rng = random.Random(0)
+    kb = {}
+    while len(kb) < n:
+        name = rng.choice(["", "Open", "Deep", "Multi", "Large"]) + "".join(rng.choice("ABCDEFGHKLMNPRSTVXZ") for _ in range(rng.randint(3, 6)))
+        name += rng.choice(["", "-10", "-1K", "v2", "++", " Captions"])
+        kb[name] = {"year": rng.randint(2000, 2025), "domain": rng.choice(DOMAINS), "superseded_by": []}
+    return kb
+
+def make_text(kb, n_mentions=40):
+    rng = random.Random(1)
+    names = rng.sample(sorted(kb), n_mentions)
+    body = (FILLER * (DOC_CHARS // len(FILLER) + 1))[:DOC_CHARS]
+    pieces = body.split(". ")
+    for name in names:
+        pieces.insert(rng.randrange(len(pieces)), f"Results on {name} [3]")
+    return ". ".join(pieces), set(names)
+
+def old_extract(text, kb_path):
+    # The previous implementation: re-read the KB, then one regex search + re.sub per entry
+    with open(kb_path) as f:
+        kb = json.load(f)
+    found = []
+    for name in sorted(kb, key=len, reverse=True):
+        pattern = rf'\b{re.escape(name)}\b' if name[-1].isalnum() else rf'{re.escape(name)}(?!\w)'
+        if re.search(pattern, text, re.IGNORECASE):
+            found.append(name)
+            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+    return found
+
+def timed(fn, runs=3):
+    best, out = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+if __name__ == "__main__":
+    kb = make_kb(KB_SIZE)
+    text, planted = make_text(kb)
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_path = os.path.join(tmp, "datasets_kb.json")
+        with open(kb_path, "w") as f:
+            json.dump(kb, f)
+        print(f"KB: {len(kb):,} entries, document: {len(text):,} chars, {len(planted)} planted mentions")
+
+        dataset_kb = DatasetKB(kb_path)
+        build, _ = timed(lambda: (setattr(dataset_kb, "_mtime", None), dataset_kb.refresh()), runs=1)
+        print(f"{'KB load + matcher build':<30} {build * 1000:9.1f} ms (once per file change)")
+        refresh, _ = timed(dataset_kb.refresh, runs=5)
+        print(f"{'refresh() without change':<30} {refresh * 1000:9.3f} ms")
+
+        old_time, old_found = timed(lambda: old_extract(text, kb_path), runs=1)
+        print(f"{'per-entry regex (old)':<30} {old_time * 1000:9.1f} ms  {len(set(old_found) & planted)} planted found")
+
+        dataset_analyzer._kb = dataset_kb
+        new_time, new_found = timed(lambda: [name for _, _, name in dataset_kb.find_mentions(text)])
+        print(f"{'single-pass matcher':<30} {new_time * 1000:9.1f} ms  {len(set(new_found) & planted)} planted found  speedup {old_time / new_time:.0f}x")
+
+        usage, _ = timed(lambda: dataset_analyzer.analyze_dataset_usage(sorted(planted)))
+        print(f"{'analyze_dataset_usage':<30} {usage * 1000:9.1f} ms")
@@ -0,0 +1,69 @@
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import docx
+
+from researcher_system.core.config import OFFICE_BINARY
+from researcher_system.utils.converter_utils import convert_docx_to_pdf_subprocess
+from researcher_system.utils.office_pool import OfficePool, uno_available
+
+N_DOCS = 12
+POOL_SIZE = 2
+PARAGRAPH = "We propose a robust method that achieves state-of-the-art accuracy on standard benchmarks [12]. " * 8
+
+def make_docx(path, n_paragraphs=40):
+    document = docx.Document()
+    document.add_heading("Synthetic paper", 0)
+    for i in range(n_paragraphs):
+        document.add_paragraph(f"{i}. {PARAGRAPH}")
+    document.save(path)
+
+def latencies(convert, paths, out_dir, concurrency=1):
+    def one(path):
+        start = time.perf_counter()
+        convert(path, os.path.join(out_dir, os.path.basename(path).replace(".docx", ".pdf")))
+        return time.perf_counter() - start
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        times = list(ex.map(one, paths))
+    return times, time.perf_counter() - start
+
+def report(label, times, wall):
+    print(f"{label:<34} median {statistics.median(times):6.2f}s  max {max(times):6.2f}s  wall {wall:6.2f}s  {len(times) / wall * 60:6.1f} docs/min")
+
+if __name__ == "__main__":
+    if shutil.which(OFFICE_BINARY) is None:
+        sys.exit(f"'{OFFICE_BINARY}' not found; set OFFICE_BINARY to the LibreOffice executable")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(N_DOCS):
+            path = os.path.join(tmp, f"paper_{i}.docx")
+            make_docx(path)
+            paths.append(path)
+        out_dir = os.path.join(tmp, "out")
+        os.makedirs(out_dir)
+        print(f"{N_DOCS} DOCX files, pool size {POOL_SIZE}")
+
+        subprocess_convert = lambda src, dst: convert_docx_to_pdf_subprocess(src, os.path.dirname(dst))
+        report("subprocess per call, sequential", *latencies(subprocess_convert, paths, out_dir))
+
+        if not uno_available():
+            sys.exit("LibreOffice Python bindings (uno) not installed; skipping the pool runs")
+        pool = OfficePool(size=POOL_SIZE, queue_size=N_DOCS, job_timeout=120, binary=OFFICE_BINARY)
+        try:
+            # First job per worker includes the office cold start
+            start = time.perf_counter()
+            for f in [pool.submit(paths[i], os.path.join(out_dir, f"warm_{i}.pdf")) for i in range(POOL_SIZE)]:
+                f.result()
+            print(f"{'pool warm-up (cold start)':<34} {time.perf_counter() - start:6.2f}s")
+            report("pool, sequential", *latencies(pool.convert, paths, out_dir))
+            report(f"pool, {POOL_SIZE} concurrent uploads", *latencies(pool.convert, paths, out_dir, concurrency=POOL_SIZE))
+        finally:
+            pool.shutdown()
@@ -0,0 +1,83 @@
+import time
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sentence_transformers import util
+from researcher_system.models import embedding_engine
+from researcher_system.analysis.false_citation_detector import detect_false_citations
+
+N_REFS = 100
+CONTEXTS_PER_REF = 3
+RUNS = 3
+
+TOPICS = ["face anti-spoofing", "deepfake video detection", "speech recognition", "graph neural networks",
+          "protein folding", "image classification", "reinforcement learning", "federated learning"]
+
+def legacy_embed(texts):
+    # embed() as it was before the cache: a fresh model.encode on every call
+    return embedding_engine.get_embedding_model().encode(texts, convert_to_tensor=True)
+
+def legacy_detect_false_citations(citation_contexts, cited_abstracts_map, similarity_threshold=0.3):
+    # Pre-batching implementation: one encode per abstract and per context sentence
+    flagged_citations = []
+    for citation, contexts in citation_contexts.items():
+        abstract = cited_abstracts_map.get(citation)
+        if not abstract:
+            continue
+        abstract_emb = legacy_embed([abstract])[0]
+        for ctx in contexts:
+            ctx_emb = legacy_embed([ctx])[0]
+            sim_score = float(util.cos_sim(ctx_emb, abstract_emb))
+            if sim_score < similarity_threshold:
+                flagged_citations.append({
+                    "citation": citation,
+                    "context": ctx,
+                    "abstract_snippet": abstract[:200] + "..." if len(abstract) > 200 else abstract,
+                    "similarity_score": sim_score,
+                    "reasoning": "Citation context sentence has very low semantic overlap with the cited paper's abstract."
+                })
+    return flagged_citations
+
+def build_paper(rng):
+    contexts = {}
+    abstracts = {}
+    for i in range(1, N_REFS + 1):
+        marker = f"[{i}]"
+        topic = rng.choice(TOPICS)
+        abstracts[marker] = f"We study {topic} and propose a method that improves accuracy on standard benchmarks by {rng.randint(1, 9)}%."
+        contexts[marker] = [
+            f"Prior work on {rng.choice(TOPICS)} reported strong results {marker}.",
+            f"Method {i} was evaluated under a different protocol {marker}.",
+            f"Recent {topic} systems achieve state-of-the-art performance {marker}."
+        ][:CONTEXTS_PER_REF]
+    return contexts, abstracts
+
+def timed(fn, contexts, abstracts):
+    best = None
+    result = None
+    for _ in range(RUNS):
+        # Cold embedding cache for every run so both paths pay for encoding
+        embedding_engine.cache.clear()
+        start = time.perf_counter()
+        result = fn(contexts, abstracts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+if __name__ == "__main__":
+    contexts, abstracts = build_paper(random.Random(0))
+    print(f"Paper: {N_REFS} references, {sum(len(c) for c in contexts.values())} citation contexts")
+
+    legacy_time, legacy_out = timed(legacy_detect_false_citations, contexts, abstracts)
+    batched_time, batched_out = timed(detect_false_citations, contexts, abstracts)
+
+    print(f"Before (per-pair encode): {legacy_time * 1000:.1f} ms/paper")
+    print(f"After  (block matrix):    {batched_time * 1000:.1f} ms/paper")
+    print(f"Speedup: {legacy_time / batched_time:.1f}x")
+
+    same_pairs = [(f["citation"], f["context"]) for f in legacy_out] == [(f["citation"], f["context"]) for f in batched_out]
+    max_diff = max((abs(a["similarity_score"] - b["similarity_score"]) for a, b in zip(legacy_out, batched_out)), default=0.0)
+    print(f"Flagged: {len(batched_out)} | identical flagged pairs: {same_pairs} | max score diff: {max_diff:.2e}")
@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pymupdf
+
+from researcher_system.utils.pdf_highlighter import highlight_text_in_pdf
+
+N_PAGES = 60
+N_HIGHLIGHTS = 300
+SENTENCES_PER_PAGE = 30
+
+def make_pdf(path):
+    # Synthetic paper whose pages hold distinct, numbered sentences
+    rng = random.Random(0)
+    doc = pymupdf.open()
+    sentences = []
+    for p in range(N_PAGES):
+        page_sentences = [f"Claim {p}-{k}: the proposed model improves accuracy by {rng.randint(1, 40)} points over the baseline."
+                          for k in range(SENTENCES_PER_PAGE)]
+        sentences.append(page_sentences)
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (40, 40, -40, -40), " ".join(page_sentences), fontsize=9)
+    doc.save(path)
+    doc.close()
+    return sentences
+
+def old_highlight(pdf_path, highlights, output_path):
+    # The previous implementation: page.search_for for every highlight on every page
+    doc = pymupdf.open(pdf_path)
+    for text, color in highlights:
+        if not text or len(text) < 5:
+            continue
+        for page in doc:
+            for inst in page.search_for(text):
+                highlight = page.add_highlight_annot(inst)
+                highlight.set_colors(stroke=color)
+                highlight.update()
+    doc.save(output_path)
+    doc.close()
+
+def count_highlighted(path):
+    # Highlighted line boxes (an annotation may carry several)
+    with pymupdf.open(path) as doc:
+        return sum(len(annot.vertices) // 4 for page in doc for annot in page.annots())
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "paper.pdf")
+        sentences = make_pdf(pdf)
+        picks = [(p, rng.randrange(SENTENCES_PER_PAGE)) for p in (rng.randrange(N_PAGES) for _ in range(N_HIGHLIGHTS))]
+        plain = [(sentences[p][k], (0.93, 0.26, 0.26)) for p, k in picks]
+        hinted = [(text, color, [p]) for (text, color), (p, _) in zip(plain, picks)]
+        print(f"{N_HIGHLIGHTS} highlights x {N_PAGES} pages")
+
+        runs = [
+            ("search_for per highlight (old)", lambda out: old_highlight(pdf, plain, out)),
+            ("page index, no hints", lambda out: highlight_text_in_pdf(pdf, plain, out)),
+            ("page index, page hints", lambda out: highlight_text_in_pdf(pdf, hinted, out)),
+        ]
+        baseline = None
+        for label, fn in runs:
+            out = os.path.join(tmp, f"{len(label)}.pdf")
+            elapsed = timed(lambda: fn(out))
+            baseline = baseline or elapsed
+            print(f"{label:<32} {elapsed:7.2f}s  {count_highlighted(out):5d} highlighted lines  speedup {baseline / elapsed:5.1f}x")
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from researcher_system.core.config import ONNX_MODEL_DIR
+from researcher_system.core.model_registry import EMBEDDING_MODEL, ZERO_SHOT_MODEL
+from researcher_system.models.llm_classifier import ClaimClassifier
+from researcher_system.models.onnx_backend import load_onnx_zero_shot, load_onnx_sentence_embedder
+
+SENTENCES = [
+    "We propose a novel attention mechanism that improves accuracy by 4.2% on ImageNet.",
+    "It might be possible that larger models generalize better in some settings.",
+    "What factors determine the robustness of face anti-spoofing systems?",
+    "Deep learning has been widely adopted in computer vision [3].",
+    "In this section we describe the experimental setup.",
+    "Our results demonstrate a significant reduction in error rate compared to the baseline.",
+    "Several studies suggest that the effect could be related to dataset bias.",
+    "The proof follows directly from the triangle inequality.",
+] * 4
+
+def timed(fn, runs=3):
+    best, out = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+def bench_zero_shot():
+    from transformers import pipeline
+    labels = ClaimClassifier(backend="zero-shot").candidate_labels
+    torch_clf = pipeline("zero-shot-classification", model=ZERO_SHOT_MODEL, device=-1)
+    onnx_clf = load_onnx_zero_shot(ZERO_SHOT_MODEL, ONNX_MODEL_DIR)
+
+    t_torch, res_torch = timed(lambda: torch_clf(SENTENCES, labels, batch_size=16))
+    t_onnx, res_onnx = timed(lambda: onnx_clf(SENTENCES, labels, batch_size=16))
+
+    agree = sum(a["labels"][0] == b["labels"][0] for a, b in zip(res_torch, res_onnx))
+    score_diff = max(abs(a["scores"][0] - dict(zip(b["labels"], b["scores"]))[a["labels"][0]]) for a, b in zip(res_torch, res_onnx))
+    print(f"[zero-shot] {ZERO_SHOT_MODEL}, {len(SENTENCES)} sentences x {len(labels)} labels")
+    print(f"  torch fp32: {t_torch * 1000 / len(SENTENCES):.1f} ms/sentence")
+    print(f"  onnx int8:  {t_onnx * 1000 / len(SENTENCES):.1f} ms/sentence ({t_torch / t_onnx:.1f}x)")
+    print(f"  top-label agreement: {agree}/{len(SENTENCES)} | max top-score diff: {score_diff:.3f}")
+
+def bench_embeddings():
+    from sentence_transformers import SentenceTransformer
+    torch_emb = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+    onnx_emb = load_onnx_sentence_embedder(EMBEDDING_MODEL, ONNX_MODEL_DIR)
+
+    t_torch, v_torch = timed(lambda: torch_emb.encode(SENTENCES, convert_to_numpy=True))
+    t_onnx, v_onnx = timed(lambda: onnx_emb.encode(SENTENCES, convert_to_numpy=True))
+
+    cos = (v_torch * v_onnx).sum(axis=1) / (np.linalg.norm(v_torch, axis=1) * np.linalg.norm(v_onnx, axis=1))
+    print(f"[embeddings] {EMBEDDING_MODEL}, {len(SENTENCES)} sentences")
+    print(f"  torch fp32: {t_torch * 1000 / len(SENTENCES):.2f} ms/sentence")
+    print(f"  onnx int8:  {t_onnx * 1000 / len(SENTENCES):.2f} ms/sentence ({t_torch / t_onnx:.1f}x)")
+    print(f"  cosine(torch, onnx): mean {cos.mean():.4f}, min {cos.min():.4f}")
+
+if __name__ == "__main__":
+    # Both paths are loaded directly (not through the registry) so INFERENCE_BACKEND does not matter here
+    bench_embeddings()
+    bench_zero_shot()
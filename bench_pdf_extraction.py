@@ -0,0 +1,60 @@
+import glob
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pymupdf
+
+from researcher_system.nlp.pdf_parser import extract_text
+
+PAGE_COUNTS = [10, 50, 100, 200, 400]
+LINE = "We propose a robust method that achieves state-of-the-art accuracy on standard benchmarks [12]. "
+
+def make_pdf(path, n_pages):
+    # Synthetic paper: dense text pages followed by a numbered reference list
+    doc = pymupdf.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        body = f"Section {i}\n" + "\n".join(LINE for _ in range(45))
+        if i == n_pages - 1:
+            body = "References\n" + "\n".join(f"[{k}] A. Author. Title {k}. Venue, 2019." for k in range(1, 40))
+        page.insert_textbox(page.rect + (40, 40, -40, -40), body, fontsize=8)
+    doc.save(path)
+    doc.close()
+
+def timed(fn, runs=3):
+    best, out = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+if __name__ == "__main__":
+    # Pass a directory of real PDFs to benchmark those instead of synthetic ones
+    if len(sys.argv) > 1:
+        pdfs = sorted(glob.glob(os.path.join(sys.argv[1], "*.pdf")))
+        tmp = None
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        pdfs = []
+        for n in PAGE_COUNTS:
+            path = os.path.join(tmp.name, f"synthetic_{n}p.pdf")
+            make_pdf(path, n)
+            pdfs.append(path)
+
+    print(f"{'file':<28}{'pages':>6}{'PyPDF2 s':>11}{'PyMuPDF s':>11}{'speedup':>9}{'chars ratio':>13}")
+    for path in pdfs:
+        with pymupdf.open(path) as d:
+            n_pages = d.page_count
+        t_old, old = timed(lambda: extract_text(path, backend="pypdf2"))
+        t_new, new = timed(lambda: extract_text(path, backend="pymupdf"))
+        ratio = (len(new["body"]) + len(new["references"])) / max(1, len(old["body"]) + len(old["references"]))
+        print(f"{os.path.basename(path)[:27]:<28}{n_pages:>6}{t_old:>11.2f}{t_new:>11.2f}{t_old / t_new:>8.1f}x{ratio:>13.2f}")
+
+    if tmp:
+        tmp.cleanup()
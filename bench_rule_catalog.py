@@ -0,0 +1,45 @@
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from researcher_system.analysis.heuristic_rules import NOVELTY_RULES, RIGOR_RULES, novelty_catalog, rigor_catalog
+from researcher_system.nlp.pdf_parser import extract_text
+
+SIZES_MB = [0.25, 0.5, 1.0]
+
+def build_text(n_chars):
+    # Sample papers repeated up to the requested size
+    sample = "\n\n".join(extract_text(p)["body"] for p in sorted(glob.glob("researcher_system/data/papers/*.pdf")))
+    if not sample.strip():
+        sample = "We propose a novel method. However, existing methods fail to scale. We report mean and standard deviation over random seeds.\n"
+    return (sample * (n_chars // len(sample) + 1))[:n_chars]
+
+def per_rule_findall(text, rules):
+    # The previous approach: one re.findall over the full text per rule
+    return {category: [m for pattern in patterns for m in re.findall(pattern, text)] for category, patterns in rules.items()}
+
+def timed(fn, runs=3):
+    best, out = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+if __name__ == "__main__":
+    n_rules = len(rigor_catalog.rules) + len(novelty_catalog.rules)
+    print(f"{n_rules} rules ({len(rigor_catalog.rules)} rigor, {len(novelty_catalog.rules)} novelty)")
+    for size in SIZES_MB:
+        text = build_text(int(size * 1024 * 1024))
+        old_time, old = timed(lambda: (per_rule_findall(text, RIGOR_RULES), per_rule_findall(text, NOVELTY_RULES)))
+        new_time, new = timed(lambda: (rigor_catalog.values_by_category(rigor_catalog.scan(text)),
+                                       novelty_catalog.values_by_category(novelty_catalog.scan(text))))
+        same = old == new
+        n_hits = sum(len(v) for part in new for v in part.values())
+        print(f"{size:5.2f} MB  per-rule findall {old_time:6.3f}s   catalog scan {new_time:6.3f}s   "
+              f"speedup {old_time / new_time:4.1f}x   {n_hits:6d} hits   identical={same}")
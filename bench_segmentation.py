@@ -0,0 +1,52 @@
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from researcher_system.core.model_registry import SPACY_MODEL, get_model
+from researcher_system.nlp import sentence_segmenter
+from researcher_system.nlp.pdf_parser import extract_text
+
+PAGES = 100
+CHARS_PER_PAGE = 3000
+
+def build_document():
+    # Sample papers repeated until the text is roughly PAGES pages long
+    sample = "\n\n".join(extract_text(p)["body"] for p in sorted(glob.glob("researcher_system/data/papers/*.pdf")))
+    if not sample.strip():
+        sample = "We propose a method. It achieves 92.1% accuracy (Smith et al., 2020). See Fig. 3 for details.\n"
+    target = PAGES * CHARS_PER_PAGE
+    return (sample * (target // len(sample) + 1))[:target]
+
+def full_spacy_ends(text):
+    # The previous claim_segmenter path: full en_core_web_sm pipeline over the whole body
+    nlp = get_model(SPACY_MODEL)
+    nlp.max_length = max(nlp.max_length, len(text) + 1)
+    return [sent.end_char for sent in nlp(text).sents if sent.text.strip()]
+
+def run(label, fn, text, baseline_ends=None):
+    start = time.perf_counter()
+    result = fn(text)
+    elapsed = time.perf_counter() - start
+    ends = result if isinstance(result, list) else [s.end for s in result]
+    line = f"{label:<28} {elapsed:7.2f}s  {len(text) / elapsed / 1000:8.0f} kchars/s  {PAGES / elapsed:7.1f} pages/s  {len(ends):6d} sentences"
+    if baseline_ends is not None:
+        base = set(baseline_ends)
+        # Compare boundaries ignoring trailing whitespace differences
+        matched = sum(1 for e in ends if e in base or e + 1 in base or e - 1 in base)
+        line += f"  boundary agreement {matched / max(1, len(base)):.1%}"
+    print(line)
+    return ends
+
+if __name__ == "__main__":
+    text = build_document()
+    print(f"Document: {len(text):,} chars (~{PAGES} pages)")
+    get_model(SPACY_MODEL)  # exclude model load time from the baseline
+    baseline = run("full en_core_web_sm (old)", full_spacy_ends, text)
+    for backend in ["senter", "sentencizer", "regex"]:
+        sentence_segmenter._segment_cached.cache_clear()
+        segment = lambda t, b=backend: sentence_segmenter.segment(t, backend=b)
+        segment("Warm up the model.")
+        run(f"segment(backend={backend})", segment, text, baseline)
@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ["torch", "transformers", "sentence_transformers", "spacy", "nltk", "pathway"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def probe(module, env_overrides=None, runs=3):
+    env = dict(os.environ, **(env_overrides or {}))
+    best = None
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                             cwd=ROOT, env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            return {"error": out.stderr.strip().splitlines()[-1] if out.stderr else "failed"}
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+def time_doi_only_pipeline():
+    # DOI_ONLY requests should finish without importing any ML framework
+    code = (
+        "import sys, time\n"
+        "from researcher_system.core.pipeline import run_pipeline\n"
+        "start = time.perf_counter()\n"
+        "run_pipeline(doi='10.1007/s10462-024-10810-6')\n"
+        "print(round(time.perf_counter() - start, 3), [m for m in %r if m in sys.modules])\n" % HEAVY_MODULES
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip() or out.stderr.strip().splitlines()[-1]
+
+if __name__ == "__main__":
+    for module in ["researcher_system.core.pipeline", "app"]:
+        r = probe(module)
+        if "error" in r:
+            print(f"import {module}: {r['error']}")
+        else:
+            print(f"import {module}: {r['seconds']:.2f}s | heavy modules loaded: {r['heavy'] or 'none'}")
+
+    print(f"DOI_ONLY run_pipeline (network-bound): {time_doi_only_pipeline()}")
+
+    start = time.perf_counter()
+    sys.path.append(ROOT)
+    from researcher_system.core.model_registry import registry
+    status = registry.warm_up(registry.memory_report()["registered"])
+    print(f"Eager warm-up of all registered models: {time.perf_counter() - start:.1f}s {status}")
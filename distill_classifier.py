@@ -0,0 +1,121 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from researcher_system.core.config import STUDENT_CLASSIFIER_PATH
+from researcher_system.models import embedding_engine
+from researcher_system.models.llm_classifier import ClaimClassifier
+from researcher_system.models.student_classifier import train_student
+
+def load_corpus_sentences(corpus_dir, limit=None):
+    """
+    Extracts candidate claim sentences from every PDF/DOCX in corpus_dir,
+    using the same segmentation and heuristic filter as the live pipeline.
+    """
+    from researcher_system.nlp.pdf_parser import extract_text
+    from researcher_system.nlp.docx_parser import extract_text_from_docx
+    from researcher_system.nlp.claim_segmenter import split_sentences
+    from researcher_system.core.pathway_pipeline import is_claim_like
+
+    sentences = []
+    for name in sorted(os.listdir(corpus_dir)):
+        path = os.path.join(corpus_dir, name)
+        if name.lower().endswith(".pdf"):
+            body = extract_text(path)["body"]
+        elif name.lower().endswith(".docx"):
+            body = extract_text_from_docx(path)["body"]
+        else:
+            continue
+        sentences.extend(s for s in split_sentences(body) if len(s) > 20 and is_claim_like(s))
+        print(f"[distill] {name}: {len(sentences)} sentences so far", flush=True)
+        if limit and len(sentences) >= limit:
+            break
+    return sentences
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill the BART zero-shot claim classifier into a MiniLM student head.")
+    parser.add_argument("--corpus", help="Directory of PDF/DOCX papers to harvest sentences from")
+    parser.add_argument("--sentences", help="Text file with one sentence per line")
+    parser.add_argument("--out", default=STUDENT_CLASSIFIER_PATH, help="Where to write the student weights (.npz)")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of sentences to label")
+    parser.add_argument("--hidden", type=int, default=256, help="Hidden layer size (0 for a linear head)")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of sentences held out for the agreement report")
+    args = parser.parse_args()
+
+    sentences = []
+    if args.sentences:
+        with open(args.sentences) as f:
+            sentences.extend(line.strip() for line in f if line.strip())
+    if args.corpus:
+        sentences.extend(load_corpus_sentences(args.corpus, args.limit))
+    sentences = list(dict.fromkeys(sentences))[:args.limit]
+    if len(sentences) < 10:
+        sys.exit("Need at least 10 sentences to distill; pass --corpus and/or --sentences.")
+
+    rng = random.Random(0)
+    rng.shuffle(sentences)
+    n_holdout = max(1, int(len(sentences) * args.holdout))
+    train_sents, holdout_sents = sentences[n_holdout:], sentences[:n_holdout]
+
+    # 1. Label everything with the teacher
+    teacher = ClaimClassifier(backend="zero-shot")
+    labels = [teacher._map_label(l) for l in teacher.candidate_labels]
+    # Load BART before timing so the throughput figure excludes model loading, like the student's
+    teacher.classify_distribution_batch(sentences[:1])
+    start = time.perf_counter()
+    distributions = teacher.classify_distribution_batch(sentences)
+    teacher_secs = time.perf_counter() - start
+    dist_by_sentence = dict(zip(sentences, distributions))
+    print(f"[distill] Teacher labelled {len(sentences)} sentences in {teacher_secs:.1f}s", flush=True)
+
+    # 2. Train the head on MiniLM embeddings
+    train_x = embedding_engine.embed(train_sents).cpu().numpy()
+    train_y = np.array([[dist_by_sentence[s][l] for l in labels] for s in train_sents], dtype=np.float32)
+    student = train_student(train_x, train_y, labels, hidden_size=args.hidden, epochs=args.epochs)
+    student.save(args.out)
+
+    # 3. Agreement and throughput on the held-out sentences (cold embedding cache)
+    embedding_engine.cache.clear()
+    start = time.perf_counter()
+    predictions = student.classify_batch(holdout_sents)
+    student_secs = time.perf_counter() - start
+
+    teacher_top = [max(dist_by_sentence[s], key=dist_by_sentence[s].get) for s in holdout_sents]
+    student_top = [p["label"] for p in predictions]
+    agree = sum(t == s for t, s in zip(teacher_top, student_top))
+    is_claim = lambda l: l in ("solid_claim", "vague_claim")
+    claim_agree = sum(is_claim(t) == is_claim(s) for t, s in zip(teacher_top, student_top))
+
+    per_label = {}
+    for label in labels:
+        idx = [i for i, t in enumerate(teacher_top) if t == label]
+        if idx:
+            per_label[label] = {"support": len(idx), "agreement": round(sum(student_top[i] == label for i in idx) / len(idx), 4)}
+
+    teacher_rate = len(sentences) / teacher_secs if teacher_secs else 0.0
+    student_rate = len(holdout_sents) / student_secs if student_secs else 0.0
+    report = {
+        "student_path": args.out,
+        "train_sentences": len(train_sents),
+        "holdout_sentences": len(holdout_sents),
+        "top_label_agreement": round(agree / len(holdout_sents), 4),
+        "claim_vs_nonclaim_agreement": round(claim_agree / len(holdout_sents), 4),
+        "per_label": per_label,
+        "teacher_sentences_per_sec": round(teacher_rate, 1),
+        "student_sentences_per_sec": round(student_rate, 1),
+        "speedup": round(student_rate / teacher_rate, 1) if teacher_rate else None
+    }
+    with open(os.path.splitext(args.out)[0] + ".report.json", "w") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
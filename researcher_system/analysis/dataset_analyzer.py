@@ -1,40 +1,129 @@
 import json
 import re
 import os
+import threading
 from datetime import datetime
+from researcher_system.nlp.parsed_document import as_document
+from researcher_system.nlp.multi_pattern import AhoCorasick, fold_case, select_longest
 
 # Load Dataset KB path
 KB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'core', 'datasets_kb.json')
 
-def get_datasets_kb():
+def _year(info):
     try:
-        with open(KB_PATH, 'r') as f:
-            return json.load(f)
-    except Exception:
-        return {}
+        return int(info.get("year", 0))
+    except (ValueError, TypeError):
+        return 0
+
+class KBSnapshot:
+    """
+    One immutable load of the dataset knowledge base: the raw entries, a
+    multi-pattern matcher over all (lowercased) dataset names and, per domain,
+    the datasets sorted newest first. A reload builds a new snapshot, so a
+    reader holding one never sees a mix of old and new fields.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries if isinstance(entries, dict) else {}
+        # Longest names first, as the old per-name loop did, so the index doubles as a tie-break order
+        self.names = sorted(self.entries, key=len, reverse=True)
+        self.matcher = AhoCorasick([fold_case(name) for name in self.names])
+        self.by_domain = {}
+        for name, info in self.entries.items():
+            if isinstance(info, dict) and info.get("domain"):
+                self.by_domain.setdefault(info["domain"], []).append((name, info))
+        for datasets in self.by_domain.values():
+            datasets.sort(key=lambda x: _year(x[1]), reverse=True)  # Sort newest first
+
+    def find_mentions(self, text):
+        """
+        Every non-overlapping KB dataset mention in text as (start, end, name), in one pass.
+        Case-insensitive; a name must not run into neighbouring word characters.
+        """
+        names = self.names
+        matches = []
+        for start, end, index in self.matcher.find_all(fold_case(text)):
+            name = names[index]
+            if name[0].isalnum() and start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+                continue
+            if end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                continue
+            matches.append((start, end, index))
+        return [(start, end, names[index]) for start, end, index in select_longest(matches)]
+
+class DatasetKB:
+    """
+    The dataset knowledge base, parsed once and reloaded only when the JSON file's
+    mtime changes. Each load is published as a single KBSnapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._snapshot = KBSnapshot({})
+
+    def refresh(self):
+        """
+        Reloads the file if it changed since the last load. Returns the current KBSnapshot.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self._mtime:
+            return self._snapshot
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    with open(self.path, 'r') as f:
+                        entries = json.load(f)
+                except Exception:
+                    entries = {}
+                self._snapshot = KBSnapshot(entries)
+                self._mtime = mtime
+        return self._snapshot
+
+    @property
+    def entries(self):
+        return self._snapshot.entries
+
+    def find_mentions(self, text):
+        return self._snapshot.find_mentions(text)
+
+_kb = DatasetKB(KB_PATH)
+
+def get_dataset_kb():
+    """
+    Snapshot of the shared DatasetKB, reloaded first if datasets_kb.json changed on disk.
+    """
+    return _kb.refresh()
+
+def get_datasets_kb():
+    return get_dataset_kb().entries
 
 def extract_datasets_from_text(text):
     """
     Extracts dataset names from text using known KB matching + dynamic regex for missing ones.
-    Returns a list of unique dataset names found.
+    Returns a list of unique dataset names found. Accepts a ParsedDocument or a raw string.
     """
+    text = as_document(text).text
     found_datasets = []
-    kb = get_datasets_kb()
-    if not isinstance(kb, dict):
-        return []
+    kb = get_dataset_kb()
     
-    # 1. Match Known KB Datasets
-    kb_names = sorted(list(kb.keys()), key=len, reverse=True)
-    for name in kb_names:
-        escaped_name = re.escape(name)
-        pattern = rf'\b{escaped_name}\b'
-        if not name[-1].isalnum():
-            pattern = rf'{escaped_name}(?!\w)'
-            
-        if re.search(pattern, text, re.IGNORECASE):
-            found_datasets.append(name)
-            # Remove matched text so substrings aren't double counted
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+    # 1. Match Known KB Datasets in a single pass over the text
+    mentions = kb.find_mentions(text)
+    if mentions:
+        pieces = []
+        last = 0
+        for start, end, name in mentions:
+            if name not in found_datasets:
+                found_datasets.append(name)
+            pieces.append(text[last:start])
+            last = end
+        pieces.append(text[last:])
+        # Blank out matched text so the dynamic pass below doesn't pick the names up again
+        text = " ".join(pieces)
             
     # 2. Dynamic Regex Extraction (e.g., "CapitalWords [12]")
     dynamic_pattern = r'\b([A-Z][A-Za-z0-9+-]+(?:\s+[A-Z][A-Za-z0-9+-]+)*)\s*(?:\([A-Za-z0-9+-]+\))?\s*\[\d+(?:,\s*\d+)*\]'
@@ -56,7 +145,8 @@ def analyze_dataset_usage(datasets_found, current_year=None, age_threshold=8):
         current_year = datetime.now().year
         
     warnings = []
-    kb = get_datasets_kb()
+    dataset_kb = get_dataset_kb()
+    kb = dataset_kb.entries
     
     # Identify domains of extracted datasets
     identified_domains = {}
@@ -97,9 +187,8 @@ def analyze_dataset_usage(datasets_found, current_year=None, age_threshold=8):
     market_comparison = None
     if identified_domains:
         primary_domain = max(identified_domains, key=lambda k: identified_domains[k])
-        # Get all datasets in KB for this domain
-        domain_datasets = [(k, v) for k, v in kb.items() if isinstance(v, dict) and v.get("domain") == primary_domain]
-        domain_datasets.sort(key=lambda x: int(x[1].get("year", 0)), reverse=True) # Sort newest first
+        # All datasets in KB for this domain, precomputed newest first
+        domain_datasets = dataset_kb.by_domain.get(primary_domain, [])
         
         latest_datasets = [f"{k} ({v.get('year')})" for k, v in domain_datasets[:5]]
         used_in_domain = [ds for ds in datasets_found if kb.get(ds, {}).get("domain") == primary_domain]
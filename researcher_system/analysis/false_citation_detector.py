@@ -1,10 +1,13 @@
 from researcher_system.models.embedding_engine import embed
-from sentence_transformers import util
 
 def detect_false_citations(citation_contexts, cited_abstracts_map, similarity_threshold=0.3):
     """
     Detects potentially false citations by comparing the context sentence
     where the citation was made against the abstract of the cited paper.
+
+    All unique contexts and all abstracts are encoded once as two batches; flagged
+    pairs are then read from a single similarity matrix masked to the
+    (context, citation) pairs that actually occur in the paper.
     
     Args:
         citation_contexts (dict): { "citation_marker": ["context_sentence"...] }
@@ -15,25 +18,44 @@ def detect_false_citations(citation_contexts, cited_abstracts_map, similarity_th
         list of dict: Information on flagged false citations.
     """
     flagged_citations = []
-    
-    for citation, contexts in citation_contexts.items():
-        abstract = cited_abstracts_map.get(citation)
-        
-        if not abstract:
-            continue
-            
-        abstract_emb = embed([abstract])[0]
+
+    # Only citations with a non-empty abstract take part
+    cited = [(citation, contexts) for citation, contexts in citation_contexts.items()
+             if cited_abstracts_map.get(citation) and contexts]
+    if not cited:
+        return flagged_citations
+
+    import torch
+    from sentence_transformers import util
+
+    abstracts = list(dict.fromkeys(cited_abstracts_map[citation] for citation, _ in cited))
+    unique_contexts = list(dict.fromkeys(ctx for _, contexts in cited for ctx in contexts))
+    abstract_col = {a: j for j, a in enumerate(abstracts)}
+    context_row = {ctx: i for i, ctx in enumerate(unique_contexts)}
+
+    sim = util.cos_sim(embed(unique_contexts), embed(abstracts))
+
+    # Mask: only pairs where the context sentence actually cites the abstract's paper
+    mask = sim.new_zeros(sim.shape, dtype=torch.bool)
+    for citation, contexts in cited:
+        j = abstract_col[cited_abstracts_map[citation]]
+        for ctx in contexts:
+            mask[context_row[ctx], j] = True
+    flagged_mask = (mask & (sim < similarity_threshold)).tolist()
+    sim = sim.tolist()
+
+    for citation, contexts in cited:
+        abstract = cited_abstracts_map[citation]
+        j = abstract_col[abstract]
         
         for ctx in contexts:
-            ctx_emb = embed([ctx])[0]
-            sim_score = float(util.cos_sim(ctx_emb, abstract_emb))
-            
-            if sim_score < similarity_threshold:
+            i = context_row[ctx]
+            if flagged_mask[i][j]:
                 flagged_citations.append({
                     "citation": citation,
                     "context": ctx,
                     "abstract_snippet": abstract[:200] + "..." if len(abstract) > 200 else abstract,
-                    "similarity_score": sim_score,
+                    "similarity_score": float(sim[i][j]),
                     "reasoning": "Citation context sentence has very low semantic overlap with the cited paper's abstract."
                 })
                 
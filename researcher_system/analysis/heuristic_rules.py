@@ -0,0 +1,134 @@
+from researcher_system.nlp.rule_catalog import RuleCatalog, literal_rules
+
+# Declarative catalog of the text heuristics used across the analyzers. Each
+# category is a list of regexes; "(?i)" marks a case-insensitive rule.
+
+# Technical rigor (rigor_analyzer.analyze_rigor)
+RIGOR_RULES = {
+    "ablation": [
+        r"(?i)ablation study",
+        r"(?i)impact of (each|the|different) component",
+        r"(?i)component analysis",
+        r"(?i)without (the )?proposed",
+        r"(?i)w/o (the )?proposed",
+        r"(?i)removing (the )?layer",
+        r"(?i)effect of (removing|adding|changing)",
+        r"(?i)sensitivity analysis",
+        r"(?i)exclusion of",
+        r"(?i)variant analysis",
+    ],
+    "baseline": [
+        r"(?i)compared (with|to) (the )?baselines",
+        r"(?i)state-of-the-art (methods|models)",
+        r"(?i)competitive analysis",
+        r"(?i)previous (work|methods)",
+        r"(?i)standard competitive baseline",
+        r"(?i)benchmarked against",
+        r"(?i)sota comparison",
+        r"(?i)outperforms existing",
+        r"(?i)superiority over",
+        r"(?i)against (other|existing) (baselines|approaches)",
+    ],
+    "statistical": [
+        r"(?i)p-value",
+        r"(?i)statistically significant",
+        r"(?i)standard deviation",
+        r"(?i)confidence interval",
+        r"(?i)t-test",
+        r"(?i)anova",
+        r"(?i)chi-square",
+        r"(?i)wilcoxon",
+        r"±\s*\d+\.\d+",
+        r"(?i)multiple seeds",
+        r"(?i)random seeds",
+        r"(?i)variance",
+        r"(?i)mean",
+        r"(?i)standard error",
+        r"(?i)p\s*[<=]\s*0\.\d+",
+        r"(?i)error bars",
+        r"(?i)significant improvement",
+    ],
+    "repro": [
+        r"(?i)github\.com/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+",
+        r"(?i)supplementary material",
+        r"(?i)source code (is|will be) available",
+        r"(?i)reproducibility",
+        r"(?i)hyperparameters",
+        r"(?i)training details",
+        r"(?i)data (is|will be) shared",
+        r"(?i)code (is|will be) provided",
+        r"(?i)experimental setup",
+        r"(?i)hardware config",
+        r"(?i)implementation details",
+    ],
+    "math": [
+        r"(?i)theorem",
+        r"(?i)proof",
+        r"(?i)proposition",
+        r"(?i)mathematical model",
+        r"(?i)formalized",
+        r"(?i)derivation",
+        r"(?i)formulation",
+        r"(?i)definition \d+",
+        r"\b[A-Z]\s*=\s*(?:\\sum|\\int|\\prod|\\lim)\b",
+    ],
+    "assumption": [
+        r"(?i)we assume",
+        r"(?i)assuming",
+        r"(?i)under the assumption",
+        r"(?i)simplified setting",
+        r"(?i)closed-world",
+        r"(?i)constraints",
+        r"(?i)working hypothesis",
+    ],
+}
+
+# Novelty (novelty_analyzer.analyze_novelty): contribution statements are matched per sentence,
+# scientific-gap phrases over the whole text
+NOVELTY_RULES = {
+    "contribution": [
+        r"(?i)our contributions (include|are|summarized as)?",
+        r"(?i)the novelty of (our|this) (paper|work|method)",
+        r"(?i)specifically, we",
+        r"(?i)to the best of our knowledge, (this is )?the first",
+        r"(?i)we provide (the )?first",
+        r"(?i)we propose",
+        r"(?i)we introduce",
+        r"(?i)in this paper, we",
+        r"(?i)main contribution(s)?",
+        r"(?i)fundamental shift",
+        r"(?i)novel method",
+    ],
+    "gap": [
+        r"(?i)however, existing (methods|works|approaches) (fail to|lack|suffer from)",
+        r"(?i)a major limitation (of|is)",
+        r"(?i)this gap (remains|is)",
+        r"(?i)unsolved problem",
+        r"(?i)it is (not yet|unclear|difficult to)",
+        r"(?i)to address these (limitations|issues|challenges)",
+        r"(?i)despite (its|their) success",
+        r"(?i)hard to scale",
+        r"(?i)inefficient",
+    ],
+}
+
+# Claim pre-filter (pathway_pipeline.is_claim_like): plain substrings of the lowercased sentence
+CLAIM_FILTER_RULES = {
+    # Negative filters: common research paper filler/structure
+    "skip": literal_rules(["figure", "table", "section", "chapter", "below", "following", "above", "et al.", "i.e.", "e.g."]),
+    # Positive filters: Indicators of a research claim
+    "indicator": literal_rules(["propose", "method", "achieve", "result", "finding", "conclude", "demonstrate", "evidence", "significant", "superior", "improve"]),
+    # Basic structural check: "we" or "our"
+    "subject": literal_rules(["we ", "our "]),
+}
+
+# Vague wording (vague_detector.is_vague): plain substrings of the lowercased text
+VAGUE_WORDS = ["many", "some", "various", "several", "often"]
+VAGUE_RULES = {
+    "vague": literal_rules(VAGUE_WORDS),
+}
+
+rigor_catalog = RuleCatalog(RIGOR_RULES)
+novelty_catalog = RuleCatalog(NOVELTY_RULES)
+claim_filter_catalog = RuleCatalog(CLAIM_FILTER_RULES)
+vague_catalog = RuleCatalog(VAGUE_RULES)
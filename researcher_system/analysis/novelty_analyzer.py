@@ -1,24 +1,24 @@
-import re
 import logging
-
-# Global model cache to prevent reloading on every request
-_MODEL_CACHE = {}
+from researcher_system.nlp.parsed_document import as_document
+from researcher_system.analysis.heuristic_rules import novelty_catalog
 
 def get_bert_model():
-    if 'model' not in _MODEL_CACHE:
-        try:
-            from sentence_transformers import SentenceTransformer
-            _MODEL_CACHE['model'] = SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception as e:
-            logging.error(f"Failed to load SentenceTransformer: {e}")
-            _MODEL_CACHE['model'] = None
-    return _MODEL_CACHE['model']
+    # Shared with embedding_engine through the process-wide model registry
+    try:
+        from researcher_system.core.model_registry import EMBEDDING_MODEL, get_model
+        return get_model(EMBEDDING_MODEL)
+    except Exception as e:
+        logging.error(f"Failed to load SentenceTransformer: {e}")
+        return None
 
 def analyze_novelty(text):
     """
     Analyzes the novelty claims of the paper.
     Detects: Contribution statements and specific novelty keywords.
+    Accepts a ParsedDocument or a raw string.
     """
+    doc = as_document(text)
+    text = doc.text
     results = {
         "contributions": [],
         "has_contribution_statement": False,
@@ -28,61 +28,36 @@ def analyze_novelty(text):
         "is_novelty_specific": False
     }
     
+    # Contribution statements and gap phrases come from one scan over the text
+    # (see heuristic_rules.NOVELTY_RULES); hits are then mapped back to sentences
+    hits = novelty_catalog.candidates(text)
+
     # 1. Detect Contribution Statements
-    contribution_patterns = [
-        r"(?i)our contributions (include|are|summarized as)?",
-        r"(?i)the novelty of (our|this) (paper|work|method)",
-        r"(?i)specifically, we",
-        r"(?i)to the best of our knowledge, (this is )?the first",
-        r"(?i)we provide (the )?first",
-        r"(?i)we propose",
-        r"(?i)we introduce",
-        r"(?i)in this paper, we",
-        r"(?i)main contribution(s)?",
-        r"(?i)fundamental shift",
-        r"(?i)novel method",
-    ]
-    
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    for i, sentence in enumerate(sentences):
-        for pattern in contribution_patterns:
-            if re.search(pattern, sentence):
-                results["has_contribution_statement"] = True
-                context = sentence.strip()
-                if i + 1 < len(sentences):
-                    context += " " + sentences[i+1].strip()
-                if context not in results["contributions"]:
-                    results["contributions"].append(context)
+    sentences = doc.sentences
+    contribution_sentences = set()
+    for hit in hits:
+        if hit.category != "contribution":
+            continue
+        i = doc.sentence_index(hit.start)
+        if i is not None and hit.end <= sentences[i].end:
+            contribution_sentences.add(i)
+
+    for i in sorted(contribution_sentences):
+        results["has_contribution_statement"] = True
+        context = sentences[i].text.strip()
+        if i + 1 < len(sentences):
+            context += " " + sentences[i+1].text.strip()
+        if context not in results["contributions"]:
+            results["contributions"].append(context)
                     
-    # 2. Novelty Keywords
-    novelty_words = [
-        r"(?i)novel(ty)?",
-        r"(?i)state-of-the-art",
-        r"(?i)sota",
-        r"(?i)outperform",
-        r"(?i)superior",
-        r"(?i)groundbreaking",
-        r"(?i)pioneering"
-    ]
+    # 2. Novelty Keywords (not scored yet)
     
     # 3. Detect Scientific Gap / Problem Motivation
-    gap_patterns = [
-        r"(?i)however, existing (methods|works|approaches) (fail to|lack|suffer from)",
-        r"(?i)a major limitation (of|is)",
-        r"(?i)this gap (remains|is)",
-        r"(?i)unsolved problem",
-        r"(?i)it is (not yet|unclear|difficult to)",
-        r"(?i)to address these (limitations|issues|challenges)",
-        r"(?i)despite (its|their) success",
-        r"(?i)hard to scale",
-        r"(?i)inefficient"
-    ]
-    for pattern in gap_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            results["has_scientific_gap"] = True
-            if isinstance(results["gap_mentions"], list):
-                results["gap_mentions"].extend(list(set(matches)))
+    gap_mentions = novelty_catalog.values_by_category(novelty_catalog.scan(text, categories=["gap"]))["gap"]
+    if gap_mentions:
+        results["has_scientific_gap"] = True
+        # Unique values, first occurrence per rule
+        results["gap_mentions"].extend(dict.fromkeys(gap_mentions))
             
     # 4. BERT-based Semantic Novelty Check
     model = get_bert_model()
@@ -1,7 +1,10 @@
+from researcher_system.nlp.parsed_document import as_document
+
 def generate_review(analysis_data, integrity_breakdown, text):
     """
     Synthesizes all analysis metrics into a qualitative 'Peer Review'.
     Categories: Strengths, Weaknesses, Critical Red Flags.
+    text may be a ParsedDocument or a raw string.
     """
     review = {
         "strengths": [],
@@ -49,8 +52,9 @@ def generate_review(analysis_data, integrity_breakdown, text):
 
     # Structure checks
     critical_sections = ["limitations", "conclusion", "future work", "related work"]
+    text_lower = as_document(text).lower
     for section in critical_sections:
-        if section not in text.lower():
+        if section not in text_lower:
             review["weaknesses"].append({"text": f"Structure Check: Potential missing or poorly labeled '{section.capitalize()}' section.", "source": "Document Topology Engine"})
     
     # --- CRITICAL RED FLAGS ---
@@ -1,4 +1,6 @@
 from researcher_system.api.openalex_client import fetch_authors_for_works
+from researcher_system.nlp.parsed_document import as_document
+from researcher_system.nlp.bib_parser import Bibliography, BibEntry
 
 def compute_self_citations(target_author_ids, referenced_work_ids):
     """
@@ -50,8 +52,9 @@ def compute_self_citations(target_author_ids, referenced_work_ids):
 def extract_authors_heuristic(body_text):
     """
     Attempts to extract author last names from the first few lines of the paper.
+    Accepts a ParsedDocument or a raw string.
     """
-    lines = body_text.split('\n')
+    lines = as_document(body_text).lines
     author_last_names = set()
     
     # Authors are usually found between lines 1 to 20
@@ -81,21 +84,28 @@ def extract_authors_heuristic(body_text):
 def fallback_self_citation_ratio(bib_map, body_text):
     """
     Heuristic method for string-matching self-citations when API data is unavailable.
+    Accepts a Bibliography (uses its precomputed lowercase entries) or a plain {id: text} dict.
     """
     authors = extract_authors_heuristic(body_text)
     if not authors or not bib_map:
         return 0.0, 0
-        
-    count = 0
-    total = len(bib_map)
-    if not isinstance(bib_map, dict):
+
+    if isinstance(bib_map, Bibliography):
+        entries = bib_map.entries
+    elif isinstance(bib_map, dict):
+        entries = [BibEntry(k, str(t), (), None, "", "", None, str(t).lower(), frozenset(), "") for k, t in bib_map.items()]
+    else:
         return 0.0, 0
-        
-    for cit_marker, text in bib_map.items():
-        text_lower = str(text).lower()
+
+    # Lowercase each author once; exact surname hits go through the parsed author keys
+    authors_lower = [a.lower() for a in authors]
+    author_set = set(authors_lower)
+    count = 0
+    total = len(entries)
+    for entry in entries:
         # If any extracted author's last name appears in the citation string
-        if any(a.lower() in text_lower for a in authors):
+        if author_set & entry.author_keys or any(a in entry.norm_text for a in authors_lower):
             count += 1
-            
+
     ratio = count / total if total > 0 else 0.0
     return ratio, count
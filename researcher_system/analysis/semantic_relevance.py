@@ -1,7 +1,17 @@
 from researcher_system.models.embedding_engine import embed
-from sentence_transformers import util
 
 def relevance(c,e):
+    from sentence_transformers import util
     e1=embed([c])
     e2=embed([e])
     return float(util.cos_sim(e1,e2))
+
+def relevance_matrix(claims, evidence):
+    """
+    Encodes each side once as a batch and returns the full cosine similarity
+    matrix: result[i][j] is the relevance of claims[i] to evidence[j].
+    """
+    if not claims or not evidence:
+        return [[0.0] * len(evidence) for _ in claims]
+    from sentence_transformers import util
+    return util.cos_sim(embed(list(claims)), embed(list(evidence))).tolist()
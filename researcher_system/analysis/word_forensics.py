@@ -1,11 +1,13 @@
 import docx
+from researcher_system.nlp.document_source import DocumentSource
 import datetime
 
 def analyze_word_forensics(path):
     """
     Extracts forensic metadata from a Word document.
+    Accepts a path or a DocumentSource (whose opened document is reused).
     """
-    doc = docx.Document(path)
+    doc = path.docx if isinstance(path, DocumentSource) else docx.Document(path)
     core_props = doc.core_properties
     
     results = {
@@ -0,0 +1,287 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from researcher_system.core.config import (
+    OPENALEX_CACHE_PATH, OPENALEX_TTL_WORK_SECONDS, OPENALEX_TTL_AUTHORS_SECONDS, OPENALEX_TTL_ABSTRACT_SECONDS
+)
+
+OPENALEX_URL_PREFIX = "https://openalex.org/"
+
+# Cached per work; each field has its own timestamp column "<field>_at" and TTL
+FIELDS = ("record", "authors", "abstract")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS works (
+    id TEXT PRIMARY KEY,
+    doi TEXT,
+    record TEXT, record_at REAL,
+    authors TEXT, authors_at REAL,
+    abstract TEXT, abstract_at REAL
+);
+CREATE INDEX IF NOT EXISTS works_doi ON works (doi);
+CREATE TABLE IF NOT EXISTS counters (
+    field TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+def short_id(work_id):
+    # "https://openalex.org/W123" -> "W123"
+    return work_id.rstrip("/").split("/")[-1] if work_id else None
+
+def full_id(work_id):
+    return OPENALEX_URL_PREFIX + short_id(work_id)
+
+class OpenAlexCache:
+    """
+    Persistent cache of OpenAlex work data in SQLite, shared by every process
+    on the host (WAL mode, so readers never wait on a writer).
+
+    One row per work, keyed by short OpenAlex ID ("W123") and indexed by
+    normalized DOI. The parsed work record, the author ID list and the abstract
+    are stored and expire independently (work metadata such as citation counts
+    moves; abstracts practically never do). Lookups count hits and misses per
+    field in the counters table, so hit rates survive restarts.
+    """
+
+    def __init__(self, path=OPENALEX_CACHE_PATH, ttl=None):
+        self.path = path
+        self.ttl = {
+            "record": OPENALEX_TTL_WORK_SECONDS,
+            "authors": OPENALEX_TTL_AUTHORS_SECONDS,
+            "abstract": OPENALEX_TTL_ABSTRACT_SECONDS
+        }
+        self.ttl.update(ttl or {})
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _fresh_after(self, field):
+        return time.time() - self.ttl[field]
+
+    def _count(self, field, hits, misses):
+        # Caller holds the lock
+        self._db.execute(
+            "INSERT INTO counters (field, hits, misses) VALUES (?, ?, ?) "
+            "ON CONFLICT (field) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+            (field, hits, misses)
+        )
+
+    def _work(self, column, value):
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT record FROM works WHERE {column} = ? AND record IS NOT NULL AND record_at >= ? LIMIT 1",
+                (value, self._fresh_after("record"))
+            ).fetchone()
+            self._count("record", int(row is not None), int(row is None))
+        return json.loads(row[0]) if row else None
+
+    def work_by_doi(self, doi):
+        """
+        Fresh parsed work record for a normalized DOI, or None.
+        """
+        return self._work("doi", doi)
+
+    def work_by_id(self, work_id):
+        """
+        Fresh parsed work record for an OpenAlex work ID (full URL or "W123"), or None.
+        """
+        return self._work("id", short_id(work_id))
+
+    def get_many(self, work_ids, field):
+        """
+        { full work ID: value } for the fresh cached `field` ("authors" or "abstract") of work_ids.
+        """
+        ids = list(dict.fromkeys(short_id(w) for w in work_ids if w))
+        found = {}
+        with self._lock:
+            # Bounded IN lists stay under SQLite's host-parameter limit
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = self._db.execute(
+                    f"SELECT id, {field} FROM works WHERE id IN ({','.join('?' * len(chunk))}) "
+                    f"AND {field} IS NOT NULL AND {field}_at >= ?",
+                    (*chunk, self._fresh_after(field))
+                ).fetchall()
+                for wid, value in rows:
+                    found[full_id(wid)] = json.loads(value) if field == "authors" else value
+            self._count(field, len(found), len(ids) - len(found))
+        return found
+
+    def put_work(self, record):
+        """
+        Stores a parsed work record (see openalex_client._parse_openalex_response);
+        its author IDs refresh the authors field as well.
+        """
+        if not record or not record.get("id"):
+            return
+        now = time.time()
+        authors = [a["id"] for a in record.get("authors", []) if a.get("id")]
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO works (id, doi, record, record_at, authors, authors_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET doi = excluded.doi, record = excluded.record, record_at = excluded.record_at, "
+                "authors = excluded.authors, authors_at = excluded.authors_at",
+                (short_id(record["id"]), record.get("doi"), json.dumps(record), now, json.dumps(authors), now)
+            )
+
+    def put_many(self, values, field):
+        """
+        Stores { work ID: value } for `field` ("authors" or "abstract").
+        """
+        if not values:
+            return
+        now = time.time()
+        rows = [(short_id(wid), json.dumps(v) if field == "authors" else v, now) for wid, v in values.items() if wid]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    f"INSERT INTO works (id, {field}, {field}_at) VALUES (?, ?, ?) "
+                    f"ON CONFLICT (id) DO UPDATE SET {field} = excluded.{field}, {field}_at = excluded.{field}_at",
+                    rows
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def prune(self, expired_for=0.0):
+        """
+        Clears fields that have been stale for at least expired_for seconds and
+        deletes rows left empty. Returns the number of deleted rows.
+        """
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for field in FIELDS:
+                    self._db.execute(
+                        f"UPDATE works SET {field} = NULL, {field}_at = NULL WHERE {field}_at < ?",
+                        (self._fresh_after(field) - expired_for,)
+                    )
+                deleted = self._db.execute(
+                    "DELETE FROM works WHERE record IS NULL AND authors IS NULL AND abstract IS NULL"
+                ).rowcount
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def stats(self):
+        """
+        Per field: hits, misses, hit_rate, stored and fresh entries; plus the row count and file size.
+        """
+        with self._lock:
+            counters = {field: (hits, misses) for field, hits, misses in self._db.execute("SELECT field, hits, misses FROM counters")}
+            report = {"works": self._db.execute("SELECT COUNT(*) FROM works").fetchone()[0], "fields": {}}
+            for field in FIELDS:
+                stored, fresh = self._db.execute(
+                    f"SELECT COUNT({field}_at), COUNT(CASE WHEN {field}_at >= ? THEN 1 END) FROM works",
+                    (self._fresh_after(field),)
+                ).fetchone()
+                hits, misses = counters.get(field, (0, 0))
+                report["fields"][field] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                    "stored": stored,
+                    "fresh": fresh,
+                    "ttl_seconds": self.ttl[field]
+                }
+        report["file_bytes"] = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return report
+
+    def reset_stats(self):
+        with self._lock:
+            self._db.execute("DELETE FROM counters")
+
+    def vacuum(self):
+        with self._lock:
+            self._db.execute("VACUUM")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_openalex_cache():
+    """
+    Process-wide cache at OPENALEX_CACHE_PATH, or None when caching is disabled.
+    """
+    global _cache
+    if not OPENALEX_CACHE_PATH:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = OpenAlexCache(OPENALEX_CACHE_PATH)
+    return _cache
+
+def _read_keys(values, files):
+    keys = list(values)
+    for path in files:
+        with open(path) as f:
+            keys.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    return keys
+
+def warm(keys, with_references=False):
+    """
+    Fetches DOIs / OpenAlex work IDs into the cache (and, with_references, the
+    authors and abstracts of every work they cite). Returns the number of papers resolved.
+    """
+    from researcher_system.api.openalex_client import (
+        normalize_doi, fetch_paper_by_doi, fetch_paper_by_id, fetch_authors_for_works, fetch_abstracts_for_works
+    )
+    papers = [fetch_paper_by_doi(k) if normalize_doi(k) else fetch_paper_by_id(k) for k in keys]
+    papers = [p for p in papers if p]
+    if with_references:
+        referenced = [w for p in papers for w in p.get("referenced_works_ids", [])]
+        fetch_authors_for_works(referenced)
+        fetch_abstracts_for_works(referenced)
+    return len(papers)
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and maintain the persistent OpenAlex cache.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Hit rates and entry counts per field")
+    prune = sub.add_parser("prune", help="Drop expired entries")
+    prune.add_argument("--expired-for", type=float, default=0.0, help="Only drop entries stale for at least this many seconds")
+    prune.add_argument("--vacuum", action="store_true", help="Shrink the database file afterwards")
+    warm_cmd = sub.add_parser("warm", help="Prefetch works by DOI or OpenAlex ID")
+    warm_cmd.add_argument("keys", nargs="*", help="DOIs or OpenAlex work IDs")
+    warm_cmd.add_argument("--file", action="append", default=[], help="File with one DOI or work ID per line")
+    warm_cmd.add_argument("--with-references", action="store_true", help="Also cache authors and abstracts of the cited works")
+    sub.add_parser("reset-stats", help="Zero the hit/miss counters")
+    args = parser.parse_args()
+
+    cache = get_openalex_cache()
+    if cache is None:
+        parser.error("OpenAlex cache is disabled (OPENALEX_CACHE_PATH is empty)")
+    if args.command == "stats":
+        print(json.dumps(cache.stats(), indent=2))
+    elif args.command == "prune":
+        print(f"[openalex-cache] removed {cache.prune(args.expired_for)} works", flush=True)
+        if args.vacuum:
+            cache.vacuum()
+    elif args.command == "warm":
+        keys = _read_keys(args.keys, args.file)
+        start = time.perf_counter()
+        resolved = warm(keys, args.with_references)
+        print(f"[openalex-cache] resolved {resolved}/{len(keys)} papers in {time.perf_counter() - start:.1f}s", flush=True)
+    elif args.command == "reset-stats":
+        cache.reset_stats()
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,24 @@
-import requests
-import json
-import urllib.parse
+import asyncio
+import logging
+import random
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
-OPENALEX_BASE_URL = "https://api.openalex.org"
+from researcher_system.api.openalex_cache import get_openalex_cache, full_id
+from researcher_system.core.config import (
+    OPENALEX_BASE_URL, OPENALEX_MAILTO, OPENALEX_RATE_LIMIT, OPENALEX_MAX_CONCURRENCY,
+    OPENALEX_MAX_RETRIES, OPENALEX_BACKOFF_BASE, OPENALEX_TIMEOUT
+)
+
+# OpenAlex accepts at most 50 values in one OR filter (openalex:W1|W2|...)
+CHUNK_SIZE = 50
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 30.0
 
 def normalize_doi(doi_str):
     """Extracts clean DOI from a URL or raw string."""
@@ -12,40 +27,64 @@ def normalize_doi(doi_str):
     match = re.search(r'(10\.\d{4,9}/[-._;()/:A-Z0-9]+)', str(doi_str), re.I)
     return match.group(1).lower() if match else None
 
-def fetch_paper_by_doi(doi):
+def default_rate_limit(mailto):
+    # Requests carrying a mailto go to the polite pool, which allows 10 requests/second
+    return OPENALEX_RATE_LIMIT or (10.0 if mailto else 5.0)
+
+class RateLimiter:
     """
-    Fetches OpenAlex data for a given DOI.
-    Returns a dict with relevant metadata or None if not found.
+    Thread-safe token bucket (GCRA): at most `rate` requests per second on
+    average, with up to `burst` requests allowed back to back. rate <= 0 disables it.
     """
-    clean_doi = normalize_doi(doi)
-    if not clean_doi:
-        return None
-    
-    url = f"{OPENALEX_BASE_URL}/works/https://doi.org/{clean_doi}"
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            return _parse_openalex_response(response.json())
-        return None
-    except requests.RequestException:
-        return None
 
-def fetch_paper_by_title(title):
+    def __init__(self, rate, burst=1):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.burst = max(1, burst)
+        self._tat = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Claims the next slot and returns how long the caller must wait for it (seconds).
+        """
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            delay = max(0.0, tat - now - (self.burst - 1) * self.interval)
+            self._tat = tat + self.interval
+        return delay
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+def retry_delay(attempt, backoff_base, retry_after=None):
     """
-    Fetches OpenAlex data for a given title using search.
+    Full-jitter exponential backoff for the given (0-based) retry attempt; a
+    server-sent Retry-After (seconds) is a lower bound.
     """
-    encoded_title = urllib.parse.quote(title)
-    url = f"{OPENALEX_BASE_URL}/works?filter=title.search:{encoded_title}&per-page=1"
+    delay = random.uniform(0, min(MAX_BACKOFF_SECONDS, backoff_base * 2 ** attempt))
     try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("results") and len(data["results"]) > 0:
-                return _parse_openalex_response(data["results"][0])
-        return None
-    except requests.RequestException:
-        return None
-        
+        return max(delay, float(retry_after)) if retry_after else delay
+    except ValueError:
+        return delay
+
+def _chunks(work_ids):
+    # Short IDs ("W123"), deduplicated, in OR-filter sized groups
+    ids = list(dict.fromkeys(w.split("/")[-1] for w in work_ids if w))
+    return [ids[i:i + CHUNK_SIZE] for i in range(0, len(ids), CHUNK_SIZE)]
+
+def _chunk_params(chunk, select):
+    return {"filter": "openalex:" + "|".join(chunk), "per-page": CHUNK_SIZE, "select": select}
+
 def _parse_openalex_response(data):
     """
     Extracts total citations, referenced DOIs, and author IDs.
@@ -58,14 +97,14 @@ def _parse_openalex_response(data):
                 "id": author.get("id"),
                 "display_name": author.get("display_name")
             })
-            
+
     # OpenAlex returns referenced_works as OpenAlex IDs usually: "https://openalex.org/W12345"
     referenced_works = data.get("referenced_works", [])
-    
+
     # We might want to resolve OpenAlex IDs to DOIs, or just use OpenAlex IDs directly.
     # The requirement specifically mentions DOIs, but OpenAlex provides 'referenced_works' as W-IDs by default.
     # We can fetch minimal metadata for these if necessary later.
-    
+
     return {
         "id": data.get("id"),
         "doi": normalize_doi(data.get("doi")),
@@ -78,40 +117,323 @@ def _parse_openalex_response(data):
         "authors": authors
     }
 
+def _author_ids(work):
+    ids = []
+    for auth in work.get("authorships", []):
+        a = auth.get("author", {})
+        if a and a.get("id"):
+            ids.append(a.get("id"))
+    return ids
+
+def reconstruct_abstract(inv_index):
+    """
+    Rebuilds abstract text from OpenAlex's abstract_inverted_index ({word: [positions]}).
+    """
+    if not inv_index:
+        return ""
+    word_index = [(pos, word) for word, positions in inv_index.items() for pos in positions]
+    word_index.sort(key=lambda x: x[0])
+    return " ".join(w for _, w in word_index)
+
+class OpenAlexClient:
+    """
+    OpenAlex API client with a pooled keep-alive session, a shared rate limit,
+    jittered-backoff retries on 429/5xx and connection errors, and concurrent
+    fetching of the 50-ID chunks behind the batch lookups.
+
+    Requests that still fail after max_retries are logged and counted in
+    stats(); lookups then return what they could fetch (None / partial maps),
+    as the pipeline treats OpenAlex data as best-effort.
+    """
+
+    def __init__(self, base_url=OPENALEX_BASE_URL, mailto=OPENALEX_MAILTO, rate_limit=None,
+                 max_concurrency=OPENALEX_MAX_CONCURRENCY, max_retries=OPENALEX_MAX_RETRIES,
+                 backoff_base=OPENALEX_BACKOFF_BASE, timeout=OPENALEX_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.mailto = mailto
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.limiter = RateLimiter(default_rate_limit(mailto) if rate_limit is None else rate_limit, burst=self.max_concurrency)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = f"researcher-system (mailto:{mailto})" if mailto else "researcher-system"
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _count(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _params(self, params):
+        params = dict(params or {})
+        if self.mailto:
+            params["mailto"] = self.mailto
+        return params
+
+    def get_json(self, path, params=None):
+        """
+        GET base_url + path. Returns the decoded JSON, or None on 404 / after retries are exhausted.
+        """
+        url = self.base_url + path
+        params = self._params(params)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            self._count("requests")
+            retry_after = None
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in RETRY_STATUSES:
+                    if response.status_code != 404:
+                        logging.warning(f"OpenAlex {path} returned {response.status_code}")
+                    return None
+                problem = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                problem = type(e).__name__
+            except (requests.RequestException, ValueError) as e:
+                logging.warning(f"OpenAlex {path} failed: {e}")
+                self._count("failures")
+                return None
+            if attempt < self.max_retries:
+                self._count("retries")
+                time.sleep(retry_delay(attempt, self.backoff_base, retry_after))
+        logging.warning(f"OpenAlex {path} still failing after {self.max_retries} retries ({problem})")
+        self._count("failures")
+        return None
+
+    def paper_by_doi(self, doi):
+        clean_doi = normalize_doi(doi)
+        if not clean_doi:
+            return None
+        data = self.get_json(f"/works/https://doi.org/{clean_doi}")
+        return _parse_openalex_response(data) if data else None
+
+    def paper_by_id(self, work_id):
+        data = self.get_json(f"/works/{work_id.split('/')[-1]}") if work_id else None
+        return _parse_openalex_response(data) if data else None
+
+    def paper_by_title(self, title):
+        data = self.get_json("/works", {"filter": f"title.search:{title}", "per-page": 1})
+        if data and data.get("results"):
+            return _parse_openalex_response(data["results"][0])
+        return None
+
+    def _pool(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="openalex")
+            return self._executor
+
+    def works_by_ids(self, work_ids, select):
+        """
+        Fetches the given works (only the `select`ed fields), one request per
+        50-ID chunk with up to max_concurrency chunks in flight.
+        """
+        chunks = _chunks(work_ids)
+        if not chunks:
+            return []
+        if len(chunks) == 1:
+            pages = [self.get_json("/works", _chunk_params(chunks[0], select))]
+        else:
+            pages = self._pool().map(lambda c: self.get_json("/works", _chunk_params(c, select)), chunks)
+        return [work for page in pages if page for work in page.get("results", [])]
+
+    def authors_for_works(self, work_ids):
+        return {w.get("id"): _author_ids(w) for w in self.works_by_ids(work_ids, "id,authorships")}
+
+    def abstracts_for_works(self, work_ids):
+        return {w.get("id"): reconstruct_abstract(w.get("abstract_inverted_index")) for w in self.works_by_ids(work_ids, "id,abstract_inverted_index")}
+
+    def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.session.close()
+
+class AsyncOpenAlexClient:
+    """
+    asyncio counterpart of OpenAlexClient on an httpx.AsyncClient (pip install
+    httpx), with the same rate limit, retry policy and result shapes. Use as
+    `async with AsyncOpenAlexClient() as client: ...`.
+    """
+
+    def __init__(self, base_url=OPENALEX_BASE_URL, mailto=OPENALEX_MAILTO, rate_limit=None,
+                 max_concurrency=OPENALEX_MAX_CONCURRENCY, max_retries=OPENALEX_MAX_RETRIES,
+                 backoff_base=OPENALEX_BACKOFF_BASE, timeout=OPENALEX_TIMEOUT):
+        import httpx
+        self._httpx = httpx
+        self.base_url = base_url.rstrip("/")
+        self.mailto = mailto
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.limiter = RateLimiter(default_rate_limit(mailto) if rate_limit is None else rate_limit, burst=self.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            headers={"User-Agent": f"researcher-system (mailto:{mailto})" if mailto else "researcher-system"}
+        )
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def stats(self):
+        return dict(self._stats)
+
+    async def get_json(self, path, params=None):
+        url = self.base_url + path
+        params = dict(params or {})
+        if self.mailto:
+            params["mailto"] = self.mailto
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.limiter.acquire_async()
+                self._stats["requests"] += 1
+                retry_after = None
+                try:
+                    response = await self.client.get(url, params=params)
+                    if response.status_code == 200:
+                        return response.json()
+                    if response.status_code not in RETRY_STATUSES:
+                        if response.status_code != 404:
+                            logging.warning(f"OpenAlex {path} returned {response.status_code}")
+                        return None
+                    problem = f"HTTP {response.status_code}"
+                    retry_after = response.headers.get("Retry-After")
+                except (self._httpx.TransportError, self._httpx.TimeoutException) as e:
+                    problem = type(e).__name__
+                except (self._httpx.HTTPError, ValueError) as e:
+                    logging.warning(f"OpenAlex {path} failed: {e}")
+                    self._stats["failures"] += 1
+                    return None
+                if attempt < self.max_retries:
+                    self._stats["retries"] += 1
+                    await asyncio.sleep(retry_delay(attempt, self.backoff_base, retry_after))
+        logging.warning(f"OpenAlex {path} still failing after {self.max_retries} retries ({problem})")
+        self._stats["failures"] += 1
+        return None
+
+    async def paper_by_doi(self, doi):
+        clean_doi = normalize_doi(doi)
+        if not clean_doi:
+            return None
+        data = await self.get_json(f"/works/https://doi.org/{clean_doi}")
+        return _parse_openalex_response(data) if data else None
+
+    async def paper_by_id(self, work_id):
+        data = await self.get_json(f"/works/{work_id.split('/')[-1]}") if work_id else None
+        return _parse_openalex_response(data) if data else None
+
+    async def paper_by_title(self, title):
+        data = await self.get_json("/works", {"filter": f"title.search:{title}", "per-page": 1})
+        if data and data.get("results"):
+            return _parse_openalex_response(data["results"][0])
+        return None
+
+    async def works_by_ids(self, work_ids, select):
+        pages = await asyncio.gather(*(self.get_json("/works", _chunk_params(c, select)) for c in _chunks(work_ids)))
+        return [work for page in pages if page for work in page.get("results", [])]
+
+    async def authors_for_works(self, work_ids):
+        return {w.get("id"): _author_ids(w) for w in await self.works_by_ids(work_ids, "id,authorships")}
+
+    async def abstracts_for_works(self, work_ids):
+        return {w.get("id"): reconstruct_abstract(w.get("abstract_inverted_index")) for w in await self.works_by_ids(work_ids, "id,abstract_inverted_index")}
+
+    async def aclose(self):
+        await self.client.aclose()
+
+# Process-wide client behind the module-level helpers, so every lookup shares one connection pool and rate limit
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAlexClient()
+    return _client
+
+def fetch_paper_by_doi(doi):
+    """
+    Fetches OpenAlex data for a given DOI.
+    Returns a dict with relevant metadata or None if not found.
+    Served from the persistent OpenAlex cache while the record is fresh.
+    """
+    clean_doi = normalize_doi(doi)
+    if not clean_doi:
+        return None
+    cache = get_openalex_cache()
+    paper = cache.work_by_doi(clean_doi) if cache else None
+    if paper is None:
+        paper = get_client().paper_by_doi(clean_doi)
+        if paper and cache:
+            cache.put_work(paper)
+    return paper
+
+def fetch_paper_by_id(work_id):
+    """
+    Fetches OpenAlex data for an OpenAlex work ID ("https://openalex.org/W123" or "W123").
+    """
+    cache = get_openalex_cache()
+    paper = cache.work_by_id(work_id) if cache and work_id else None
+    if paper is None:
+        paper = get_client().paper_by_id(work_id)
+        if paper and cache:
+            cache.put_work(paper)
+    return paper
+
+def fetch_paper_by_title(title):
+    """
+    Fetches OpenAlex data for a given title using search.
+    """
+    paper = get_client().paper_by_title(title)
+    cache = get_openalex_cache()
+    if paper and cache:
+        cache.put_work(paper)
+    return paper
+
+def _fetch_cached(work_ids, field, fetch):
+    # Cached values first; only the misses go to OpenAlex, and what comes back is stored
+    cache = get_openalex_cache()
+    if cache is None:
+        return fetch(work_ids)
+    results = cache.get_many(work_ids, field)
+    missing = [w for w in work_ids if w and full_id(w) not in results]
+    if missing:
+        fetched = fetch(missing)
+        cache.put_many(fetched, field)
+        results.update(fetched)
+    return results
+
 def fetch_authors_for_works(work_ids):
     """
     Given a list of OpenAlex work IDs, fetches their authors in batch.
     """
     if not work_ids:
         return {}
-        
-    results = {}
-    # Batch query pattern: https://api.openalex.org/works?filter=openalex:W1|W2|W3
-    # OpenAlex limits to 50 filters per query. We'll chunk them.
-    chunk_size = 50
-    for i in range(0, len(work_ids), chunk_size):
-        chunk = work_ids[i:i+chunk_size]
-        # remove prefix if present
-        cleaned_chunk = [w.split("/")[-1] for w in chunk]
-        filter_str = "|".join(cleaned_chunk)
-        url = f"{OPENALEX_BASE_URL}/works?filter=openalex:{filter_str}&per-page={chunk_size}"
-        
-        try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                for work in data.get("results", []):
-                    work_id = work.get("id")
-                    authors = []
-                    for auth in work.get("authorships", []):
-                        a = auth.get("author", {})
-                        if a and a.get("id"):
-                            authors.append(a.get("id"))
-                    results[work_id] = authors
-        except requests.RequestException:
-            pass
-            
-    return results
+    return _fetch_cached(work_ids, "authors", get_client().authors_for_works)
 
 def fetch_abstracts_for_works(work_ids):
     """
@@ -120,36 +442,4 @@ def fetch_abstracts_for_works(work_ids):
     """
     if not work_ids:
         return {}
-        
-    results = {}
-    chunk_size = 50
-    for i in range(0, len(work_ids), chunk_size):
-        chunk = work_ids[i:i+chunk_size]
-        cleaned_chunk = [w.split("/")[-1] for w in chunk]
-        filter_str = "|".join(cleaned_chunk)
-        url = f"{OPENALEX_BASE_URL}/works?filter=openalex:{filter_str}&per-page={chunk_size}"
-        
-        try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                for work in data.get("results", []):
-                    work_id = work.get("id")
-                    inv_index = work.get("abstract_inverted_index")
-                    
-                    if inv_index:
-                        # Reconstruct abstract
-                        word_index = []
-                        for word, positions in inv_index.items():
-                            for pos in positions:
-                                word_index.append((pos, word))
-                        # Sort by position
-                        word_index.sort(key=lambda x: x[0])
-                        abstract = " ".join([w[1] for w in word_index])
-                        results[work_id] = abstract
-                    else:
-                        results[work_id] = ""
-        except requests.RequestException:
-            pass
-            
-    return results
+    return _fetch_cached(work_ids, "abstract", get_client().abstracts_for_works)
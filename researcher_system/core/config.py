@@ -1 +1,100 @@
+import os
+
 PAPER_PATH="researcher_system/data/papers/test.pdf"
+
+# Embedding cache: in-process LRU budget (bytes) and optional shared on-disk tier
+EMBED_CACHE_MAX_BYTES=int(os.environ.get("EMBED_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+EMBED_CACHE_DIR=os.environ.get("EMBED_CACHE_DIR") or None
+
+# Model registry: total resident budget for loaded models (0 = unlimited)
+MODEL_MEMORY_BUDGET_MB=int(os.environ.get("MODEL_MEMORY_BUDGET_MB", 0))
+
+# Claim classifier backend: "zero-shot" (BART teacher) or "student" (distilled MiniLM head)
+CLAIM_CLASSIFIER_BACKEND=os.environ.get("CLAIM_CLASSIFIER_BACKEND", "zero-shot")
+STUDENT_CLASSIFIER_PATH=os.environ.get("STUDENT_CLASSIFIER_PATH", "researcher_system/data/models/claim_student.npz")
+
+# Inference backend for the zero-shot classifier and embeddings: "torch" or "onnx" (int8 onnxruntime)
+INFERENCE_BACKEND=os.environ.get("INFERENCE_BACKEND", "torch")
+ONNX_MODEL_DIR=os.environ.get("ONNX_MODEL_DIR", "researcher_system/data/onnx")
+
+# Zero-shot NLI executor: premise cap and padded-token budget per forward batch
+ZERO_SHOT_EXECUTOR=os.environ.get("ZERO_SHOT_EXECUTOR", "nli")  # "nli" (token-budget executor) or "pipeline" (HF pipeline)
+NLI_MAX_PREMISE_TOKENS=int(os.environ.get("NLI_MAX_PREMISE_TOKENS", 256))
+NLI_MAX_BATCH_TOKENS=int(os.environ.get("NLI_MAX_BATCH_TOKENS", 8192))
+
+# Shared inference server (python -m researcher_system.core.inference_server): when INFERENCE_SERVER_SOCKET
+# is set, the zero-shot classifier, embedder and NLI model are not loaded in this process; calls go to the
+# server on that Unix socket, which merges concurrent requests into batches of up to INFERENCE_MAX_BATCH
+# sentences, holding a batch open at most INFERENCE_MAX_WAIT_MS for it to fill.
+INFERENCE_SERVER_SOCKET=os.environ.get("INFERENCE_SERVER_SOCKET") or None
+INFERENCE_SERVER_AUTHKEY=os.environ.get("INFERENCE_SERVER_AUTHKEY") or None
+INFERENCE_MAX_BATCH=int(os.environ.get("INFERENCE_MAX_BATCH", 64))
+INFERENCE_MAX_WAIT_MS=float(os.environ.get("INFERENCE_MAX_WAIT_MS", 10))
+
+# Startup: models to load eagerly when the API starts ("" = lazy, "all" = every registered model,
+# or a comma-separated list of registry names)
+WARMUP_MODELS=os.environ.get("WARMUP_MODELS", "")
+
+# Sentence segmentation shared by all stages: "senter" (spaCy senter only), "sentencizer" (rule-based) or "regex"
+SEGMENTER_BACKEND=os.environ.get("SEGMENTER_BACKEND", "senter")
+SEGMENTER_CHUNK_CHARS=int(os.environ.get("SEGMENTER_CHUNK_CHARS", 100000))
+
+# PDF text extraction: "pymupdf" (default) or "pypdf2"; PyMuPDF fans page ranges out to a
+# process pool once a document has at least PDF_PARALLEL_MIN_PAGES pages
+PDF_BACKEND=os.environ.get("PDF_BACKEND", "pymupdf")
+PDF_PARALLEL_MIN_PAGES=int(os.environ.get("PDF_PARALLEL_MIN_PAGES", 64))
+PDF_EXTRACT_WORKERS=int(os.environ.get("PDF_EXTRACT_WORKERS", min(4, os.cpu_count() or 1)))
+
+# Streaming mode: classify candidate sentences in micro-batches while later pages are still being parsed.
+# STREAM_MAX_PENDING bounds how many candidate sentences may wait for the classifier at once.
+STREAMING_PIPELINE=os.environ.get("STREAMING_PIPELINE", "0") == "1"
+STREAM_MICRO_BATCH=int(os.environ.get("STREAM_MICRO_BATCH", 32))
+STREAM_MAX_PENDING=int(os.environ.get("STREAM_MAX_PENDING", 256))
+
+# /analyze result cache: identical uploads (bytes + DOI + filename + pipeline version) reuse the
+# stored run_pipeline result and rendered report PDF. Bump RESULT_CACHE_VERSION when analysis logic changes.
+RESULT_CACHE_MAX_ENTRIES=int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", 128))  # 0 disables the cache
+RESULT_CACHE_TTL_SECONDS=float(os.environ.get("RESULT_CACHE_TTL_SECONDS", 24 * 3600))
+RESULT_CACHE_VERSION=os.environ.get("RESULT_CACHE_VERSION", "1")
+
+# DOCX -> PDF conversion: per-process pool of long-lived headless LibreOffice workers driven over named UNO pipes
+# (needs the LibreOffice Python bindings, "uno"; falls back to one soffice process per call without them).
+# OFFICE_POOL_SIZE=0 always uses the per-call subprocess.
+OFFICE_BINARY=os.environ.get("OFFICE_BINARY", "soffice")
+OFFICE_POOL_SIZE=int(os.environ.get("OFFICE_POOL_SIZE", 2))
+OFFICE_POOL_QUEUE=int(os.environ.get("OFFICE_POOL_QUEUE", 16))
+OFFICE_JOB_TIMEOUT=float(os.environ.get("OFFICE_JOB_TIMEOUT", 120))
+
+# Job API: analyses run in JOB_WORKERS worker processes (each loads its models once);
+# finished jobs are kept for JOB_RETENTION_SECONDS. Each job waiting for a worker holds its upload
+# in the API process, so at most JOB_MAX_QUEUED may wait; further submissions get a 503.
+JOB_WORKERS=int(os.environ.get("JOB_WORKERS", 1))
+JOB_RETENTION_SECONDS=float(os.environ.get("JOB_RETENTION_SECONDS", 3600))
+JOB_MAX_QUEUED=int(os.environ.get("JOB_MAX_QUEUED", 16))
+
+# Rendered report PDFs in the upload dir are deleted by age, not when a result cache entry goes away, so
+# URLs handed out stay valid: by default for as long as a cache hit plus a retained job can reference them.
+REPORT_RETENTION_SECONDS=float(os.environ.get("REPORT_RETENTION_SECONDS", RESULT_CACHE_TTL_SECONDS + JOB_RETENTION_SECONDS))
+REPORT_REAP_INTERVAL_SECONDS=float(os.environ.get("REPORT_REAP_INTERVAL_SECONDS", 600))
+
+# Uploads larger than this are rejected before any parsing (bytes). Uploads up to this size are kept in memory.
+MAX_UPLOAD_BYTES=int(os.environ.get("MAX_UPLOAD_BYTES", 50 * 1024 * 1024))
+
+# OpenAlex client: one pooled session per process, batch lookups fetch up to OPENALEX_MAX_CONCURRENCY
+# 50-ID chunks at once under OPENALEX_RATE_LIMIT requests/second (0 = 10/s with OPENALEX_MAILTO, which
+# joins the polite pool, 5/s without). 429/5xx and connection errors are retried with jittered backoff.
+OPENALEX_BASE_URL=os.environ.get("OPENALEX_BASE_URL", "https://api.openalex.org")
+OPENALEX_MAILTO=os.environ.get("OPENALEX_MAILTO") or None
+OPENALEX_RATE_LIMIT=float(os.environ.get("OPENALEX_RATE_LIMIT", 0))
+OPENALEX_MAX_CONCURRENCY=int(os.environ.get("OPENALEX_MAX_CONCURRENCY", 4))
+OPENALEX_MAX_RETRIES=int(os.environ.get("OPENALEX_MAX_RETRIES", 4))
+OPENALEX_BACKOFF_BASE=float(os.environ.get("OPENALEX_BACKOFF_BASE", 0.5))
+OPENALEX_TIMEOUT=float(os.environ.get("OPENALEX_TIMEOUT", 15))
+
+# Persistent OpenAlex cache (SQLite, shared by all processes; "" disables it). Fields expire separately:
+# work records carry citation counts that move, author lists rarely change and abstracts practically never do.
+# Maintain with: python -m researcher_system.api.openalex_cache {stats,warm,prune,reset-stats}
+OPENALEX_CACHE_PATH=os.environ.get("OPENALEX_CACHE_PATH", "researcher_system/data/openalex_cache.sqlite")
+OPENALEX_TTL_WORK_SECONDS=float(os.environ.get("OPENALEX_TTL_WORK_SECONDS", 7 * 24 * 3600))
+OPENALEX_TTL_AUTHORS_SECONDS=float(os.environ.get("OPENALEX_TTL_AUTHORS_SECONDS", 90 * 24 * 3600))
+OPENALEX_TTL_ABSTRACT_SECONDS=float(os.environ.get("OPENALEX_TTL_ABSTRACT_SECONDS", 365 * 24 * 3600))
@@ -1,9 +1,24 @@
-import torch
+_device=None
 
-DEVICE="cuda" if torch.cuda.is_available() else "cpu"
+def get_device():
+    """
+    "cuda" or "cpu". torch is only imported the first time a device is needed.
+    """
+    global _device
+    if _device is None:
+        import torch
+        _device="cuda" if torch.cuda.is_available() else "cpu"
+    return _device
+
+def __getattr__(name):
+    # Lazy module attribute so `gpu_manager.DEVICE` keeps working without importing torch up front
+    if name=="DEVICE":
+        return get_device()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def show_gpu():
-    if DEVICE=="cuda":
+    if get_device()=="cuda":
+        import torch
         print("Using GPU:",torch.cuda.get_device_name(0))
     else:
         print("Using CPU")
@@ -0,0 +1,272 @@
+import argparse
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, answer_challenge, deliver_challenge
+
+from researcher_system.core.config import (
+    INFERENCE_SERVER_SOCKET, INFERENCE_SERVER_AUTHKEY, INFERENCE_MAX_BATCH, INFERENCE_MAX_WAIT_MS
+)
+from researcher_system.core.model_registry import (
+    EMBEDDING_MODEL, ZERO_SHOT_MODEL, NLI_MODEL, SERVED_MODELS, registry, get_model
+)
+
+class DynamicBatcher:
+    """
+    Collects (key, items) requests from many threads and runs them through
+    run_batch(key, items) -> results (one per item) in merged batches.
+
+    Requests only share a batch when their keys match (e.g. the same zero-shot
+    label set); a batch closes at max_batch items or max_wait seconds after its
+    first request, and each caller gets back exactly its own slice of the results.
+    """
+
+    def __init__(self, name, run_batch, max_batch=64, max_wait=0.01):
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.items = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._loop, name=f"batcher-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, key, items):
+        """
+        Queues items and returns a Future resolving to their results.
+        """
+        future = Future()
+        if not items:
+            future.set_result([])
+            return future
+        self._queue.put((key, list(items), future))
+        return future
+
+    def __call__(self, key, items):
+        return self.submit(key, items).result()
+
+    def _collect(self):
+        # Block for the first request, then keep the batch open until it is full or its deadline passes
+        first = self._queue.get()
+        if first is None:
+            return None
+        pending = [first]
+        size = len(first[1])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                self._queue.put(None)
+                break
+            pending.append(request)
+            size += len(request[1])
+        return pending
+
+    def _loop(self):
+        while True:
+            pending = self._collect()
+            if pending is None:
+                return
+            groups = defaultdict(list)
+            for request in pending:
+                groups[request[0]].append(request)
+            for key, requests in groups.items():
+                self._run(key, requests)
+
+    def _run(self, key, requests):
+        items = [item for _, request_items, _ in requests for item in request_items]
+        try:
+            results = self.run_batch(key, items)
+        except Exception as e:
+            for _, _, future in requests:
+                future.set_exception(e)
+            return
+        with self._lock:
+            self.requests += len(requests)
+            self.items += len(items)
+            self.batches += 1
+        start = 0
+        for _, request_items, future in requests:
+            future.set_result(results[start:start + len(request_items)])
+            start += len(request_items)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "items": self.items,
+                "batches": self.batches,
+                "mean_batch_items": round(self.items / self.batches, 2) if self.batches else 0.0
+            }
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+def _embed_batch(key, texts):
+    return list(get_model(EMBEDDING_MODEL).encode(texts, convert_to_numpy=True))
+
+def _zero_shot_batch(candidate_labels, texts):
+    results = get_model(ZERO_SHOT_MODEL)(texts, list(candidate_labels), batch_size=16)
+    return [results] if isinstance(results, dict) else results
+
+def _nli_batch(key, texts):
+    return get_model(NLI_MODEL)(texts)
+
+class InferenceServer:
+    """
+    Owns the zero-shot classifier, sentence embedder and NLI model for every
+    worker process on the host (one copy of the weights instead of one per
+    worker), serving them over a Unix socket. Started with
+    `python -m researcher_system.core.inference_server`; processes with the same
+    INFERENCE_SERVER_SOCKET become thin clients (see models/remote_models.py).
+
+    Each connection gets its own thread and one request at a time; all of them
+    feed the shared per-operation batchers, so sentences from concurrent
+    requests are classified or embedded together.
+
+    Requests are tuples (op, *args):
+        ("embed", texts)                  -> list of float32 vectors
+        ("zero_shot", texts, labels)      -> list of {"sequence", "labels", "scores"}
+        ("nli", texts)                    -> list of {"label", "score"}
+        ("embedding_dimension",)          -> int
+        ("stats",)                        -> batcher and registry statistics
+    Replies are ("ok", value) or ("error", message).
+    """
+
+    def __init__(self, socket_path, authkey=None, max_batch=INFERENCE_MAX_BATCH, max_wait=INFERENCE_MAX_WAIT_MS / 1000.0, auth_timeout=5.0):
+        self.socket_path = socket_path
+        self.authkey = authkey
+        self.auth_timeout = auth_timeout
+        self.batchers = {
+            "embed": DynamicBatcher("embed", _embed_batch, max_batch, max_wait),
+            "zero_shot": DynamicBatcher("zero_shot", _zero_shot_batch, max_batch, max_wait),
+            "nli": DynamicBatcher("nli", _nli_batch, max_batch, max_wait)
+        }
+        self._listener = None
+        self._closed = threading.Event()
+
+    def _handle(self, request):
+        op, args = request[0], request[1:]
+        if op == "embed":
+            return self.batchers["embed"](None, args[0])
+        if op == "zero_shot":
+            return self.batchers["zero_shot"](tuple(args[1]), args[0])
+        if op == "nli":
+            return self.batchers["nli"](None, args[0])
+        if op == "embedding_dimension":
+            return get_model(EMBEDDING_MODEL).get_sentence_embedding_dimension()
+        if op == "stats":
+            return {
+                "batchers": {name: b.stats() for name, b in self.batchers.items()},
+                "models": registry.memory_report()["models"]
+            }
+        raise ValueError(f"Unknown inference op '{op}'")
+
+    def _authenticate(self, conn):
+        # The handshake Listener(authkey=...) would run inside accept(), here with a
+        # deadline: SO_RCVTIMEO makes a read from a silent client fail with an OSError
+        with socket.fromfd(conn.fileno(), socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            seconds = int(self.auth_timeout)
+            timeout = struct.pack("ll", seconds, int((self.auth_timeout - seconds) * 1e6))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, timeout)
+            deliver_challenge(conn, self.authkey)
+            answer_challenge(conn, self.authkey)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("ll", 0, 0))
+
+    def _serve_connection(self, conn):
+        with conn:
+            if self.authkey is not None:
+                try:
+                    self._authenticate(conn)
+                except (AuthenticationError, EOFError, OSError) as e:
+                    logging.warning(f"Rejected inference client: {e}")
+                    return
+            while not self._closed.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    reply = ("ok", self._handle(request))
+                except Exception as e:
+                    logging.error(f"Inference request {request[0]!r} failed: {e}")
+                    reply = ("error", f"{type(e).__name__}: {e}")
+                try:
+                    conn.send(reply)
+                except OSError:
+                    return
+
+    def serve_forever(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        # Socket file readable/writable by this user only
+        old_umask = os.umask(0o177)
+        try:
+            # No authkey here: accept() would run the handshake on this thread and one
+            # silent client would stall every other; _serve_connection authenticates instead
+            self._listener = Listener(self.socket_path, family="AF_UNIX")
+        finally:
+            os.umask(old_umask)
+        logging.info(f"Inference server listening on {self.socket_path}")
+        try:
+            while not self._closed.is_set():
+                try:
+                    conn = self._listener.accept()
+                except OSError:
+                    if self._closed.is_set():
+                        break
+                    raise
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._listener is not None:
+            self._listener.close()
+        for batcher in self.batchers.values():
+            batcher.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the classifier, embedder and NLI model to local API workers over a Unix socket.")
+    parser.add_argument("--socket", default=INFERENCE_SERVER_SOCKET or "/tmp/researcher-inference.sock")
+    parser.add_argument("--max-batch", type=int, default=INFERENCE_MAX_BATCH, help="Sentences per merged batch")
+    parser.add_argument("--max-wait-ms", type=float, default=INFERENCE_MAX_WAIT_MS, help="Longest a request waits for its batch to fill")
+    parser.add_argument("--warmup", action="store_true", help="Load all served models before accepting requests")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    # The server owns the real models, even when INFERENCE_SERVER_SOCKET made the registry remote
+    for name, loader in SERVED_MODELS.items():
+        registry.register(name, loader)
+    if args.warmup:
+        registry.warm_up(list(SERVED_MODELS))
+
+    authkey = INFERENCE_SERVER_AUTHKEY.encode() if INFERENCE_SERVER_AUTHKEY else None
+    server = InferenceServer(args.socket, authkey, args.max_batch, args.max_wait_ms / 1000.0)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from researcher_system.core.report_job import STAGES, analyze_upload
+
+# Set in each worker process by _init_worker; stage updates travel back to the parent over it
+_progress_queue = None
+
+class JobQueueFull(Exception):
+    """Too many jobs are already waiting for a worker."""
+
+# How often a job that never started is put back on a fresh pool after the pool it waited on broke
+MAX_REQUEUES = 3
+
+def _init_worker(progress_queue, warmup_models):
+    global _progress_queue
+    _progress_queue = progress_queue
+    if warmup_models:
+        from researcher_system.core.model_registry import registry
+        names = registry.memory_report()["registered"] if warmup_models == "all" else [n.strip() for n in warmup_models.split(",") if n.strip()]
+        registry.warm_up(names)
+
+def _loaded_models():
+    from researcher_system.core.model_registry import registry
+    return {name: registry.is_loaded(name) for name in registry.memory_report()["registered"]}
+
+def _run_job(job_id, source, doi, upload_dir):
+    # Runs in a worker process; models stay loaded in the registry between jobs
+    def progress(stage):
+        _progress_queue.put((job_id, stage, time.time()))
+    try:
+        return analyze_upload(source, doi, job_id, upload_dir, progress=progress)
+    finally:
+        source.close()
+
+class JobManager:
+    """
+    Runs report jobs on a pool of worker processes and tracks their state.
+
+    Jobs are deduplicated by cache key: a finished result in the ResultCache
+    completes a new job immediately, and a submission whose key is already
+    queued or running returns the existing job. Workers report each stage
+    as it starts over a multiprocessing queue that a parent thread drains.
+    """
+
+    def __init__(self, workers=1, upload_dir="uploads", result_cache=None, retention_seconds=3600, warmup_models="", max_queued=16):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.upload_dir = upload_dir
+        self.result_cache = result_cache
+        self.retention_seconds = retention_seconds
+        self.warmup_models = warmup_models
+        self._ctx = multiprocessing.get_context("spawn")
+        self._progress = self._ctx.Queue()
+        self._jobs = {}
+        self._by_key = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+        threading.Thread(target=self._drain_progress, daemon=True, name="job-progress").start()
+
+    def _get_executor(self):
+        # Caller holds the lock
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self._ctx,
+                initializer=_init_worker, initargs=(self._progress, self.warmup_models)
+            )
+        return self._executor
+
+    def _discard_executor(self, executor):
+        # Caller holds the lock. Only the current pool is replaced: callbacks from an
+        # older broken pool can still arrive after a new one was started.
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def _start(self, job):
+        # Caller holds the lock; returns the executor the job went to and its future
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_run_job, job["id"], job["source"], job["doi"], self.upload_dir)
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            executor = self._get_executor()
+            future = executor.submit(_run_job, job["id"], job["source"], job["doi"], self.upload_dir)
+        return executor, future
+
+    def _watch(self, job_id, executor, future):
+        # Called without the lock: a future that is already done runs the callback right here
+        future.add_done_callback(lambda f: self._on_done(job_id, executor, f))
+
+    def _new_job(self, filename, doi, key):
+        now = time.time()
+        return {
+            "id": uuid.uuid4().hex,
+            "status": "queued",
+            "filename": filename,
+            "doi": doi,
+            "key": key,
+            "created": now,
+            "started": None,
+            "finished": None,
+            "stage": None,
+            "stages": {name: {"status": "pending", "started": None} for name in STAGES},
+            "error": None,
+            "result": None,
+            "source": None,
+            "requeues": 0,
+            "done": threading.Event()
+        }
+
+    def submit(self, source, doi, key=None):
+        """
+        Queues an analysis of source (a DocumentSource; its bytes are handed to the
+        worker process, nothing is written to disk) and returns the job id.
+        Raises JobQueueFull when max_queued jobs are already waiting for a worker.
+        """
+        self._prune()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job manager is shut down")
+            if key is not None and key in self._by_key:
+                return self._by_key[key]
+
+            job = self._new_job(source.name, doi, key)
+            self._jobs[job["id"]] = job
+            cached = self.result_cache.get(key) if (self.result_cache is not None and key is not None) else None
+            if cached is not None:
+                self._finish(job, result=cached)
+                return job["id"]
+
+            waiting = sum(1 for j in self._jobs.values() if j["status"] == "queued" and j["source"] is not None)
+            if waiting >= self.max_queued:
+                del self._jobs[job["id"]]
+                raise JobQueueFull(f"Job queue is full ({waiting} waiting)")
+            if key is not None:
+                self._by_key[key] = job["id"]
+            # Kept until the job finishes so it can be requeued if its pool breaks before it starts
+            job["source"] = source
+            executor, future = self._start(job)
+        self._watch(job["id"], executor, future)
+        return job["id"]
+
+    def _on_done(self, job_id, executor, future):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            try:
+                result, report_path = future.result()
+            except BrokenProcessPool as e:
+                # A worker died (e.g. out of memory): the pool fails every job it still held.
+                # Jobs that never started go to a fresh pool; the ones that were running fail.
+                self._discard_executor(executor)
+                if job["status"] == "queued" and job["requeues"] < MAX_REQUEUES and not self._closed:
+                    job["requeues"] += 1
+                    requeued = self._start(job)
+                else:
+                    logging.error(f"Worker process died while running job {job_id}: {e}")
+                    self._finish(job, error="Worker process crashed.")
+                    return
+            except Exception as e:
+                self._finish(job, error=str(e))
+                return
+            else:
+                if self.result_cache is not None and job["key"] is not None:
+                    self.result_cache.put(job["key"], result, report_path)
+                self._finish(job, result=result)
+                return
+        self._watch(job_id, *requeued)
+
+    def _finish(self, job, result=None, error=None):
+        # Caller holds the lock
+        if job["key"] is not None and self._by_key.get(job["key"]) == job["id"]:
+            del self._by_key[job["key"]]
+        job["source"] = None
+        job["finished"] = time.time()
+        job["status"] = "error" if error else "done"
+        job["error"] = error
+        job["result"] = result
+        if not error:
+            for stage in job["stages"].values():
+                stage["status"] = "done"
+        elif job["stage"]:
+            job["stages"][job["stage"]]["status"] = "error"
+        job["done"].set()
+
+    def _drain_progress(self):
+        while True:
+            try:
+                job_id, stage, at = self._progress.get()
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] in ("done", "error") or stage not in job["stages"]:
+                    continue
+                if job["status"] == "queued":
+                    job["status"] = "running"
+                    job["started"] = at
+                if job["stage"]:
+                    job["stages"][job["stage"]]["status"] = "done"
+                job["stage"] = stage
+                job["stages"][stage].update(status="running", started=at)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            for job_id in [j for j, job in self._jobs.items() if job["finished"] and job["finished"] < cutoff]:
+                del self._jobs[job_id]
+
+    def status(self, job_id):
+        """
+        Public view of a job (without its result), or None if unknown.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            done = sum(1 for s in job["stages"].values() if s["status"] == "done")
+            return {
+                "id": job["id"],
+                "status": job["status"],
+                "filename": job["filename"],
+                "doi": job["doi"],
+                "created": job["created"],
+                "started": job["started"],
+                "finished": job["finished"],
+                "stage": job["stage"],
+                "progress": done / len(job["stages"]),
+                "stages": {name: dict(s) for name, s in job["stages"].items()},
+                "error": job["error"]
+            }
+
+    def result(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else (job["status"], job["result"], job["error"])
+
+    def wait(self, job_id, timeout=None):
+        """
+        Blocks until the job finishes; returns (status, result, error).
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job["done"].wait(timeout)
+        return self.result(job_id)
+
+    def warm_up(self):
+        """
+        Starts every worker process now instead of on the first job (each warms the
+        configured models in its initializer). Returns {model name: loaded in all workers}.
+        """
+        with self._lock:
+            executor = self._get_executor()
+            futures = [executor.submit(_loaded_models) for _ in range(self.workers)]
+        reports = [f.result() for f in futures]
+        return {name: all(r.get(name) for r in reports) for name in reports[0]} if reports else {}
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,243 @@
+import logging
+import threading
+import time
+
+from researcher_system.core.config import MODEL_MEMORY_BUDGET_MB, INFERENCE_BACKEND, ONNX_MODEL_DIR, ZERO_SHOT_EXECUTOR, INFERENCE_SERVER_SOCKET
+
+EMBEDDING_MODEL="sentence-transformers/all-MiniLM-L6-v2"
+ZERO_SHOT_MODEL="facebook/bart-large-mnli"
+NLI_MODEL="roberta-large-mnli"
+SPACY_MODEL="en_core_web_sm"
+SPACY_SENTER_MODEL="en_core_web_sm:senter"
+SPACY_SENTENCIZER="spacy:sentencizer"
+
+def _device_index():
+    from researcher_system.core.gpu_manager import get_device
+    return 0 if get_device()=="cuda" else -1
+
+def load_sentence_transformer(name):
+    if INFERENCE_BACKEND == "onnx":
+        from researcher_system.models.onnx_backend import load_onnx_sentence_embedder
+        return load_onnx_sentence_embedder(name, ONNX_MODEL_DIR)
+    from sentence_transformers import SentenceTransformer
+    from researcher_system.core.gpu_manager import get_device
+    return SentenceTransformer(name, device=get_device())
+
+def load_zero_shot(name):
+    if INFERENCE_BACKEND == "onnx":
+        from researcher_system.models.onnx_backend import load_onnx_zero_shot
+        return load_onnx_zero_shot(name, ONNX_MODEL_DIR)
+    if ZERO_SHOT_EXECUTOR == "nli":
+        from researcher_system.models.nli_executor import TorchZeroShotClassifier
+        from researcher_system.core.gpu_manager import get_device
+        return TorchZeroShotClassifier(name, device=get_device())
+    from transformers import pipeline
+    return pipeline("zero-shot-classification", model=name, device=_device_index())
+
+def load_text_classification(name):
+    from transformers import pipeline
+    return pipeline("text-classification", model=name, device=_device_index())
+
+def load_spacy(name):
+    import spacy
+    return spacy.load(name)
+
+def load_spacy_senter(name):
+    # Statistical sentence boundaries only: no tagger, parser, NER or lemmatizer
+    import spacy
+    nlp = spacy.load(SPACY_MODEL, exclude=["tagger", "parser", "ner", "lemmatizer", "attribute_ruler"])
+    nlp.enable_pipe("senter")
+    return nlp
+
+def load_spacy_sentencizer(name):
+    import spacy
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+class ModelRegistry:
+    """
+    Process-wide registry handing out shared, lazily loaded model instances by name.
+
+    Each model is loaded at most once (per-name lock), tracked with its resident
+    weight size and last use, and the least recently used models are evicted when
+    the total exceeds the memory budget. Callers should fetch the model from the
+    registry on each use rather than holding on to it, so evicted models can be freed.
+    """
+
+    def __init__(self, memory_budget_mb=0):
+        self.memory_budget_bytes = int(memory_budget_mb) * 1024 * 1024
+        self._loaders = {}
+        self._models = {}
+        self._info = {}
+        self._name_locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader):
+        """
+        Registers loader(name) -> model under name. Re-registering replaces the loader.
+        """
+        with self._lock:
+            self._loaders[name] = loader
+            self._name_locks.setdefault(name, threading.Lock())
+
+    def __contains__(self, name):
+        with self._lock:
+            return name in self._loaders
+
+    def get(self, name):
+        """
+        Returns the shared instance for name, loading it on first use.
+        """
+        with self._lock:
+            model = self._models.get(name)
+            if model is not None:
+                self._info[name]["last_used"] = time.time()
+                self._info[name]["uses"] += 1
+                return model
+            if name not in self._loaders:
+                raise KeyError(f"No model registered under '{name}'")
+            name_lock = self._name_locks[name]
+            loader = self._loaders[name]
+
+        # Load outside the registry lock so other models stay available meanwhile
+        with name_lock:
+            with self._lock:
+                model = self._models.get(name)
+                if model is not None:
+                    # Loaded by another thread while we waited for name_lock
+                    self._info[name]["last_used"] = time.time()
+                    self._info[name]["uses"] += 1
+                    return model
+
+            start = time.time()
+            model = loader(name)
+            load_seconds = time.time() - start
+            memory_bytes = estimate_memory_bytes(model)
+            logging.info(f"Loaded model {name} in {load_seconds:.1f}s ({memory_bytes / 1e6:.0f} MB)")
+
+            with self._lock:
+                self._models[name] = model
+                self._info[name] = {
+                    "memory_bytes": memory_bytes,
+                    "load_seconds": round(load_seconds, 2),
+                    "loaded_at": time.time(),
+                    "last_used": time.time(),
+                    "uses": 1
+                }
+                self._evict_over_budget(keep=name)
+        return model
+
+    def is_loaded(self, name):
+        with self._lock:
+            return name in self._models
+
+    def release(self, name):
+        """
+        Drops the registry's reference to a loaded model.
+        """
+        with self._lock:
+            self._models.pop(name, None)
+            self._info.pop(name, None)
+
+    def evict_idle(self, max_idle_seconds):
+        """
+        Releases every model unused for longer than max_idle_seconds. Returns the evicted names.
+        """
+        cutoff = time.time() - max_idle_seconds
+        with self._lock:
+            idle = [name for name, info in self._info.items() if info["last_used"] < cutoff]
+            for name in idle:
+                self._models.pop(name, None)
+                self._info.pop(name, None)
+        for name in idle:
+            logging.info(f"Evicted idle model {name}")
+        return idle
+
+    def _evict_over_budget(self, keep):
+        # Caller holds the lock
+        if not self.memory_budget_bytes:
+            return
+        total = sum(info["memory_bytes"] for info in self._info.values())
+        by_age = sorted((info["last_used"], name) for name, info in self._info.items() if name != keep)
+        for _, name in by_age:
+            if total <= self.memory_budget_bytes:
+                break
+            total -= self._info[name]["memory_bytes"]
+            self._models.pop(name, None)
+            self._info.pop(name, None)
+            logging.info(f"Evicted model {name} to stay within the {self.memory_budget_bytes / 1e6:.0f} MB budget")
+
+    def warm_up(self, names):
+        """
+        Eagerly loads the given models (e.g. at server startup). Failures are
+        logged and reported instead of raised so one bad model does not block the rest.
+
+        Returns:
+            dict: { name: "loaded" | "error: ..." }
+        """
+        status = {}
+        for name in names:
+            try:
+                self.get(name)
+                status[name] = "loaded"
+            except Exception as e:
+                logging.error(f"Warm-up of {name} failed: {e}")
+                status[name] = f"error: {e}"
+        return status
+
+    def memory_report(self):
+        """
+        Returns { name: {memory_bytes, load_seconds, loaded_at, last_used, uses} } for loaded models.
+        """
+        with self._lock:
+            report = {name: dict(info) for name, info in self._info.items()}
+        return {
+            "models": report,
+            "total_bytes": sum(info["memory_bytes"] for info in report.values()),
+            "budget_bytes": self.memory_budget_bytes,
+            "registered": sorted(self._loaders)
+        }
+
+def estimate_memory_bytes(model):
+    """
+    Resident weight size of a torch-backed model (parameters + buffers).
+    Works for nn.Modules, HF pipelines and objects wrapping either; ONNX-backed
+    models report their own memory_bytes.
+    """
+    if getattr(model, "memory_bytes", None) is not None:
+        return model.memory_bytes
+    module = model
+    for _ in range(3):
+        if hasattr(module, "parameters"):
+            break
+        module = getattr(module, "model", None) or getattr(module, "classifier", None)
+    if not hasattr(module, "parameters"):
+        return 0
+    try:
+        tensors = list(module.parameters()) + list(module.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except Exception:
+        return 0
+
+# Models the shared inference server can own on behalf of every worker process
+SERVED_MODELS = {
+    EMBEDDING_MODEL: load_sentence_transformer,
+    ZERO_SHOT_MODEL: load_zero_shot,
+    NLI_MODEL: load_text_classification
+}
+
+registry = ModelRegistry(memory_budget_mb=MODEL_MEMORY_BUDGET_MB)
+for _name, _loader in SERVED_MODELS.items():
+    registry.register(_name, _loader)
+registry.register(SPACY_MODEL, load_spacy)
+registry.register(SPACY_SENTER_MODEL, load_spacy_senter)
+registry.register(SPACY_SENTENCIZER, load_spacy_sentencizer)
+
+if INFERENCE_SERVER_SOCKET:
+    # Thin client: the served models resolve to proxies for the inference server process
+    from researcher_system.models.remote_models import register_remote_models
+    register_remote_models(registry, INFERENCE_SERVER_SOCKET)
+
+def get_model(name):
+    return registry.get(name)
@@ -1,11 +1,22 @@
-import pathway as pw
-from researcher_system.nlp.claim_segmenter import split_sentences
+from researcher_system.nlp.parsed_document import as_document
+from researcher_system.analysis.heuristic_rules import claim_filter_catalog
 from researcher_system.models.llm_classifier import get_detailed_classification
 
-class SentenceSchema(pw.Schema):
-    sentence: str
-    label: str
-    score: float
+_sentence_schema = None
+
+def get_sentence_schema():
+    # pathway is imported on first use so importing the pipeline stays cheap
+    global _sentence_schema
+    if _sentence_schema is None:
+        import pathway as pw
+
+        class SentenceSchema(pw.Schema):
+            sentence: str
+            label: str
+            score: float
+
+        _sentence_schema = SentenceSchema
+    return _sentence_schema
 
 def _is_claim_label(label: str) -> bool:
     return label in ["solid_claim", "vague_claim"]
@@ -13,30 +24,24 @@ def _is_claim_label(label: str) -> bool:
 def is_claim_like(sentence: str) -> bool:
     """Heuristic to reduce LLM load by filtering out noise."""
     lower_s = sentence.lower().strip()
+    # Keyword lists live in heuristic_rules.CLAIM_FILTER_RULES; one scan finds which groups occur
+    found = claim_filter_catalog.categories_in(lower_s)
     
     # Negative filters: common research paper filler/structure
-    skip_keywords = ["figure", "table", "section", "chapter", "below", "following", "above", "et al.", "i.e.", "e.g."]
-    if any(k in lower_s for k in skip_keywords) and len(lower_s) < 100:
+    if "skip" in found and len(lower_s) < 100:
         return False
         
-    # Positive filters: Indicators of a research claim
-    claim_indicators = ["propose", "method", "achieve", "result", "finding", "conclude", "demonstrate", "evidence", "significant", "superior", "improve"]
-    if any(k in lower_s for k in claim_indicators):
-        return True
-        
-    # Basic structural check: Must have "we" or "our" or be a descriptive sentence
-    if "we " in lower_s or "our " in lower_s:
-        return True
-        
-    return False
+    # Positive filters: Indicators of a research claim, or "we"/"our" as subject
+    return "indicator" in found or "subject" in found
 
 def run_pathway_analysis(text):
     """
-    Uses Pathway to process the provided text and extract classified claims.
+    Uses Pathway to process the provided text (raw string or ParsedDocument) and extract classified claims.
     """
+    import pathway as pw
     from researcher_system.models.llm_classifier import get_classifier
     
-    sentences = [s for s in split_sentences(text) if len(s) > 20]
+    sentences = [s.text for s in as_document(text).sentences if len(s.text) > 20]
     print(f"[DEBUG] Total sentences extracted: {len(sentences)}")
     
     # Heuristic filter to reduce LLM calls
@@ -56,7 +61,7 @@ def run_pathway_analysis(text):
         data.append((s, c['label'], c['score']))
 
     # Pathway table creation with pre-classified data
-    t = pw.debug.table_from_rows(SentenceSchema, data)
+    t = pw.debug.table_from_rows(get_sentence_schema(), data)
     
     # Filter for solid or vague claims in Pathway
     t = t.filter(pw.apply(_is_claim_label, t.label))
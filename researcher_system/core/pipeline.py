@@ -4,9 +4,13 @@ from researcher_system.nlp.pdf_parser import extract_text
 from researcher_system.nlp.docx_parser import extract_text_from_docx
 from researcher_system.analysis.word_forensics import analyze_word_forensics
 from researcher_system.core.pathway_pipeline import run_pathway_analysis
-from researcher_system.nlp.bib_parser import parse_bibliography
+from researcher_system.core.streaming_pipeline import run_streaming_extraction
+from researcher_system.core.config import STREAMING_PIPELINE
+from researcher_system.nlp.document_source import as_source
+from researcher_system.nlp.bib_parser import Bibliography, parse_references
 from researcher_system.nlp.citation_extractor import extract_citations, extract_citation_contexts
-from researcher_system.analysis.semantic_relevance import relevance
+from researcher_system.nlp.parsed_document import ParsedDocument
+from researcher_system.analysis.semantic_relevance import relevance_matrix
 from researcher_system.models.vague_detector import is_vague
 from researcher_system.analysis.self_citation_analysis import compute_self_citations, fallback_self_citation_ratio
 from researcher_system.analysis.integrity_scoring import score
@@ -16,7 +20,7 @@ from researcher_system.analysis.dataset_analyzer import extract_datasets_from_te
 from researcher_system.analysis.rigor_analyzer import analyze_rigor
 from researcher_system.analysis.novelty_analyzer import analyze_novelty
 from researcher_system.analysis.review_generator import generate_review
-from researcher_system.models.llm_classifier import get_decay_analysis
+from researcher_system.models.llm_classifier import get_decay_analysis_batch
 
 def extract_title_heuristic(text):
     lines = text.split('\n')
@@ -33,13 +37,23 @@ def fuzzy_match_titles(t1, t2):
     t2_clean = re.sub(r'[^a-zA-Z0-9]', '', t2.lower())
     return t1_clean in t2_clean or t2_clean in t1_clean
 
-def run_pipeline(path=None, doi=None, filename=None):
+def _stage(progress, name):
+    if progress is not None:
+        progress(name)
+
+def run_pipeline(path=None, doi=None, filename=None, streaming=None, progress=None):
+    # path is a file path or a DocumentSource (e.g. an upload held in memory)
     analysis_mode = "UNKNOWN"
     paper_metadata = None
     body_text = ""
     ref_text = ""
     bib_map = {}
+    bibliography = Bibliography()
     citation_mentions = []
+    document = ParsedDocument("")
+    streamed_claims = None
+    if streaming is None:
+        streaming = STREAMING_PIPELINE
     
     # CASE 3: DOI ONLY
     if doi and not path:
@@ -48,29 +62,43 @@ def run_pipeline(path=None, doi=None, filename=None):
         
     # CASE 1 & 2: DOCUMENT PROVIDED
     elif path:
-        if path.lower().endswith('.docx'):
-            parsed_content = extract_text_from_docx(path)
-            word_forensics = analyze_word_forensics(path)
+        _stage(progress, "parsing")
+        # One source (path or in-memory upload) whose opened document every parser shares
+        source = as_source(path)
+        # User requested: Use the uploaded filename as the intended paper title (stripping extension)
+        filename_title = os.path.splitext(filename)[0].replace("_", " ") if filename else None
+        # Resolve the DOI first: on a title mismatch the parsed body is discarded, so claims are
+        # only classified while parsing when the title is known to match (or there is no DOI match)
+        doi_metadata = fetch_paper_by_doi(doi) if doi else None
+        if doi_metadata and not fuzzy_match_titles(filename_title, doi_metadata.get("title", "")):
+            streaming = False
+        if source.kind == "docx":
+            parsed_content = extract_text_from_docx(source)
+            word_forensics = analyze_word_forensics(source)
+        elif streaming:
+            # Claims are classified page by page while the rest of the PDF is still being parsed
+            parsed_content, streamed_claims = run_streaming_extraction(source)
+            word_forensics = None
         else:
-            parsed_content = extract_text(path)
+            parsed_content = extract_text(source)
             word_forensics = None
             
         body_text = parsed_content["body"]
         ref_text = parsed_content["references"]
-        bib_map = parse_bibliography(ref_text if ref_text else body_text)
-        citation_mentions = extract_citations(body_text)
+        # Single indexed view of the body shared by every analysis stage below
+        document = ParsedDocument(body_text, parsed_content.get("page_offsets"), ref_text)
+        # One structured pass over the reference list; bib_map keeps the {id: text} view for the report
+        bibliography = parse_references(ref_text if ref_text else body_text)
+        bib_map = bibliography.as_map()
+        citation_mentions = extract_citations(document)
         
-        # User requested: Use the uploaded filename as the intended paper title (stripping extension)
-        if filename:
-            pdf_title = os.path.splitext(filename)[0].replace("_", " ")
-        else:
-            pdf_title = extract_title_heuristic(body_text)
+        pdf_title = filename_title or extract_title_heuristic(body_text)
         
         if doi:
             # CASE 1: BOTH PROVIDED
             # Trust the user's DOI if it resolves. Title heuristic is unreliable
             # (published PDFs often start with journal name/headers, not the title).
-            temp_metadata = fetch_paper_by_doi(doi)
+            temp_metadata = doi_metadata
             if temp_metadata:
                 if fuzzy_match_titles(pdf_title, temp_metadata.get("title", "")):
                     analysis_mode = "MATCHED_HYBRID"
@@ -79,6 +107,8 @@ def run_pipeline(path=None, doi=None, filename=None):
                     # Title mismatch: user requested to prioritize DOI and ignore PDF parsing. 
                     body_text = ""
                     ref_text = ""
+                    document = ParsedDocument("")
+                    bibliography = Bibliography()
                     bib_map = {}
                     citation_mentions = []
                 paper_metadata = temp_metadata
@@ -110,47 +140,57 @@ def run_pipeline(path=None, doi=None, filename=None):
     system_review = {"strengths": [], "weaknesses": [], "red_flags": []}
     word_forensics_data = word_forensics if 'word_forensics' in locals() else None
 
+    _stage(progress, "claims")
     # 3. Run Pathway/LLM analysis on the BODY only (If PDF is available and titles match)
     raw_claims = []
     if analysis_mode in ["MATCHED_HYBRID", "PDF_ONLY"]:
-        raw_claims = run_pathway_analysis(body_text)
+        raw_claims = streamed_claims if streamed_claims is not None else run_pathway_analysis(document)
     
     solid_claims = []
     vague_claims = []
 
     # Map each mention to its bibliography entry
     for cit in citation_mentions:
-        full_text = bib_map.get(cit, "Full citation text not found in bibliography.")
+        entries = bibliography.resolve(cit)
+        full_text = " ".join(e.text for e in entries) if entries else "Full citation text not found in bibliography."
         detailed_citations.append({
             "id": cit,
             "full_text": full_text
         })
 
+    _stage(progress, "verification")
+    # Keep claims above the noise threshold, with the mentions that resolve in the bibliography
+    kept_claims = []
     for c in raw_claims:
+        # Stricter thresholds for noise reduction
+        if c['score'] < 0.4:
+            continue
+        kept_claims.append((c, [entry.key for entry in bibliography.cited_in(c['sentence'])]))
+
+    # One batched encode per side: every cited claim against every cited bibliography entry
+    cited_sentences = list(dict.fromkeys(c['sentence'] for c, ids in kept_claims if ids))
+    cited_refs = list(dict.fromkeys(cit_id for _, ids in kept_claims for cit_id in ids))
+    rel_matrix = relevance_matrix(cited_sentences, [bib_map[cit_id] for cit_id in cited_refs])
+    sentence_row = {s: i for i, s in enumerate(cited_sentences)}
+    ref_col = {cit_id: j for j, cit_id in enumerate(cited_refs)}
+
+    for c, cited_ids in kept_claims:
         sentence = c['sentence']
         label = c['label']
         score_val = c['score']
-        
-        # Stricter thresholds for noise reduction
-        if score_val < 0.4:
-            continue
             
         # RAG-base Verification logic
         verified = True
         verification_note = "No specific citation linked in sentence."
         
-        mentions = re.findall(r"\[(\d+)\]", sentence)
-        if mentions:
-            for m in mentions:
-                cit_id = f"[{m}]"
-                if cit_id in bib_map:
-                    rel_val = relevance(sentence, bib_map[cit_id])
-                    if rel_val < 0.3:
-                        verified = False
-                        verification_note = f"Possible Misalignment with {cit_id} (Relevance: {rel_val:.2f})"
-                        break
-                    else:
-                        verification_note = f"Verified with {cit_id} (Relevance: {rel_val:.2f})"
+        for cit_id in cited_ids:
+            rel_val = rel_matrix[sentence_row[sentence]][ref_col[cit_id]]
+            if rel_val < 0.3:
+                verified = False
+                verification_note = f"Possible Misalignment with {cit_id} (Relevance: {rel_val:.2f})"
+                break
+            else:
+                verification_note = f"Verified with {cit_id} (Relevance: {rel_val:.2f})"
 
         claim_data = {
             "text": sentence,
@@ -158,6 +198,10 @@ def run_pipeline(path=None, doi=None, filename=None):
             "verified": verified,
             "verification_note": verification_note
         }
+        # Page hint so the report highlighter only searches the pages the claim sits on
+        pages = document.pages_of(sentence)
+        if pages is not None:
+            claim_data["pages"] = pages
 
         # Final classification refinement
         # If it has vague words, it's a vague claim regardless of LLM label peak
@@ -173,23 +217,16 @@ def run_pipeline(path=None, doi=None, filename=None):
     # Calculate overall metrics
     all_rel_scores = []
     if citation_mentions and solid_claims:
-        for sc in solid_claims:
-             all_rel_scores.append(relevance(sc['text'], citation_mentions[0]))
+        solid_rel = relevance_matrix([sc['text'] for sc in solid_claims], [citation_mentions[0]])
+        all_rel_scores = [row[0] for row in solid_rel]
     
     avg_rel = sum(all_rel_scores) / len(all_rel_scores) if all_rel_scores else 0
-    # 1. Extract years from bibliography
-    bib_years = {}
-    for ref_id, text in bib_map.items():
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
-        if year_match:
-            bib_years[ref_id] = int(year_match.group(0))
-
+    # 1. Publication years were already extracted when the bibliography was parsed
     current_year = 2026
     
-    def check_freshness(claim_text):
-        decay_type, reason, moving_vars, stress_test, consensus = get_decay_analysis(claim_text)
-        mentions = extract_citations(claim_text)
-        cited_years = [bib_years[m] for m in mentions if m in bib_years]
+    def check_freshness(claim_text, decay_analysis):
+        decay_type, reason, moving_vars, stress_test, consensus = decay_analysis
+        cited_years = [entry.year for entry in bibliography.cited_in(claim_text) if entry.year]
         
         # Determine threshold based on architecture (half-lives)
         threshold_map = {
@@ -228,27 +265,35 @@ def run_pipeline(path=None, doi=None, filename=None):
             "half_life": half_life
         }
 
+    _stage(progress, "freshness")
+    # Decay analysis for every solid and vague claim in one batched pass
+    decay_analyses = get_decay_analysis_batch([c['text'] for c in solid_claims + vague_claims])
+    solid_decay = decay_analyses[:len(solid_claims)]
+    vague_decay = decay_analyses[len(solid_claims):]
+
     # Process Solid Claims
     refined_solid = []
-    for sc in solid_claims:
-        fresh_data = check_freshness(sc['text'])
+    for sc, decay in zip(solid_claims, solid_decay):
+        fresh_data = check_freshness(sc['text'], decay)
         sc.update(fresh_data)
         refined_solid.append(sc)
 
     # Process Vague Claims
     refined_vague = []
-    for vc in vague_claims:
-        fresh_data = check_freshness(vc['text'])
+    for vc, decay in zip(vague_claims, vague_decay):
+        fresh_data = check_freshness(vc['text'], decay)
         vc.update(fresh_data)
         refined_vague.append(vc)
 
     # Map each mention to its bibliography entry for the UI list
     display_citations = []
     for cit in citation_mentions:
-        full = bib_map.get(cit, cit)
+        entries = bibliography.resolve(cit)
+        full = " ".join(e.text for e in entries) if entries else cit
         if full not in display_citations:
             display_citations.append(full)
 
+    _stage(progress, "citation_metrics")
     # --- NEW: Advanced Metrics Integration ---
     # 1. OpenAlex & Self-Citations
     
@@ -262,7 +307,7 @@ def run_pipeline(path=None, doi=None, filename=None):
         
         # 2. False Citation Detection (Only if we have matched PDF text to compare)
         if analysis_mode in ["MATCHED_HYBRID"]:
-            citation_contexts = extract_citation_contexts(body_text)
+            citation_contexts = extract_citation_contexts(document)
             cited_abstracts_map = fetch_abstracts_for_works(referenced_work_ids)
             
             mapped_abstracts = {}
@@ -274,18 +319,19 @@ def run_pipeline(path=None, doi=None, filename=None):
             false_citations = detect_false_citations(citation_contexts, mapped_abstracts)
     elif analysis_mode == "PDF_ONLY":
         # PDF_ONLY Case Heuristics
-        self_ratio, self_count = fallback_self_citation_ratio(bib_map, body_text)
+        self_ratio, self_count = fallback_self_citation_ratio(bibliography, document)
         self_cit_data = {"self_citation_count": self_count, "total_references": len(citation_mentions)}
         
         # Heuristic False Citation: Correlate claim immediately against reference string
         if citation_mentions:
-            citation_contexts = extract_citation_contexts(body_text)
+            citation_contexts = extract_citation_contexts(document)
             # Map citation to raw bibliography text instead of abstract
-            false_citations = detect_false_citations(citation_contexts, bib_map)
+            false_citations = detect_false_citations(citation_contexts, bibliography.map_markers(citation_contexts))
 
+    _stage(progress, "datasets")
     # 3. Dataset Outdated Analysis (Requires PDF Text)
     if analysis_mode in ["MATCHED_HYBRID", "PDF_ONLY"]:
-        dataset_names = extract_datasets_from_text(body_text)
+        dataset_names = extract_datasets_from_text(document)
         dataset_analysis = analyze_dataset_usage(dataset_names, current_year=current_year)
         outdated_datasets = dataset_analysis.get('outdated_warnings', [])
     
@@ -340,16 +386,17 @@ def run_pipeline(path=None, doi=None, filename=None):
         # Clamp between 0 and 100
         integrity = max(0.0, min(100.0, integrity))
         
+    _stage(progress, "review")
     # --- NEW: Qualitative Review Generation ---
     if analysis_mode in ["MATCHED_HYBRID", "PDF_ONLY"]:
-        rigor_results = analyze_rigor(body_text)
-        novelty_results = analyze_novelty(body_text)
+        rigor_results = analyze_rigor(document)
+        novelty_results = analyze_novelty(document)
         
         analysis_data = {
             "rigor": rigor_results,
             "novelty": novelty_results
         }
-        system_review = generate_review(analysis_data, integrity_breakdown, body_text)
+        system_review = generate_review(analysis_data, integrity_breakdown, document)
     else:
         system_review = {
             "strengths": [{"text": "Paper identified via official DOI metadata.", "source": "Metadata Integrator"}],
@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+
+import pymupdf
+
+from researcher_system.core.pipeline import run_pipeline
+from researcher_system.nlp.document_source import as_source
+from researcher_system.utils.pdf_highlighter import highlight_text_in_pdf
+from researcher_system.utils.pdf_report_generator import generate_summary_page
+from researcher_system.utils.converter_utils import convert_docx_to_pdf
+
+# Stages an analysis job moves through, in order; the middle ones are reported by run_pipeline
+STAGES = ["convert", "parsing", "claims", "verification", "freshness", "citation_metrics",
+          "datasets", "review", "highlight", "summary", "merge"]
+
+def _stage(progress, name):
+    if progress is not None:
+        progress(name)
+
+def reap_reports(upload_dir, max_age_seconds):
+    """
+    Deletes rendered report PDFs (report_*.pdf) in upload_dir older than
+    max_age_seconds. Returns the number of files removed.
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        entries = list(os.scandir(upload_dir))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not (entry.name.startswith("report_") and entry.name.endswith(".pdf")):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    if removed:
+        logging.info(f"Removed {removed} report(s) older than {max_age_seconds:.0f}s from {upload_dir}")
+    return removed
+
+def analyze_upload(source, doi, file_id, upload_dir, progress=None):
+    """
+    Runs the pipeline on an upload (a DocumentSource or a file path) and renders
+    the report PDF into upload_dir. A PDF is opened once and that handle is used
+    for parsing, highlighting and the final merge; only DOCX input touches disk,
+    because LibreOffice converts from files.
+    progress, if given, is called with each stage name as it starts (see STAGES).
+    Returns (result, report_path).
+    """
+    source = as_source(source)
+    original_filename = source.name
+    scratch = []
+    converted = source.kind == "docx"
+
+    # 1. Processing Pathway (Conversion if needed)
+    _stage(progress, "convert")
+    if converted:
+        docx_path = source.path or source.write_to(os.path.join(upload_dir, f"temp_{file_id}_{original_filename}"))
+        if not source.path:
+            scratch.append(docx_path)
+        working_pdf_path = convert_docx_to_pdf(docx_path, upload_dir)
+        if not working_pdf_path:
+            raise Exception("Conversion to PDF failed.")
+        scratch.append(working_pdf_path)
+        working_doc = pymupdf.open(working_pdf_path)
+    else:
+        working_doc = source.pdf
+
+    try:
+        return _render_report(source, working_doc, doi, original_filename, file_id, upload_dir, progress)
+    finally:
+        if converted:
+            working_doc.close()
+        for p in scratch:
+            if os.path.exists(p):
+                try: os.remove(p)
+                except: pass
+
+def _render_report(source, working_doc, doi, original_filename, file_id, upload_dir, progress):
+    # 2. Run Pipeline
+    result = run_pipeline(source, doi=doi, filename=original_filename, progress=progress)
+
+    # 3. Comprehensive Highlighting Schema
+    # Claims carry the pages they were parsed from, so the highlighter can skip the rest
+    highlights = []
+
+    # Red: False Citations and Vague Claims (Risks)
+    accent_red = (0.93, 0.26, 0.26)
+    for fc in result.get('false_citations', []):
+        highlights.append((fc['context'], accent_red))
+    for vc in result.get('vague_claims_list', []):
+        highlights.append((vc['text'][:150], accent_red, vc.get('pages')))
+
+    # Green: Novelty & Contributions
+    accent_green = (0.06, 0.72, 0.5)
+    novelty = result.get('system_review', {}).get('novelty', {}) or {}
+    contributions = result.get('novelty', {}).get('contributions', []) if isinstance(result.get('novelty'), dict) else []
+    for c_text in contributions:
+        highlights.append((c_text[:150], accent_green))
+
+    # Blue: Rigor (Ablation, Baselines)
+    accent_blue = (0.23, 0.51, 0.96)
+    # Pull from rigor_analyzer findings if possible (we might need to store direct text matches in result)
+    # For now, we'll highlight solid claims if they aren't processed as novelty
+    for sc in result.get('solid_claims', []):
+        highlights.append((sc['text'][:150], accent_blue, sc.get('pages')))
+
+    # Purple: Datasets
+    accent_purple = (0.54, 0.36, 0.96)
+    for ds in result.get('datasets_found', []):
+        highlights.append((ds, accent_purple))
+
+    # 4. Highlight the shared document in place
+    _stage(progress, "highlight")
+    if highlights:
+        highlight_text_in_pdf(working_doc, highlights, None)
+
+    # 5. Generate Summary Page (kept in memory)
+    _stage(progress, "summary")
+    summary_doc = generate_summary_page(result)
+
+    # 6. Merge Summary + Body straight into the final report
+    _stage(progress, "merge")
+    final_filename = f"report_{file_id}_{original_filename.rsplit('.', 1)[0]}.pdf"
+    final_path = os.path.join(upload_dir, final_filename)
+
+    report = pymupdf.open()
+    try:
+        if summary_doc is not None:
+            report.insert_pdf(summary_doc)
+            summary_doc.close()
+        report.insert_pdf(working_doc)
+        report.save(final_path)
+    finally:
+        report.close()
+
+    result["highlighted_pdf_url"] = f"/uploads/{final_filename}"
+    return result, final_path
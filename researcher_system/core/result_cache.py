@@ -0,0 +1,148 @@
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from researcher_system.core.config import (
+    CLAIM_CLASSIFIER_BACKEND, INFERENCE_BACKEND, RESULT_CACHE_VERSION, SEGMENTER_BACKEND,
+    PDF_BACKEND, ZERO_SHOT_EXECUTOR, NLI_MAX_PREMISE_TOKENS, STREAMING_PIPELINE, SEGMENTER_CHUNK_CHARS
+)
+from researcher_system.core.model_registry import EMBEDDING_MODEL, NLI_MODEL, ZERO_SHOT_MODEL
+
+def pipeline_version_tag():
+    """
+    Everything besides the upload itself that changes what run_pipeline returns.
+    """
+    return "|".join([
+        RESULT_CACHE_VERSION, ZERO_SHOT_MODEL, EMBEDDING_MODEL, NLI_MODEL,
+        CLAIM_CLASSIFIER_BACKEND, INFERENCE_BACKEND, SEGMENTER_BACKEND,
+        PDF_BACKEND, ZERO_SHOT_EXECUTOR, str(NLI_MAX_PREMISE_TOKENS),
+        "streaming" if STREAMING_PIPELINE else "batch", str(SEGMENTER_CHUNK_CHARS)
+    ])
+
+def upload_key(content_hash, doi=None, filename=None, version=None):
+    """
+    Cache key for an upload. content_hash is the sha256 hexdigest of the uploaded bytes;
+    the filename takes part because run_pipeline uses it as the paper title.
+    """
+    parts = [content_hash, (doi or "").strip().lower(), filename or "", version or pipeline_version_tag()]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+class ResultCache:
+    """
+    Bounded, TTL-limited cache of analysis results with single-flight computation.
+
+    Each entry holds the run_pipeline result and the path of the rendered report
+    PDF. Evicting an entry leaves the file alone (its URL may still be held by a
+    job result); report_job.reap_reports removes reports by age, and an entry
+    whose report is gone counts as a miss. Concurrent
+    callers asking for the same key while it is being computed wait for the one
+    in-flight computation instead of starting their own.
+    """
+
+    def __init__(self, max_entries=128, ttl_seconds=24 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def _drop(self, key):
+        # Caller holds the lock
+        self._entries.pop(key)
+
+    def _lookup(self, key):
+        # Caller holds the lock
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, result, report_path = entry
+        expired = self.ttl_seconds and time.time() - created > self.ttl_seconds
+        if expired or (report_path and not os.path.exists(report_path)):
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def get(self, key):
+        """
+        Returns a copy of the cached result for key, or None.
+        """
+        with self._lock:
+            result = self._lookup(key)
+        return copy.deepcopy(result) if result is not None else None
+
+    def put(self, key, result, report_path=None):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time(), result, report_path)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns (result, cached). compute() must return (result, report_path) and runs
+        at most once per key at a time; its exceptions propagate to every waiter
+        and nothing is cached.
+        """
+        with self._lock:
+            result = self._lookup(key)
+            if result is not None:
+                self.hits += 1
+                return copy.deepcopy(result), True
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.shared += 1
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value), True
+
+        try:
+            result, report_path = compute()
+            self.put(key, result, report_path)
+            flight.value = result
+            return copy.deepcopy(result), False
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared_inflight": self.shared
+            }
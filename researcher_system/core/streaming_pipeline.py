@@ -0,0 +1,155 @@
+import logging
+import queue
+import threading
+
+from researcher_system.core.config import STREAM_MICRO_BATCH, STREAM_MAX_PENDING
+from researcher_system.core.pathway_pipeline import is_claim_like, _is_claim_label
+from researcher_system.nlp.pdf_parser import iter_pages, split_body_references, find_reference_split, join_pages
+from researcher_system.nlp.sentence_segmenter import segment
+
+_DONE = object()
+# A "sentence" carried across pages is force-flushed past this size (e.g. text without punctuation)
+_MAX_CARRY_CHARS = 20000
+
+def iter_candidate_sentences(pages, collected_pages):
+    """
+    Segments pages incrementally and yields (sentence, offset) for claim-like
+    sentences, with offsets into the joined document text (see join_pages).
+
+    The last sentence of each page may continue on the next one, so it is carried
+    over and re-segmented together with the following page. Every page text is
+    appended to collected_pages for the downstream stages.
+    """
+    carry = ""
+    carry_start = 0
+    pos = 0
+    for page_text in pages:
+        collected_pages.append(page_text)
+        if not page_text:
+            continue
+        chunk = carry + page_text + "\n"
+        chunk_start = carry_start
+        pos += len(page_text) + 1
+
+        sentences = segment(chunk)
+        if not sentences:
+            carry, carry_start = "", pos
+            continue
+        for sent in sentences[:-1]:
+            if len(sent.text) > 20 and is_claim_like(sent.text):
+                yield sent.text, chunk_start + sent.start
+        last = sentences[-1]
+        if len(chunk) - last.start > _MAX_CARRY_CHARS:
+            if len(last.text) > 20 and is_claim_like(last.text):
+                yield last.text, chunk_start + last.start
+            carry, carry_start = "", pos
+            continue
+        carry = chunk[last.start:]
+        carry_start = chunk_start + last.start
+
+    for sent in segment(carry):
+        if len(sent.text) > 20 and is_claim_like(sent.text):
+            yield sent.text, carry_start + sent.start
+
+def _put(out_queue, item, stop):
+    # Blocks while the queue is full, but gives up once the consumer has stopped reading
+    while not stop.is_set():
+        try:
+            out_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _produce(pages, collected_pages, out_queue, stop):
+    candidates = iter_candidate_sentences(pages, collected_pages)
+    try:
+        for item in candidates:
+            # Blocks once STREAM_MAX_PENDING sentences are waiting: extraction never runs far ahead of inference
+            if not _put(out_queue, item, stop):
+                return
+        _put(out_queue, _DONE, stop)
+    except Exception as e:
+        _put(out_queue, e, stop)
+    finally:
+        # Release the page iterator (and its document) from the thread that drove it
+        candidates.close()
+        if hasattr(pages, "close"):
+            pages.close()
+
+def stream_classified_claims(pages, micro_batch=STREAM_MICRO_BATCH, max_pending=STREAM_MAX_PENDING):
+    """
+    Runs page extraction/segmentation in a producer thread and classifies candidate
+    sentences in micro-batches as they arrive, so inference overlaps with parsing.
+
+    Args:
+        pages (iterable): Page texts, typically the lazy iter_pages() generator.
+
+    Returns:
+        tuple: (claims, pages) where claims is a list of
+        {"sentence", "label", "score", "offset"} (solid/vague only) and pages is
+        the list of all page texts.
+    """
+    from researcher_system.models.llm_classifier import get_classifier
+
+    collected_pages = []
+    pending = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    producer = threading.Thread(target=_produce, args=(pages, collected_pages, pending, stop), daemon=True)
+    producer.start()
+
+    claims = []
+    batch = []
+    finished = False
+    try:
+        clf = get_classifier()
+        while not finished:
+            item = pending.get()
+            if item is _DONE:
+                finished = True
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                batch.append(item)
+                # Top the batch up with whatever else is already queued
+                while len(batch) < micro_batch:
+                    try:
+                        nxt = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _DONE:
+                        finished = True
+                        break
+                    if isinstance(nxt, Exception):
+                        raise nxt
+                    batch.append(nxt)
+
+            if batch and (finished or len(batch) >= micro_batch):
+                results = clf.classify_batch([s for s, _ in batch])
+                for (sentence, offset), c in zip(batch, results):
+                    if _is_claim_label(c['label']):
+                        claims.append({"sentence": sentence, "label": c['label'], "score": c['score'], "offset": offset})
+                batch = []
+    finally:
+        # Also reached when classification fails: unblock the producer and wait for it to let go of the pages
+        stop.set()
+        producer.join()
+    logging.debug(f"Streamed {len(claims)} claims from {len(collected_pages)} pages.")
+    return claims, collected_pages
+
+def run_streaming_extraction(path):
+    """
+    Streaming counterpart of extract_text + run_pathway_analysis for a PDF.
+
+    Returns:
+        tuple: (parsed_content, raw_claims) where parsed_content follows the
+        extract_text contract and raw_claims only covers the body (sentences
+        starting before the references section).
+    """
+    claims, pages = stream_classified_claims(iter_pages(path))
+    parsed_content = split_body_references(pages)
+
+    split_idx = find_reference_split(join_pages(pages)[0])
+    if split_idx != -1:
+        claims = [c for c in claims if c["offset"] < split_idx]
+    return parsed_content, [{"sentence": c["sentence"], "label": c["label"], "score": c["score"]} for c in claims]
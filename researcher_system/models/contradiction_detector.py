@@ -1,11 +1,5 @@
-from transformers import pipeline
-from core.gpu_manager import DEVICE
-
-detector=pipeline(
-"text-classification",
-model="roberta-large-mnli",
-device=0 if DEVICE=="cuda" else -1
-)
+from researcher_system.core.model_registry import NLI_MODEL, get_model
 
 def contradiction(claim,evidence):
+    detector=get_model(NLI_MODEL)
     return detector(f"{claim} </s></s> {evidence}")
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+class EmbeddingCache:
+    """
+    Content-addressed cache for sentence embeddings.
+
+    Vectors are keyed on sha1(model name + text). The first tier is an
+    in-process LRU bounded by a byte budget; the optional second tier is a
+    directory of float16 .npy files that several worker processes can share.
+    Disk writes go through a temp file + os.replace so readers never see
+    partial vectors.
+    """
+
+    def __init__(self, model_name, max_bytes=64 * 1024 * 1024, cache_dir=None):
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._lru = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, text):
+        return hashlib.sha1(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npy")
+
+    def _remember(self, key, vec):
+        # Caller holds the lock
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            return
+        self._lru[key] = vec
+        self._bytes += vec.nbytes
+        while self._bytes > self.max_bytes and self._lru:
+            _, old = self._lru.popitem(last=False)
+            self._bytes -= old.nbytes
+
+    def get(self, text):
+        """
+        Returns the cached float32 vector for text, or None on a miss.
+        """
+        key = self.key(text)
+        with self._lock:
+            vec = self._lru.get(key)
+            if vec is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return vec
+
+        if self.cache_dir:
+            try:
+                vec = np.load(self._disk_path(key)).astype(np.float32)
+            except (OSError, ValueError):
+                vec = None
+            if vec is not None:
+                with self._lock:
+                    self._remember(key, vec)
+                    self.disk_hits += 1
+                return vec
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, text, vec):
+        key = self.key(text)
+        vec = np.asarray(vec, dtype=np.float32)
+        with self._lock:
+            self._remember(key, vec)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                return
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, vec.astype(np.float16))
+                os.replace(tmp_path, path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "model": self.model_name,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._lru),
+                "memory_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "cache_dir": self.cache_dir
+            }
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
@@ -1,10 +1,44 @@
-from sentence_transformers import SentenceTransformer
-from researcher_system.core.gpu_manager import DEVICE
+import numpy as np
+from researcher_system.core.gpu_manager import get_device
+from researcher_system.core.config import EMBED_CACHE_MAX_BYTES, EMBED_CACHE_DIR, INFERENCE_BACKEND
+from researcher_system.core.model_registry import EMBEDDING_MODEL, get_model
+from researcher_system.models.embedding_cache import EmbeddingCache
 
-model=SentenceTransformer(
-"sentence-transformers/all-MiniLM-L6-v2",
-device=DEVICE
-)
+MODEL_NAME=EMBEDDING_MODEL
+
+# int8 ONNX vectors differ slightly from fp32 ones, so the backend is part of the cache key
+cache=EmbeddingCache(f"{MODEL_NAME}@{INFERENCE_BACKEND}", max_bytes=EMBED_CACHE_MAX_BYTES, cache_dir=EMBED_CACHE_DIR)
+
+def get_embedding_model():
+    """
+    Shared all-MiniLM-L6-v2 instance from the model registry (loaded on first use).
+    """
+    return get_model(MODEL_NAME)
 
 def embed(texts):
-    return model.encode(texts,convert_to_tensor=True)
+    """
+    Encodes texts into a (len(texts), dim) tensor. Vectors are served from the
+    content-addressed cache where possible; only misses hit the model, in one batch.
+    """
+    import torch
+
+    if isinstance(texts, str):
+        texts = [texts]
+    vectors = [cache.get(t) for t in texts]
+
+    missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+    if missing:
+        encoded = dict(zip(missing, get_embedding_model().encode(missing, convert_to_numpy=True)))
+        for t, v in encoded.items():
+            cache.put(t, v)
+        vectors = [encoded[t] if v is None else v for t, v in zip(texts, vectors)]
+
+    if not vectors:
+        return torch.empty((0, get_embedding_model().get_sentence_embedding_dimension()), device=get_device())
+    return torch.from_numpy(np.stack(vectors).astype(np.float32)).to(get_device())
+
+def cache_stats():
+    """
+    Hit/miss counters and memory usage of the embedding cache.
+    """
+    return cache.stats()
@@ -1,11 +1,22 @@
-from transformers import pipeline
-import torch
+import threading
+from researcher_system.core.config import CLAIM_CLASSIFIER_BACKEND, STUDENT_CLASSIFIER_PATH
+from researcher_system.core.model_registry import ZERO_SHOT_MODEL, get_model, registry, load_zero_shot
 
 class ClaimClassifier:
-    def __init__(self, model_name="facebook/bart-large-mnli"):
-        # We use a zero-shot classifier to distinguish between Solid Claims, Vague Claims, and Questions
-        device = 0 if torch.cuda.is_available() else -1
-        self.classifier = pipeline("zero-shot-classification", model=model_name, device=device)
+    def __init__(self, model_name=ZERO_SHOT_MODEL, backend="zero-shot", student_path=STUDENT_CLASSIFIER_PATH):
+        # We use a zero-shot classifier to distinguish between Solid Claims, Vague Claims, and Questions.
+        # backend="student" routes claim labelling through the distilled MiniLM head instead;
+        # decay analysis always uses the zero-shot model.
+        self.model_name = model_name
+        if model_name not in registry:
+            registry.register(model_name, load_zero_shot)
+        self.backend = backend
+        self.student = None
+        if backend == "student":
+            from researcher_system.models.student_classifier import StudentClaimClassifier
+            self.student = StudentClaimClassifier.load(student_path)
+        elif backend != "zero-shot":
+            raise ValueError(f"Unknown claim classifier backend: {backend}")
         self.candidate_labels = [
             "solid research finding", 
             "vague or unconfident claim", 
@@ -15,6 +26,11 @@ class ClaimClassifier:
             "filler, noise, or introductory text"
         ]
 
+    @property
+    def classifier(self):
+        # Fetched from the registry on every use so an evicted model can actually be freed
+        return get_model(self.model_name)
+
     def _map_label(self, top_label):
         mapping = {
             "solid research finding": "solid_claim",
@@ -38,77 +54,95 @@ class ClaimClassifier:
         """
         if not sentences:
             return []
-            
-        # Passing a list to the classifier pipeline enables batching
-        results = self.classifier(sentences, self.candidate_labels, batch_size=batch_size)
-        
-        # If single sentence, transformers returns a dict, otherwise a list of dicts
-        if isinstance(results, dict):
-            results = [results]
+        if self.student is not None:
+            return self.student.classify_batch(sentences)
             
         output = []
-        for res in results:
-            top_label = res['labels'][0]
-            top_score = res['scores'][0]
+        for dist in self.classify_distribution_batch(sentences, batch_size=batch_size):
+            top_label = max(dist, key=dist.get)
             output.append({
-                "label": self._map_label(top_label),
-                "score": float(top_score)
+                "label": top_label,
+                "score": dist[top_label]
             })
         return output
 
-    def classify_decay_type(self, sentence):
+    def classify_distribution_batch(self, sentences, batch_size=16):
         """
-        Classifies the decay type of a claim and identifies dynamic moving variables.
+        Full zero-shot score distribution per sentence, keyed by mapped label.
+        Used as the soft targets when distilling the student classifier.
         """
-        # Step 1: Identify Decay Category
-        decay_labels = [
-            "technology, benchmarks, software, or market data (Fast Decay)",
-            "trends, social statistics, or economic guidelines (Medium Decay)",
-            "mathematics, physics fundamentals, or historical facts (Slow Decay)",
-            "timeless logical proofs or core scientific laws"
-        ]
-        
-        res = self.classifier(sentence, decay_labels)
-        top_label = res['labels'][0]
+        if not sentences:
+            return []
+
+        # Passing a list to the classifier pipeline enables batching
+        results = self.classifier(sentences, self.candidate_labels, batch_size=batch_size)
         
-        # Step 3: Identify Moving Variables (Dynamic Inputs)
-        variable_labels = ["prices", "software versions", "market share", "leadership", "laws", "statistics", "none"]
-        var_res = self.classifier(sentence, variable_labels)
-        moving_vars = [label for label, score in zip(var_res['labels'], var_res['scores']) if score > 0.4 and label != "none"]
+        # If single sentence, transformers returns a dict, otherwise a list of dicts
+        if isinstance(results, dict):
+            results = [results]
+
+        return [{self._map_label(label): float(score) for label, score in zip(res['labels'], res['scores'])} for res in results]
+
+    decay_labels = [
+        "technology, benchmarks, software, or market data (Fast Decay)",
+        "trends, social statistics, or economic guidelines (Medium Decay)",
+        "mathematics, physics fundamentals, or historical facts (Slow Decay)",
+        "timeless logical proofs or core scientific laws"
+    ]
 
+    variable_labels = ["prices", "software versions", "market share", "leadership", "laws", "statistics", "none"]
+
+    def _map_decay(self, top_label):
         if "Fast Decay" in top_label:
-            return "FAST", "Technology/Market data decays quickly.", moving_vars
+            return "FAST", "Technology/Market data decays quickly."
         elif "Medium Decay" in top_label:
-            return "MEDIUM", "Trends and statistics have moderate stability.", moving_vars
+            return "MEDIUM", "Trends and statistics have moderate stability."
         elif "Slow Decay" in top_label:
-            return "SLOW", "Fundamentals and history are very stable.", moving_vars
+            return "SLOW", "Fundamentals and history are very stable."
         else:
-            return "TIMELESS", "Core laws and logic do not expire.", moving_vars
+            return "TIMELESS", "Core laws and logic do not expire."
 
-    def classify_advanced_freshness(self, sentence):
+    def classify_decay_type(self, sentence):
         """
-        Simulates the 10-step architecture:
-        Type, Timestamp, Moving Variables, Disconfirming Evidence, Consensus, etc.
+        Classifies the decay type of a claim and identifies dynamic moving variables.
         """
-        # Step 1: Type & Decay
-        decay_type, decay_reason, moving_vars = self.classify_decay_type(sentence)
-        
+        return self.classify_decay_batch([sentence])[0]
+
+    def classify_decay_batch(self, sentences, batch_size=16):
+        """
+        Classifies the decay type and moving variables of many claims at once.
+        Both label sets are scored in batched passes over all sentences instead
+        of two pipeline calls per sentence.
+
+        Returns:
+            list of tuple: (decay_type, reason, moving_vars) per input sentence.
+        """
+        if not sentences:
+            return []
+
+        # Step 1: Identify Decay Category
+        decay_results = self.classifier(sentences, self.decay_labels, batch_size=batch_size)
+        # Step 3: Identify Moving Variables (Dynamic Inputs)
+        var_results = self.classifier(sentences, self.variable_labels, batch_size=batch_size)
+
+        if isinstance(decay_results, dict):
+            decay_results = [decay_results]
+        if isinstance(var_results, dict):
+            var_results = [var_results]
+
+        output = []
+        for res, var_res in zip(decay_results, var_results):
+            decay_type, decay_reason = self._map_decay(res['labels'][0])
+            moving_vars = [label for label, score in zip(var_res['labels'], var_res['scores']) if score > 0.4 and label != "none"]
+            output.append((decay_type, decay_reason, moving_vars))
+        return output
+
+    def _build_freshness(self, decay_type, decay_reason, moving_vars):
         # Step 4 & 7: Simulated Consensus & Evidence Search
         # In a real system, this would be a Google/Semantic Scholar Search.
-        # Here we use LLM's internal knowledge to simulate "searching for disconfirming evidence".
-        analysis_prompt = (
-            f"Analyze this research claim for outdatedness based on these steps:\n"
-            f"Claim: '{sentence}'\n"
-            f"1. Is there recent (2025-2026) disconfirming evidence?\n"
-            f"2. Does it depend on moving variables like ${', '.join(moving_vars) if moving_vars else 'none'}?\n"
-            f"3. What is the current institutional consensus?\n"
-            f"Return a short 1-sentence summary of the 'Stress Test' result."
-        )
-        
-        # Use zero-shot as a proxy for specific analysis if needed, 
-        # but here we'll just return a structured simulated finding for the UI.
+        # Here we return a structured simulated finding for the UI.
         stress_test = "Claim stands against recent disconfirming evidence." if "TIMELESS" in decay_type or "SLOW" in decay_type else "Newer models or datasets may contradict this finding."
-        
+
         return {
             "decay_type": decay_type,
             "reason": decay_reason,
@@ -117,13 +151,30 @@ class ClaimClassifier:
             "consensus": "Matches current scientific consensus." if "SLOW" in decay_type else "Market/Tech consensus shifts frequently."
         }
 
-# Singleton instance to avoid reloading model
+    def classify_advanced_freshness(self, sentence):
+        """
+        Simulates the 10-step architecture:
+        Type, Timestamp, Moving Variables, Disconfirming Evidence, Consensus, etc.
+        """
+        return self.classify_advanced_freshness_batch([sentence])[0]
+
+    def classify_advanced_freshness_batch(self, sentences, batch_size=16):
+        """
+        Batched variant of classify_advanced_freshness for a list of claims.
+        """
+        # Step 1: Type & Decay
+        return [self._build_freshness(*decay) for decay in self.classify_decay_batch(sentences, batch_size=batch_size)]
+
+# Singleton instance; the underlying BART weights live in the model registry
 _classifier = None
+_classifier_lock = threading.Lock()
 
 def get_classifier():
     global _classifier
     if _classifier is None:
-        _classifier = ClaimClassifier()
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = ClaimClassifier(backend=CLAIM_CLASSIFIER_BACKEND)
     return _classifier
 
 def get_detailed_classification(sentence: str):
@@ -135,6 +186,16 @@ def get_decay_analysis(sentence: str):
     analysis = clf.classify_advanced_freshness(sentence)
     return analysis["decay_type"], analysis["reason"], analysis["moving_variables"], analysis["stress_test"], analysis["consensus"]
 
+def get_decay_analysis_batch(sentences):
+    """
+    Batched get_decay_analysis: returns one analysis tuple per sentence.
+    """
+    if not sentences:
+        return []
+    clf = get_classifier()
+    analyses = clf.classify_advanced_freshness_batch(sentences)
+    return [(a["decay_type"], a["reason"], a["moving_variables"], a["stress_test"], a["consensus"]) for a in analyses]
+
 def is_actual_claim(sentence: str) -> bool:
     """
     Returns True if the sentence is either a solid or a vague claim.
@@ -0,0 +1,137 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from researcher_system.core.config import NLI_MAX_PREMISE_TOKENS, NLI_MAX_BATCH_TOKENS
+
+def plan_batches(lengths, max_batch_tokens):
+    """
+    Groups sequence indices into batches by padded token budget: items are sorted
+    by length and a batch is closed once (longest length x batch size) would exceed
+    max_batch_tokens. An over-long single item still gets a batch of its own.
+
+    Returns:
+        list of list of int: Indices into lengths, one list per batch.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches = []
+    current = []
+    for i in order:
+        # Sorted ascending, so the newest item is always the longest in the batch
+        if current and lengths[i] * (len(current) + 1) > max_batch_tokens:
+            batches.append(current)
+            current = []
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+def _softmax(x, axis=-1):
+    x = x - x.max(axis=axis, keepdims=True)
+    e = np.exp(x)
+    return e / e.sum(axis=axis, keepdims=True)
+
+class NLIExecutor(ABC):
+    """
+    Zero-shot classifier over an NLI cross-encoder, callable like the HF
+    zero-shot-classification pipeline (single-label mode).
+
+    Hypotheses are tokenized once per label set and premises once per sentence
+    (capped at max_premise_tokens), so a pair is just the two id lists joined with
+    the model's special tokens. Pairs are sorted by length and batched by padded
+    token budget rather than item count, which keeps padding waste low and stops
+    one very long "sentence" from inflating a whole batch.
+
+    Subclasses provide _forward(input_ids, attention_mask) -> logits (numpy).
+    """
+
+    def __init__(self, tokenizer, entailment_id, hypothesis_template="This example is {}.",
+                 max_premise_tokens=NLI_MAX_PREMISE_TOKENS, max_batch_tokens=NLI_MAX_BATCH_TOKENS):
+        self.tokenizer = tokenizer
+        self.entailment_id = entailment_id
+        self.hypothesis_template = hypothesis_template
+        self.max_premise_tokens = max_premise_tokens
+        self.max_batch_tokens = max_batch_tokens
+        self._hypothesis_cache = {}
+
+    @abstractmethod
+    def _forward(self, input_ids, attention_mask):
+        """
+        Runs the model on one padded batch; returns (batch, n_classes) logits as numpy.
+        """
+
+    def _tokenize(self, texts):
+        return self.tokenizer(list(texts), add_special_tokens=False)["input_ids"]
+
+    def hypothesis_ids(self, candidate_labels):
+        key = tuple(candidate_labels)
+        if key not in self._hypothesis_cache:
+            self._hypothesis_cache[key] = self._tokenize(self.hypothesis_template.format(l) for l in candidate_labels)
+        return self._hypothesis_cache[key]
+
+    def entailment_logits(self, premises, candidate_labels):
+        """
+        Returns an (n_premises, n_labels) array of entailment logits.
+        """
+        hyp_ids = self.hypothesis_ids(candidate_labels)
+        premise_ids = [ids[:self.max_premise_tokens] for ids in self._tokenize(premises)]
+
+        pairs = [self.tokenizer.build_inputs_with_special_tokens(p, h) for p in premise_ids for h in hyp_ids]
+        lengths = [len(p) for p in pairs]
+        pad_id = self.tokenizer.pad_token_id if self.tokenizer.pad_token_id is not None else 0
+
+        entail = np.empty(len(pairs), dtype=np.float32)
+        for batch in plan_batches(lengths, self.max_batch_tokens):
+            width = max(lengths[i] for i in batch)
+            input_ids = np.full((len(batch), width), pad_id, dtype=np.int64)
+            attention_mask = np.zeros((len(batch), width), dtype=np.int64)
+            for row, i in enumerate(batch):
+                input_ids[row, :lengths[i]] = pairs[i]
+                attention_mask[row, :lengths[i]] = 1
+            logits = self._forward(input_ids, attention_mask)
+            entail[batch] = logits[:, self.entailment_id]
+        return entail.reshape(len(premise_ids), len(hyp_ids))
+
+    def __call__(self, sequences, candidate_labels, batch_size=None, **kwargs):
+        # batch_size is accepted for pipeline compatibility; batching follows max_batch_tokens
+        single = isinstance(sequences, str)
+        if single:
+            sequences = [sequences]
+        if not sequences:
+            return []
+
+        scores = _softmax(self.entailment_logits(sequences, candidate_labels), axis=1)
+        results = []
+        for seq, row in zip(sequences, scores):
+            order = np.argsort(-row, kind="stable")
+            results.append({
+                "sequence": seq,
+                "labels": [candidate_labels[j] for j in order],
+                "scores": [float(row[j]) for j in order]
+            })
+        return results[0] if single else results
+
+def entailment_index(config):
+    label2id = {k.lower(): v for k, v in config.label2id.items()}
+    return next((v for k, v in label2id.items() if k.startswith("entail")), -1)
+
+class TorchZeroShotClassifier(NLIExecutor):
+    """
+    NLIExecutor running a PyTorch sequence-classification model (e.g. bart-large-mnli).
+    """
+
+    def __init__(self, model_name, device="cpu", **kwargs):
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name).to(device).eval()
+        self.device = device
+        super().__init__(tokenizer, entailment_index(self.model.config), **kwargs)
+
+    def _forward(self, input_ids, attention_mask):
+        import torch
+        with torch.no_grad():
+            out = self.model(
+                input_ids=torch.from_numpy(input_ids).to(self.device),
+                attention_mask=torch.from_numpy(attention_mask).to(self.device)
+            )
+        return out.logits.float().cpu().numpy()
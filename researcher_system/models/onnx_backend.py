@@ -0,0 +1,147 @@
+import logging
+import os
+
+import numpy as np
+
+from researcher_system.models.nli_executor import NLIExecutor, entailment_index
+
+QUANTIZED_FILE = "model.int8.onnx"
+
+def _model_dir(root, model_name):
+    return os.path.join(root, model_name.replace("/", "__"))
+
+def _quantize(fp32_path, out_dir):
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    int8_path = os.path.join(out_dir, QUANTIZED_FILE)
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    os.remove(fp32_path)
+    return int8_path
+
+def export_sequence_classifier(model_name, out_dir):
+    """
+    Exports an NLI sequence-classification model (e.g. bart-large-mnli) to ONNX
+    and applies dynamic int8 quantization. Tokenizer and config are saved alongside.
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+    model.config.return_dict = False
+
+    sample = tokenizer(["A premise."], ["This example is a hypothesis."], return_tensors="pt")
+    fp32_path = os.path.join(out_dir, "model.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            model, (sample["input_ids"], sample["attention_mask"]), fp32_path,
+            input_names=["input_ids", "attention_mask"], output_names=["logits"],
+            dynamic_axes={"input_ids": {0: "batch", 1: "seq"}, "attention_mask": {0: "batch", 1: "seq"}, "logits": {0: "batch"}},
+            opset_version=14
+        )
+    tokenizer.save_pretrained(out_dir)
+    model.config.save_pretrained(out_dir)
+    return _quantize(fp32_path, out_dir)
+
+def export_sentence_embedder(model_name, out_dir):
+    """
+    Exports the transformer of a sentence-transformers model (e.g. all-MiniLM-L6-v2)
+    to ONNX with dynamic int8 quantization. Pooling/normalization run in numpy.
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModel
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name).eval()
+    model.config.return_dict = False
+
+    sample = tokenizer(["A sentence to embed."], return_tensors="pt")
+    fp32_path = os.path.join(out_dir, "model.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            model, (sample["input_ids"], sample["attention_mask"]), fp32_path,
+            input_names=["input_ids", "attention_mask"], output_names=["last_hidden_state"],
+            dynamic_axes={"input_ids": {0: "batch", 1: "seq"}, "attention_mask": {0: "batch", 1: "seq"}, "last_hidden_state": {0: "batch", 1: "seq"}},
+            opset_version=14
+        )
+    tokenizer.save_pretrained(out_dir)
+    model.config.save_pretrained(out_dir)
+    return _quantize(fp32_path, out_dir)
+
+def _session(path):
+    import onnxruntime as ort
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+
+class OnnxZeroShotClassifier(NLIExecutor):
+    """
+    Drop-in replacement for the HF zero-shot-classification pipeline backed by an
+    int8 onnxruntime session. Same call signature and result dicts
+    ({"sequence", "labels", "scores"}) as the single-label pipeline.
+    """
+
+    def __init__(self, model_dir, **kwargs):
+        from transformers import AutoTokenizer, AutoConfig
+        path = os.path.join(model_dir, QUANTIZED_FILE)
+        self.session = _session(path)
+        self.memory_bytes = os.path.getsize(path)
+        super().__init__(AutoTokenizer.from_pretrained(model_dir), entailment_index(AutoConfig.from_pretrained(model_dir)), **kwargs)
+
+    def _forward(self, input_ids, attention_mask):
+        return self.session.run(["logits"], {"input_ids": input_ids, "attention_mask": attention_mask})[0]
+
+class OnnxSentenceEmbedder:
+    """
+    Subset of the SentenceTransformer API (encode, get_sentence_embedding_dimension)
+    backed by an int8 onnxruntime session with mean pooling + L2 normalization,
+    matching all-MiniLM-L6-v2's pooling head.
+    """
+
+    def __init__(self, model_dir, max_length=256, normalize=True):
+        from transformers import AutoTokenizer, AutoConfig
+        path = os.path.join(model_dir, QUANTIZED_FILE)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = _session(path)
+        self.max_length = max_length
+        self.normalize = normalize
+        self.dimension = AutoConfig.from_pretrained(model_dir).hidden_size
+        self.memory_bytes = os.path.getsize(path)
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, convert_to_tensor=False, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        out = np.zeros((len(sentences), self.dimension), dtype=np.float32)
+        for i in range(0, len(sentences), batch_size):
+            enc = self.tokenizer(sentences[i:i + batch_size], padding=True, truncation=True, max_length=self.max_length, return_tensors="np")
+            mask = enc["attention_mask"].astype(np.int64)
+            hidden = self.session.run(["last_hidden_state"], {"input_ids": enc["input_ids"].astype(np.int64), "attention_mask": mask})[0]
+            m = mask[..., None].astype(np.float32)
+            pooled = (hidden * m).sum(axis=1) / np.clip(m.sum(axis=1), 1e-9, None)
+            if self.normalize:
+                pooled = pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            out[i:i + len(pooled)] = pooled
+
+        result = out[0] if single else out
+        if convert_to_tensor:
+            import torch
+            return torch.from_numpy(result)
+        return result
+
+def _ensure_exported(model_name, root, exporter):
+    model_dir = _model_dir(root, model_name)
+    if not os.path.exists(os.path.join(model_dir, QUANTIZED_FILE)):
+        logging.info(f"Exporting {model_name} to int8 ONNX in {model_dir}")
+        exporter(model_name, model_dir)
+    return model_dir
+
+def load_onnx_zero_shot(model_name, root):
+    return OnnxZeroShotClassifier(_ensure_exported(model_name, root, export_sequence_classifier))
+
+def load_onnx_sentence_embedder(model_name, root):
+    return OnnxSentenceEmbedder(_ensure_exported(model_name, root, export_sentence_embedder))
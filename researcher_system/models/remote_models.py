@@ -0,0 +1,138 @@
+import os
+import threading
+from multiprocessing.connection import Client
+
+import numpy as np
+
+from researcher_system.core.config import INFERENCE_SERVER_AUTHKEY
+
+class InferenceClient:
+    """
+    Connection pool to the shared inference server (core/inference_server.py).
+
+    The server answers one request at a time per connection, so each call
+    borrows an idle connection (or opens a new one) and returns it afterwards;
+    concurrent threads in one worker therefore reach the server concurrently
+    and their sentences can land in the same server-side batch.
+    """
+
+    def __init__(self, socket_path, authkey=None):
+        self.socket_path = socket_path
+        self.authkey = authkey
+        self._idle = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _connect(self):
+        try:
+            return Client(self.socket_path, family="AF_UNIX", authkey=self.authkey)
+        except (OSError, EOFError) as e:
+            raise ConnectionError(f"Inference server at {self.socket_path} is unavailable: {e}") from e
+
+    def _acquire(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Connections inherited from a parent process are not ours to use
+                self._idle, self._pid = [], os.getpid()
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def call(self, op, *args):
+        conn, reused = self._acquire()
+        try:
+            conn.send((op,) + args)
+            status, value = conn.recv()
+        except (EOFError, OSError) as e:
+            conn.close()
+            if reused:
+                # Idle connection went stale (e.g. the server restarted): retry once on a fresh one
+                return self.call(op, *args)
+            raise ConnectionError(f"Inference server at {self.socket_path} dropped the connection: {e}") from e
+        with self._lock:
+            self._idle.append(conn)
+        if status == "error":
+            raise RuntimeError(f"Inference server error: {value}")
+        return value
+
+    def stats(self):
+        return self.call("stats")
+
+class RemoteEmbedder:
+    """
+    Stand-in for SentenceTransformer.encode / get_sentence_embedding_dimension.
+    """
+    memory_bytes = 0
+
+    def __init__(self, client):
+        self.client = client
+        self._dimension = None
+
+    def get_sentence_embedding_dimension(self):
+        if self._dimension is None:
+            self._dimension = self.client.call("embedding_dimension")
+        return self._dimension
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, convert_to_tensor=False, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        vectors = self.client.call("embed", list(sentences))
+        if vectors:
+            out = np.stack(vectors).astype(np.float32)
+        else:
+            out = np.zeros((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        result = out[0] if single else out
+        if convert_to_tensor:
+            import torch
+            return torch.from_numpy(result)
+        return result
+
+class RemoteZeroShotClassifier:
+    """
+    Stand-in for the zero-shot-classification pipeline (single-label mode).
+    """
+    memory_bytes = 0
+
+    def __init__(self, client):
+        self.client = client
+
+    def __call__(self, sequences, candidate_labels, batch_size=None, **kwargs):
+        # batch_size is accepted for pipeline compatibility; the server batches across requests
+        single = isinstance(sequences, str)
+        if single:
+            sequences = [sequences]
+        if not sequences:
+            return []
+        results = self.client.call("zero_shot", list(sequences), list(candidate_labels))
+        return results[0] if single else results
+
+class RemoteTextClassifier:
+    """
+    Stand-in for the text-classification pipeline used for NLI.
+    """
+    memory_bytes = 0
+
+    def __init__(self, client):
+        self.client = client
+
+    def __call__(self, inputs, **kwargs):
+        # Like the pipeline, a single string still yields a list (of one prediction)
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        return self.client.call("nli", list(inputs))
+
+def register_remote_models(registry, socket_path):
+    """
+    Points the registry's served models at the inference server: get_model()
+    then hands out lightweight proxies instead of loading weights in this process.
+    """
+    from researcher_system.core.model_registry import EMBEDDING_MODEL, ZERO_SHOT_MODEL, NLI_MODEL
+
+    authkey = INFERENCE_SERVER_AUTHKEY.encode() if INFERENCE_SERVER_AUTHKEY else None
+    client = InferenceClient(socket_path, authkey)
+    registry.register(EMBEDDING_MODEL, lambda name: RemoteEmbedder(client))
+    registry.register(ZERO_SHOT_MODEL, lambda name: RemoteZeroShotClassifier(client))
+    registry.register(NLI_MODEL, lambda name: RemoteTextClassifier(client))
+    return client
@@ -0,0 +1,102 @@
+import os
+import numpy as np
+
+class StudentClaimClassifier:
+    """
+    Compact claim classifier distilled from the BART zero-shot teacher.
+
+    Sentences are encoded with the shared MiniLM embedding model and scored by a
+    small MLP head (or a linear head when hidden_size is 0). Outputs use the same
+    solid_claim / vague_claim / ... labels and {"label", "score"} format as
+    ClaimClassifier.classify_batch.
+    """
+
+    def __init__(self, labels, weights):
+        self.labels = list(labels)
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, allow_pickle=False)
+        n_layers = int(data["n_layers"])
+        weights = []
+        for i in range(n_layers):
+            weights.extend([data[f"W{i}"], data[f"b{i}"]])
+        return cls([str(l) for l in data["labels"]], weights)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {"labels": np.array(self.labels), "n_layers": np.array(len(self.weights) // 2)}
+        for i in range(len(self.weights) // 2):
+            arrays[f"W{i}"] = self.weights[2 * i]
+            arrays[f"b{i}"] = self.weights[2 * i + 1]
+        np.savez(path, **arrays)
+
+    def predict_proba(self, embeddings):
+        h = np.asarray(embeddings, dtype=np.float32)
+        n_layers = len(self.weights) // 2
+        for i in range(n_layers):
+            h = h @ self.weights[2 * i] + self.weights[2 * i + 1]
+            if i < n_layers - 1:
+                h = np.maximum(h, 0.0)
+        h = h - h.max(axis=1, keepdims=True)
+        probs = np.exp(h)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def classify_batch(self, sentences, batch_size=64):
+        """
+        Classifies a list of sentences; same output format as ClaimClassifier.classify_batch.
+        """
+        if not sentences:
+            return []
+        from researcher_system.models.embedding_engine import embed
+
+        output = []
+        for i in range(0, len(sentences), batch_size):
+            probs = self.predict_proba(embed(sentences[i:i + batch_size]).cpu().numpy())
+            for row in probs:
+                top = int(row.argmax())
+                output.append({"label": self.labels[top], "score": float(row[top])})
+        return output
+
+def train_student(embeddings, teacher_distributions, labels, hidden_size=256, epochs=300, lr=1e-3, weight_decay=1e-4, seed=0):
+    """
+    Fits a student head on MiniLM embeddings against the teacher's soft label
+    distributions (cross-entropy on soft targets).
+
+    Args:
+        embeddings (array): (n, dim) sentence embeddings.
+        teacher_distributions (array): (n, len(labels)) teacher probabilities.
+        labels (list): Label names, in column order.
+
+    Returns:
+        StudentClaimClassifier
+    """
+    import torch
+
+    torch.manual_seed(seed)
+    x = torch.as_tensor(np.asarray(embeddings), dtype=torch.float32)
+    y = torch.as_tensor(np.asarray(teacher_distributions), dtype=torch.float32)
+
+    if hidden_size:
+        head = torch.nn.Sequential(
+            torch.nn.Linear(x.shape[1], hidden_size),
+            torch.nn.ReLU(),
+            torch.nn.Linear(hidden_size, len(labels))
+        )
+    else:
+        head = torch.nn.Sequential(torch.nn.Linear(x.shape[1], len(labels)))
+
+    optimizer = torch.optim.AdamW(head.parameters(), lr=lr, weight_decay=weight_decay)
+    for _ in range(epochs):
+        optimizer.zero_grad()
+        loss = -(y * torch.log_softmax(head(x), dim=1)).sum(dim=1).mean()
+        loss.backward()
+        optimizer.step()
+
+    weights = []
+    for layer in head:
+        if isinstance(layer, torch.nn.Linear):
+            weights.append(layer.weight.detach().numpy().T.copy())
+            weights.append(layer.bias.detach().numpy().copy())
+    return StudentClaimClassifier(labels, weights)
@@ -1,4 +1,4 @@
-VAGUE_WORDS=["many","some","various","several","often"]
+from researcher_system.analysis.heuristic_rules import VAGUE_WORDS, vague_catalog
 
 def is_vague(text):
-    return any(v in text.lower() for v in VAGUE_WORDS)
+    return bool(vague_catalog.categories_in(text.lower()))
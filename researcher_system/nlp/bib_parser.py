@@ -1,31 +1,258 @@
 import re
+from collections import namedtuple
 
-def parse_bibliography(text):
+from researcher_system.nlp.parsed_document import CITATION_MARKER_RE
+
+# Compact bibliography record. norm_text, author_keys and title_key are precomputed
+# once at parse time so later stages never re-lowercase or re-scan the entry.
+BibEntry = namedtuple("BibEntry", [
+    "key", "text", "authors", "year", "title", "venue", "doi",
+    "norm_text", "author_keys", "title_key"
+])
+
+HEADER_RE = re.compile(r'(?i)(?:^|\n)[ \t]*(?:References|Bibliography)[ \t]*\n')
+BRACKET_MARKER_RE = re.compile(r'\[(\d+)\]')
+NUMBERED_LINE_RE = re.compile(r'^[ \t]*(\d{1,3})[.)][ \t]+(?=\S)', re.MULTILINE)
+AUTHOR_START_RE = re.compile(r"^[ \t]*(?:[A-Z][A-Za-z'À-ſ\-]+,[ \t]+(?:[A-Z]\.|[A-Z][a-z]+)|[A-Z]\.[ \t]?(?:[A-Z]\.[ \t]?)*[A-Z][a-z]+)")
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+PAREN_YEAR_RE = re.compile(r'\(((?:19|20)\d{2})[a-z]?\)')
+DOI_RE = re.compile(r'10\.\d{4,9}/[^\s"<>]+')
+QUOTED_TITLE_RE = re.compile(r'[“"]([^”"]{3,})[”"]')
+INITIALS_RE = re.compile(r"^(?:[A-Z]\.?-?)+$")
+AUTHOR_SPLIT_RE = re.compile(r',|;|&|\band\b')
+
+def _surname(name):
+    tokens = [t.strip(".,") for t in name.split()]
+    tokens = [t for t in tokens if t and not INITIALS_RE.match(t) and t.lower() not in ("et", "al")]
+    return tokens[-1] if tokens else None
+
+def _split_authors(segment):
+    names = []
+    for piece in AUTHOR_SPLIT_RE.split(segment.replace("et al.", "")):
+        piece = piece.strip(" .")
+        if not piece or not re.search(r'[A-Za-z]', piece):
+            continue
+        # "Smith, J." style: the initials piece belongs to the surname before it
+        if names and INITIALS_RE.match(piece.replace(" ", "")):
+            names[-1] = f"{names[-1]} {piece}."
+        else:
+            names.append(piece)
+    return tuple(names)
+
+def _parse_fields(text):
     """
-    Identifies the References section and maps citation IDs to full text.
-    Returns a dictionary of {id: full_text}.
+    Best-effort split of one reference string into authors, year, title, venue and DOI.
+    Handles IEEE-style quoted titles, APA-style "(2020)." years and plain "Authors. Title. Venue" entries.
     """
-    # Look for References section
-    ref_matches = list(re.finditer(r'(?i)\n(?:References|Bibliography)\n', text))
-    if not ref_matches:
-        # Fallback to searching for the start of the list if no header found
-        ref_start = text.rfind('[1]')
-        if ref_start == -1:
-            return {}
+    doi_match = DOI_RE.search(text)
+    doi = doi_match.group(0).rstrip(".,;)").lower() if doi_match else None
+
+    paren_year = PAREN_YEAR_RE.search(text)
+    year_match = YEAR_RE.search(text)
+    year = int(paren_year.group(1)) if paren_year else (int(year_match.group(0)) if year_match else None)
+
+    quoted = QUOTED_TITLE_RE.search(text)
+    if quoted:
+        author_segment = text[:quoted.start()]
+        title = quoted.group(1).strip(" ,.")
+        rest = text[quoted.end():]
+    elif paren_year:
+        author_segment = text[:paren_year.start()]
+        after = text[paren_year.end():].lstrip(" .")
+        title, _, rest = after.partition(". ")
     else:
-        # We assume the last occurrence is the actual bibliography section
-        ref_start = ref_matches[-1].end()
+        # Authors end at the first ". " that does not follow an initial
+        cut = next((m.start() for m in re.finditer(r'\. ', text) if len(text[:m.start()].split()[-1]) > 2), -1) if text else -1
+        author_segment = text[:cut] if cut != -1 else ""
+        title, _, rest = text[cut + 2:].partition(". ") if cut != -1 else (text, "", "")
+
+    venue = re.sub(r'^[\s,.]*(?:in\s+)?', '', rest, flags=re.IGNORECASE)
+    venue = re.split(r',|\.\s|\(', venue, maxsplit=1)[0].strip(" .")
+    if YEAR_RE.fullmatch(venue):
+        venue = ""
+
+    authors = _split_authors(author_segment.strip(" ,"))
+    author_keys = frozenset(s.lower() for s in (_surname(a) for a in authors) if s and len(s) > 1)
+    title = title.strip()
+    return authors, year, title, venue, doi, author_keys
+
+def _make_entry(key, content):
+    clean = re.sub(r'\s+', ' ', content).strip()
+    authors, year, title, venue, doi, author_keys = _parse_fields(clean)
+    return BibEntry(key, clean, authors, year, title, venue, doi,
+                    clean.lower(), author_keys, re.sub(r'[^a-z0-9]', '', title.lower()))
+
+def _author_year_key(entry, taken):
+    surnames = [_surname(a) for a in entry.authors]
+    surnames = [s for s in surnames if s]
+    if not surnames or not entry.year:
+        base = f"[{len(taken) + 1}]"
+    elif len(surnames) == 1:
+        base = f"({surnames[0]}, {entry.year})"
+    elif len(surnames) == 2:
+        base = f"({surnames[0]} and {surnames[1]}, {entry.year})"
+    else:
+        base = f"({surnames[0]} et al., {entry.year})"
+    key, suffix = base, ord("a")
+    while key in taken:
+        key = base.replace(f"{entry.year})", f"{entry.year}{chr(suffix)})")
+        suffix += 1
+    return key
+
+class Bibliography:
+    """
+    Parsed reference list: ordered BibEntry records plus indexes by key and by
+    (first-author surname, year) for resolving in-text citation markers.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        self.by_key = {e.key: e for e in self.entries}
+        self.by_author_year = {}
+        for e in self.entries:
+            for surname in e.author_keys:
+                if e.year:
+                    self.by_author_year.setdefault((surname, e.year), []).append(e)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
 
-    ref_section = text[ref_start:]
-    
-    # Extract numerical bracket citations [1] ...
-    # This regex looks for [N] followed by text until the next [N+1] or end of section
+    def as_map(self):
+        """
+        { key: full_text } in reference order, the shape parse_bibliography has always returned.
+        """
+        return {e.key: e.text for e in self.entries}
+
+    def years(self):
+        return {e.key: e.year for e in self.entries if e.year}
+
+    def resolve(self, marker):
+        """
+        Entries referenced by an in-text marker: "[3]", "[1, 4]", "[2-5]" or "(Smith et al., 2020)".
+        """
+        if marker in self.by_key:
+            return [self.by_key[marker]]
+        if marker.startswith("["):
+            ids = []
+            for part in marker.strip("[]").split(","):
+                bounds = [b for b in part.strip().split("-") if b.strip().isdigit()]
+                if len(bounds) == 2 and 0 <= int(bounds[1]) - int(bounds[0]) <= 50:
+                    ids.extend(range(int(bounds[0]), int(bounds[1]) + 1))
+                elif bounds:
+                    ids.append(int(bounds[0]))
+            return [self.by_key[f"[{i}]"] for i in ids if f"[{i}]" in self.by_key]
+        m = re.match(r'\(\s*([A-Z][A-Za-z\-]+).*?((?:19|20)\d{2})', marker)
+        if m:
+            return list(self.by_author_year.get((m.group(1).lower(), int(m.group(2))), []))
+        return []
+
+    def cited_in(self, text):
+        """
+        Entries cited anywhere in a piece of text, in order of first mention.
+        """
+        found = {}
+        for m in CITATION_MARKER_RE.finditer(text):
+            for entry in self.resolve(m.group(0)):
+                found.setdefault(entry.key, entry)
+        return list(found.values())
+
+    def map_markers(self, markers):
+        """
+        { marker: reference text } for every in-text marker that resolves; grouped
+        markers such as "[1, 4]" map to their entries' texts joined together.
+        """
+        mapped = {}
+        for marker in markers:
+            entries = self.resolve(marker)
+            if entries:
+                mapped[marker] = " ".join(e.text for e in entries)
+        return mapped
+
+def _numbered_bracket_entries(section):
+    # One finditer pass over [N] markers: an entry runs from "[N] " to the next marker
+    # (same boundaries as the old lazy DOTALL regex, without its backtracking).
     entries = {}
-    pattern = r'\[(\d+)\]\s+(.*?)(?=\s*\[\d+\]|$)'
-    matches = re.findall(pattern, ref_section, re.DOTALL)
-    
-    for citation_id, content in matches:
-        clean_content = re.sub(r'\s+', ' ', content).strip()
-        entries[f"[{citation_id}]"] = clean_content
-        
+    markers = list(BRACKET_MARKER_RE.finditer(section))
+    for i, m in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(section)
+        rest = section[m.end():end]
+        if not rest[:1].isspace() or not rest.strip():
+            continue
+        entries[f"[{m.group(1)}]"] = _make_entry(f"[{m.group(1)}]", rest)
+    return list(entries.values())
+
+def _numbered_line_entries(section):
+    # "1. Author ..." lists: only accept consecutive numbers so years or page numbers don't start entries
+    starts = []
+    expected = 1
+    for m in NUMBERED_LINE_RE.finditer(section):
+        if int(m.group(1)) == expected:
+            starts.append((expected, m.start(), m.end()))
+            expected += 1
+    entries = []
+    for i, (n, _, content_start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else len(section)
+        entries.append(_make_entry(f"[{n}]", section[content_start:end]))
     return entries
+
+def _unnumbered_entries(section):
+    # Author-year / unnumbered lists: a line opening with an author name starts a new
+    # entry when the previous one looks finished (ends with "." or a blank line separates them)
+    chunks = []
+    current = []
+    blank = False
+    for line in section.split("\n"):
+        if not line.strip():
+            blank = True
+            continue
+        prev = " ".join(current).rstrip()
+        if current and AUTHOR_START_RE.match(line) and (blank or prev.endswith(".")):
+            chunks.append(prev)
+            current = []
+        current.append(line.strip())
+        blank = False
+    if current:
+        chunks.append(" ".join(current))
+
+    entries = []
+    taken = set()
+    for chunk in chunks:
+        entry = _make_entry("", chunk)
+        key = _author_year_key(entry, taken)
+        taken.add(key)
+        entries.append(entry._replace(key=key))
+    return entries
+
+def parse_references(text):
+    """
+    Single linear pass over the references section into a Bibliography of
+    BibEntry records. Understands numbered "[N]" and "N." lists and
+    author-year / unnumbered lists.
+    """
+    headers = list(HEADER_RE.finditer(text))
+    if headers:
+        # We assume the last occurrence is the actual bibliography section
+        section = text[headers[-1].end():]
+    else:
+        # Without a header only a numbered [1] list can be located reliably
+        ref_start = text.rfind('[1]')
+        if ref_start == -1:
+            return Bibliography()
+        section = text[ref_start:]
+
+    entries = _numbered_bracket_entries(section)
+    if not entries:
+        entries = _numbered_line_entries(section)
+    if not entries and headers:
+        entries = _unnumbered_entries(section)
+    return Bibliography(entries)
+
+def parse_bibliography(text):
+    """
+    Identifies the References section and maps citation IDs to full text.
+    Returns a dictionary of {id: full_text}.
+    """
+    return parse_references(text).as_map()
@@ -1,51 +1,30 @@
 import re
-import nltk
-from nltk.tokenize import sent_tokenize
-
-# Ensure punkt is available
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
+from researcher_system.nlp.parsed_document import as_document, CITATION_MARKER_RE
 
 def extract_citations(text):
     """
     Extracts mere citation markers (kept for backward compatibility).
+    Accepts a ParsedDocument or a raw string.
     """
-    citations = []
-    
-    pattern_auth_year = r'\([A-Z][a-zA-Z\s]+(?:et al\.)?,\s*\d{4}\)'
-    citations.extend(re.findall(pattern_auth_year, text))
-
-    pattern_brackets = r'\[\d+(?:,\s*\d+|-?\d+)*\]'
-    citations.extend(re.findall(pattern_brackets, text))
-    
-    return list(set(citations))
+    if isinstance(text, str):
+        return list(set(CITATION_MARKER_RE.findall(text)))
+    return list(as_document(text).citation_markers)
 
 def extract_citation_contexts(text):
     """
     Extracts citation markers along with their surrounding sentence context.
+    Accepts a ParsedDocument or a raw string.
     Returns:
         dict: { "citation_marker": ["sentence 1 context", "sentence 2 context"] }
     """
-    sentences = sent_tokenize(text)
-    
-    pattern_auth_year = re.compile(r'\([A-Z][a-zA-Z\s]+(?:et al\.)?,\s*\d{4}\)')
-    pattern_brackets = re.compile(r'\[\d+(?:,\s*\d+|-?\d+)*\]')
-    
+    doc = as_document(text)
     contexts = {}
     
-    for sent in sentences:
-        # Find matches in the current sentence
-        auth_year_matches = pattern_auth_year.findall(sent)
-        bracket_matches = pattern_brackets.findall(sent)
-        
-        all_matches = set(auth_year_matches + bracket_matches)
-        
-        for match in all_matches:
+    for i, markers in sorted(doc.sentence_citations.items()):
+        sent = doc.sentences[i].text
+        for match in markers:
             if match not in contexts:
                 contexts[match] = []
-            contexts[match].append(sent.strip())
+            contexts[match].append(sent)
             
     return contexts
@@ -1,9 +1,7 @@
-import spacy
-nlp = spacy.load("en_core_web_sm")
+from researcher_system.nlp.sentence_segmenter import segment
 
 def split_sentences(text):
-    doc = nlp(text)
-    return [sent.text.strip() for sent in doc.sents]
+    return [sent.text for sent in segment(text)]
 
 def extract_claims(text):
     # This is now a wrapper that uses split_sentences
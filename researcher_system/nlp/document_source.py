@@ -0,0 +1,139 @@
+import hashlib
+import io
+import mmap
+import os
+
+class UploadTooLarge(Exception):
+    """The upload exceeds the configured maximum size."""
+
+def _kind(name):
+    return "docx" if name.lower().endswith(".docx") else "pdf"
+
+class DocumentSource:
+    """
+    One uploaded or on-disk paper, opened at most once per process.
+
+    Holds either a filesystem path or the raw bytes (or a read-only mmap of a
+    spooled upload). The parsed handles, `pdf` (a pymupdf.Document) and `docx`
+    (a python-docx Document), are created on first access and then shared by
+    parsing, forensics and highlighting. When the source is sent to a worker
+    process only the bytes travel; the handles are reopened there.
+    """
+
+    def __init__(self, name, data=None, path=None):
+        self.name = name
+        self.kind = _kind(name)
+        self.data = data
+        self.path = path
+        self._pdf = None
+        self._docx = None
+
+    @classmethod
+    def from_path(cls, path):
+        return cls(os.path.basename(path), path=path)
+
+    @classmethod
+    def from_upload(cls, name, fileobj, max_bytes):
+        """
+        Reads an upload without copying it to disk. A spooled file that has
+        already rolled over to disk is memory-mapped instead of read.
+        Raises UploadTooLarge as soon as more than max_bytes have been seen.
+        Returns (source, sha256 hexdigest).
+        """
+        fileobj.seek(0)
+        digest = hashlib.sha256()
+        fileno = None
+        # SpooledTemporaryFile.fileno() forces a rollover to disk, so only ask for
+        # the descriptor once the spool is already there
+        if getattr(fileobj, "_rolled", True):
+            try:
+                fileno = fileobj.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                fileno = None
+
+        if fileno is not None:
+            size = os.fstat(fileno).st_size
+            if size > max_bytes:
+                raise UploadTooLarge(f"Upload is {size} bytes; the limit is {max_bytes}.")
+            data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) if size else b""
+            digest.update(data)
+            return cls(name, data=data), digest.hexdigest()
+
+        chunks = []
+        total = 0
+        for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+            total += len(chunk)
+            if total > max_bytes:
+                raise UploadTooLarge(f"Upload exceeds the {max_bytes} byte limit.")
+            digest.update(chunk)
+            chunks.append(chunk)
+        return cls(name, data=b"".join(chunks)), digest.hexdigest()
+
+    def __len__(self):
+        if self.data is not None:
+            return len(self.data)
+        return os.path.getsize(self.path) if self.path else 0
+
+    @property
+    def pdf(self):
+        if self._pdf is None:
+            import pymupdf
+            if self.data is not None:
+                # PyMuPDF takes a memoryview of an mmap without copying it
+                stream = memoryview(self.data) if isinstance(self.data, mmap.mmap) else self.data
+                self._pdf = pymupdf.open(stream=stream, filetype="pdf")
+            else:
+                self._pdf = pymupdf.open(self.path)
+        return self._pdf
+
+    @property
+    def docx(self):
+        if self._docx is None:
+            import docx
+            self._docx = docx.Document(io.BytesIO(self.data) if self.data is not None else self.path)
+        return self._docx
+
+    def bytes(self):
+        """
+        The raw file content (reads the file for path-backed sources).
+        """
+        if self.data is not None:
+            return self.data if isinstance(self.data, bytes) else bytes(self.data)
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def write_to(self, path):
+        """
+        Writes the content to path (for tools that only take files, e.g. LibreOffice).
+        """
+        with open(path, "wb") as f:
+            f.write(self.bytes())
+        return path
+
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        self._docx = None
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # Still referenced by a view elsewhere; released when that goes away
+                pass
+            self.data = None
+
+    def __getstate__(self):
+        # Only the content crosses process boundaries; an mmap is materialised as bytes
+        state = dict(self.__dict__, _pdf=None, _docx=None)
+        if isinstance(self.data, mmap.mmap):
+            state["data"] = bytes(self.data)
+        return state
+
+def as_source(path_or_source):
+    """
+    Wraps a filesystem path in a DocumentSource; sources pass through unchanged.
+    """
+    if isinstance(path_or_source, DocumentSource):
+        return path_or_source
+    return DocumentSource.from_path(path_or_source)
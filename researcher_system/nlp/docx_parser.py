@@ -1,10 +1,12 @@
 import docx
+from researcher_system.nlp.document_source import DocumentSource
 
 def extract_text_from_docx(path):
     """
     Extracts text from a .docx file and splits it into body and (heuristic) references.
+    Accepts a path or a DocumentSource (whose opened document is reused).
     """
-    doc = docx.Document(path)
+    doc = path.docx if isinstance(path, DocumentSource) else docx.Document(path)
     full_text = []
     for para in doc.paragraphs:
         full_text.append(para.text)
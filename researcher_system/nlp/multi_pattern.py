@@ -0,0 +1,87 @@
+from collections import deque
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher: every pattern is found in a single left-to-right
+    pass over the text, independent of how many patterns there are.
+
+    Matching is exact; callers lowercase patterns and text themselves when they
+    need case-insensitive matching (see fold_case).
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = self._out[state] + (index,)
+
+        # Breadth-first failure links; outputs of the fallback state are merged in
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def find_all(self, text):
+        """
+        Yields (start, end, pattern_index) for every occurrence, overlaps included,
+        ordered by end position.
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for index in out[state]:
+                    yield i + 1 - len(patterns[index]), i + 1, index
+
+def fold_case(text):
+    """
+    Lowercases text without changing its length, so match offsets stay valid in the original.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch.lower()[:1] for ch in text)
+
+def select_longest(matches):
+    """
+    Resolves overlapping (start, end, index) matches: longer matches win, then
+    lower pattern index, then earlier start. Returned in text order.
+    """
+    taken = []
+    occupied = set()
+    for start, end, index in sorted(matches, key=lambda m: (m[0] - m[1], m[2], m[0])):
+        if any(pos in occupied for pos in range(start, end)):
+            continue
+        occupied.update(range(start, end))
+        taken.append((start, end, index))
+    taken.sort()
+    return taken
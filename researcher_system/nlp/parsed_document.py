@@ -0,0 +1,157 @@
+import re
+from bisect import bisect_right
+from functools import cached_property
+
+from researcher_system.nlp.sentence_segmenter import segment
+
+# Citation markers: author-year "(Smith et al., 2020)" and numeric "[3]", "[1, 4]", "[2-5]"
+PATTERN_AUTH_YEAR = r'\([A-Z][a-zA-Z\s]+(?:et al\.)?,\s*\d{4}\)'
+PATTERN_BRACKETS = r'\[\d+(?:,\s*\d+|-?\d+)*\]'
+CITATION_MARKER_RE = re.compile(f"{PATTERN_AUTH_YEAR}|{PATTERN_BRACKETS}")
+
+SECTION_NAMES = [
+    "abstract", "introduction", "background", "related work", "preliminaries",
+    "methodology", "methods", "method", "approach", "experimental setup", "experiments",
+    "evaluation", "results", "discussion", "limitations", "future work",
+    "conclusions", "conclusion", "acknowledgments", "acknowledgements", "references",
+    "bibliography", "appendix"
+]
+SECTION_HEADING_RE = re.compile(
+    r'^[ \t]*(?:(?:\d+(?:\.\d+)*|[IVXLC]+)\.?[ \t]+)?(' + "|".join(re.escape(n) for n in SECTION_NAMES) + r')\b[^\n]{0,40}$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+class ParsedDocument:
+    """
+    One indexed view of a paper's body text, built once per upload and shared by
+    every analysis stage instead of each stage rescanning the raw string.
+
+    Each index is computed on first access and then reused:
+    sentences (with offsets), section spans, citation-marker spans, a lowercase
+    view and, when the parser supplies page start offsets, a page mapping.
+    """
+
+    def __init__(self, text, page_offsets=None, references=""):
+        self.text = text or ""
+        self.references = references or ""
+        self.page_offsets = list(page_offsets) if page_offsets else [0]
+        # False when the source had no page layout (e.g. DOCX), so page numbers are meaningless
+        self.has_pages = bool(page_offsets)
+
+    def __len__(self):
+        return len(self.text)
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def sentences(self):
+        """
+        tuple of Sentence(text, start, end) from the shared segmenter.
+        """
+        return segment(self.text)
+
+    @cached_property
+    def _sentence_starts(self):
+        return [s.start for s in self.sentences]
+
+    @cached_property
+    def citation_spans(self):
+        """
+        list of (marker, start, end) for every citation marker, in document order.
+        """
+        return [(m.group(0), m.start(), m.end()) for m in CITATION_MARKER_RE.finditer(self.text)]
+
+    @cached_property
+    def citation_markers(self):
+        """
+        Unique citation markers in order of first appearance.
+        """
+        return list(dict.fromkeys(marker for marker, _, _ in self.citation_spans))
+
+    @cached_property
+    def sentence_citations(self):
+        """
+        { sentence index: [unique markers fully inside that sentence] }
+        """
+        result = {}
+        for marker, start, end in self.citation_spans:
+            i = self.sentence_index(start)
+            if i is None or end > self.sentences[i].end:
+                continue
+            markers = result.setdefault(i, [])
+            if marker not in markers:
+                markers.append(marker)
+        return result
+
+    @cached_property
+    def sections(self):
+        """
+        list of (section name, start, end); text before the first heading is "front_matter".
+        """
+        headings = [(m.group(1).lower(), m.start()) for m in SECTION_HEADING_RE.finditer(self.text)]
+        spans = []
+        prev_name, prev_start = "front_matter", 0
+        for name, start in headings:
+            if start > prev_start:
+                spans.append((prev_name, prev_start, start))
+            prev_name, prev_start = name, start
+        if len(self.text) > prev_start:
+            spans.append((prev_name, prev_start, len(self.text)))
+        return spans
+
+    @cached_property
+    def lines(self):
+        return self.text.split('\n')
+
+    def sentence_index(self, offset):
+        """
+        Index of the sentence containing offset, or None if it falls between sentences.
+        """
+        i = bisect_right(self._sentence_starts, offset) - 1
+        if i < 0 or offset >= self.sentences[i].end:
+            return None
+        return i
+
+    def page_of(self, offset):
+        """
+        0-based page number for a character offset.
+        """
+        return max(0, bisect_right(self.page_offsets, offset) - 1)
+
+    @cached_property
+    def _sentence_offsets(self):
+        offsets = {}
+        for sent in self.sentences:
+            offsets.setdefault(sent.text, (sent.start, sent.end))
+        return offsets
+
+    def pages_of(self, text):
+        """
+        0-based pages spanned by a sentence (or any substring) of the body, or
+        None when the text isn't found or the source has no pages.
+        """
+        if not self.has_pages or not text:
+            return None
+        span = self._sentence_offsets.get(text)
+        if span is None:
+            start = self.text.find(text)
+            if start == -1:
+                return None
+            span = (start, start + len(text))
+        return list(range(self.page_of(span[0]), self.page_of(max(span[0], span[1] - 1)) + 1))
+
+    def section_of(self, offset):
+        for name, start, end in self.sections:
+            if start <= offset < end:
+                return name
+        return None
+
+def as_document(text_or_doc):
+    """
+    Lets analyzers accept either a ParsedDocument or a raw string.
+    """
+    if isinstance(text_or_doc, ParsedDocument):
+        return text_or_doc
+    return ParsedDocument(text_or_doc)
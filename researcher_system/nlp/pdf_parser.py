@@ -1,16 +1,143 @@
+import atexit
+import io
+import multiprocessing
+import os
 import re
-from PyPDF2 import PdfReader
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from researcher_system.core.config import PDF_BACKEND, PDF_PARALLEL_MIN_PAGES, PDF_EXTRACT_WORKERS
+from researcher_system.nlp.document_source import DocumentSource
 
-def extract_text(path):
+# Every function below takes a file path or a DocumentSource; a source's already
+# opened PyMuPDF handle is reused (and left open for the highlighter).
+
+def _pypdf2_reader(source):
+    from PyPDF2 import PdfReader
+    if isinstance(source, DocumentSource):
+        return PdfReader(source.path if source.data is None else io.BytesIO(source.bytes()))
+    return PdfReader(source)
+
+def _pages_pypdf2(source):
+    reader = _pypdf2_reader(source)
+    return [p.extract_text() or "" for p in reader.pages]
+
+def _open_pdf(path_or_bytes):
+    import pymupdf
+    if isinstance(path_or_bytes, (bytes, bytearray)):
+        return pymupdf.open(stream=path_or_bytes, filetype="pdf")
+    return pymupdf.open(path_or_bytes)
+
+def _pymupdf_page_texts(pdf_bytes):
+    # Runs in a worker process on a PDF holding only its share of the pages
+    with _open_pdf(pdf_bytes) as doc:
+        return [page.get_text("text") for page in doc]
+
+def _pymupdf_slice(doc, start, end):
+    # Pages [start, end) as a standalone PDF; the shared handle itself is left untouched
+    import pymupdf
+    with pymupdf.open() as part:
+        part.insert_pdf(doc, from_page=start, to_page=end - 1)
+        return part.tobytes()
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+def _get_pool():
+    """
+    Process-wide extraction pool, started on first use. Its workers come from a
+    forkserver (spawn where that is unavailable), never from forking a process
+    that may already be running threads.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=PDF_EXTRACT_WORKERS, mp_context=multiprocessing.get_context(method))
+            _pool_pid = os.getpid()
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+def _pages_pymupdf(source, parallel_min_pages=None, workers=None):
+    parallel_min_pages = parallel_min_pages or PDF_PARALLEL_MIN_PAGES
+    workers = min(workers or PDF_EXTRACT_WORKERS, PDF_EXTRACT_WORKERS)
+
+    if isinstance(source, DocumentSource):
+        doc = source.pdf
+        if doc.page_count < parallel_min_pages or workers < 2:
+            return [page.get_text("text") for page in doc]
+        return _pages_pymupdf_parallel(doc, workers)
+    with _open_pdf(source) as doc:
+        if doc.page_count < parallel_min_pages or workers < 2:
+            return [page.get_text("text") for page in doc]
+        return _pages_pymupdf_parallel(doc, workers)
+
+def _pages_pymupdf_parallel(doc, workers):
+    # Large document: contiguous page ranges, one per worker, reassembled in order.
+    # Each worker receives only its own pages, not a copy of the whole file.
+    n_pages = doc.page_count
+    step = -(-n_pages // workers)
+    pool = _get_pool()
+    futures = [pool.submit(_pymupdf_page_texts, _pymupdf_slice(doc, start, min(n_pages, start + step)))
+               for start in range(0, n_pages, step)]
+    return [text for future in futures for text in future.result()]
+
+def extract_pages(path, backend=None):
+    """
+    Returns the text of every page, in order, using the configured backend.
+    """
+    backend = backend or PDF_BACKEND
+    if backend == "pypdf2":
+        return _pages_pypdf2(path)
+    if backend == "pymupdf":
+        return _pages_pymupdf(path)
+    raise ValueError(f"Unknown PDF backend: {backend}")
+
+def iter_pages(path, backend=None):
+    """
+    Yields page texts one at a time, extracting each page only when it is requested.
+    """
+    backend = backend or PDF_BACKEND
+    if backend == "pypdf2":
+        for p in _pypdf2_reader(path).pages:
+            yield p.extract_text() or ""
+    elif backend == "pymupdf":
+        if isinstance(path, DocumentSource):
+            for page in path.pdf:
+                yield page.get_text("text")
+        else:
+            with _open_pdf(path) as doc:
+                for page in doc:
+                    yield page.get_text("text")
+    else:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+
+def join_pages(pages):
+    """
+    Joins page texts into one string (empty pages contribute nothing).
+    Returns (text, page_starts).
+    """
+    page_starts = []
+    pieces = []
+    pos = 0
+    for page_text in pages:
+        page_starts.append(pos)
+        if page_text:
+            pieces.append(page_text + "\n")
+            pos += len(page_text) + 1
+    return "".join(pieces), page_starts
+
+def extract_text(path, backend=None):
     """
     Extracts text and separates it into 'body' and 'references' sections.
+    'page_offsets' holds the character offset in 'body' where each page starts.
+    """
+    return split_body_references(extract_pages(path, backend))
+
+def find_reference_split(text):
+    """
+    Character offset where the references section starts, or -1 if none is found.
     """
-    reader = PdfReader(path)
-    text = ""
-    for p in reader.pages:
-        if p.extract_text():
-            text += p.extract_text() + "\n"
-    
     # More aggressive search for references section
     # Look for the header and the first citation [1] close to each other
     patterns = [
@@ -38,14 +165,29 @@ def extract_text(path):
         fallback = text.rfind("[1]")
         if fallback != -1 and fallback > len(text) * 0.5: # Likely bibliography
             split_idx = fallback
+    return split_idx
+
+def split_body_references(pages):
+    """
+    Splits page texts into the {"body", "references", "page_offsets"} contract.
+    """
+    # Join once instead of repeated concatenation
+    text, page_starts = join_pages(pages)
+    split_idx = find_reference_split(text)
+
+    body_end = split_idx if split_idx != -1 else len(text)
+    lead = len(text[:body_end]) - len(text[:body_end].lstrip())
+    page_offsets = [max(0, s - lead) for s in page_starts if s < body_end]
 
     if split_idx != -1:
         return {
             "body": text[:split_idx].strip(),
-            "references": text[split_idx:].strip()
+            "references": text[split_idx:].strip(),
+            "page_offsets": page_offsets
         }
     else:
         return {
             "body": text.strip(),
-            "references": ""
+            "references": "",
+            "page_offsets": page_offsets
         }
@@ -0,0 +1,130 @@
+import re
+from collections import namedtuple
+
+from researcher_system.nlp.multi_pattern import fold_case
+
+# One regex hit: the rule's name and category, its span in the scanned text, and the value
+# re.findall would have produced for it (whole match, single group, or tuple of groups).
+Hit = namedtuple("Hit", ["rule", "category", "start", "end", "value"])
+
+_INLINE_IGNORECASE = "(?i)"
+
+def _foldable(body):
+    # A case-insensitive rule can run case-sensitively over lowercased text when
+    # it has no uppercase literals of its own (A-Z ranges in classes are fine)
+    probe = re.sub(r'\\.', '', body).replace("A-Z", "")
+    return not re.search(r'[A-Z]', probe)
+
+class RuleCatalog:
+    """
+    A declarative set of regex rules compiled into one combined matcher.
+
+    rules is {category: [pattern, ...]}; patterns may start with "(?i)". All
+    rules are folded into one alternation (case-insensitive rules run over a
+    lowercased copy of the text). A single pass of the non-capturing
+    alternation finds every position where some rule matches; capturing
+    groups would disable the regex engine's fast first-character scan, so
+    the named-group version of the same alternation is only run anchored at
+    those positions to tell which rule fired first. Only the rules after it
+    are tried there. The result is exactly what per-rule re.findall calls
+    would return, with offsets.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        self.categories = list(rules)
+        folded, raw = [], []
+        for category, patterns in rules.items():
+            for i, pattern in enumerate(patterns):
+                name = f"{category}_{i}"
+                flags = 0
+                body = pattern
+                if body.startswith(_INLINE_IGNORECASE):
+                    flags = re.IGNORECASE
+                    body = body[len(_INLINE_IGNORECASE):]
+                fold = bool(flags) and _foldable(body)
+                compiled = re.compile(body, 0 if fold else flags)
+                self.rules.append((name, category, compiled, fold))
+                scoped = f"(?i:{body})" if flags and not fold else f"(?:{body})"
+                (folded if fold else raw).append((name, scoped))
+        self._index = {rule[0]: i for i, rule in enumerate(self.rules)}
+        # (fold, locator, identifier) per text variant
+        self._scanners = [
+            (fold, re.compile("|".join(scoped for _, scoped in alternatives)),
+             re.compile("|".join(f"(?P<{name}>{scoped})" for name, scoped in alternatives)))
+            for fold, alternatives in [(True, folded), (False, raw)] if alternatives
+        ]
+
+    def _value(self, compiled, m, text):
+        # Slice the original text so case-insensitive hits keep their original casing
+        if compiled.groups == 0:
+            return text[m.start():m.end()]
+        groups = tuple(text[m.start(g):m.end(g)] if m.start(g) != -1 else "" for g in range(1, compiled.groups + 1))
+        return groups[0] if compiled.groups == 1 else groups
+
+    def candidates(self, text, categories=None):
+        """
+        Every (rule, position) match, overlaps included, ordered by start offset.
+        """
+        hits = []
+        wanted = set(categories) if categories else None
+        lowered = None
+        for fold, locator, identifier in self._scanners:
+            if fold and lowered is None:
+                lowered = fold_case(text)
+            subject = lowered if fold else text
+            pos = 0
+            while pos <= len(subject):
+                m = locator.search(subject, pos)
+                if m is None:
+                    break
+                start = m.start()
+                # The named group that fires here is the first matching rule; earlier rules cannot match
+                first = identifier.match(subject, start).lastgroup
+                for name, category, compiled, rule_fold in self.rules[self._index[first]:]:
+                    if rule_fold != fold or (wanted is not None and category not in wanted):
+                        continue
+                    rule_match = compiled.match(subject, start)
+                    if rule_match is not None:
+                        hits.append(Hit(name, category, start, rule_match.end(), self._value(compiled, rule_match, text)))
+                # Resume one character later so overlapping hits of other rules are found too
+                pos = start + 1
+        hits.sort(key=lambda h: (h.start, self._index[h.rule]))
+        return hits
+
+    def scan(self, text, categories=None):
+        """
+        All hits in text with offsets, in text order. Per rule the hits are
+        non-overlapping, matching what re.findall(rule, text) returns.
+        """
+        hits = []
+        next_free = {}
+        for hit in self.candidates(text, categories):
+            if hit.start < next_free.get(hit.rule, 0):
+                continue
+            hits.append(hit)
+            # findall resumes after the match (one past it for empty matches)
+            next_free[hit.rule] = hit.end if hit.end > hit.start else hit.end + 1
+        return hits
+
+    def categories_in(self, text):
+        """
+        Set of categories with at least one hit in text.
+        """
+        return {hit.category for hit in self.candidates(text)}
+
+    def values_by_category(self, hits):
+        """
+        { category: [hit.value, ...] } ordered rule by rule, then by offset, the
+        order successive per-rule re.findall calls would have produced.
+        """
+        grouped = {category: [] for category in self.categories}
+        for hit in sorted(hits, key=lambda h: (self._index[h.rule], h.start)):
+            grouped[hit.category].append(hit.value)
+        return grouped
+
+def literal_rules(words):
+    """
+    Patterns matching each word as a plain substring.
+    """
+    return [re.escape(w) for w in words]
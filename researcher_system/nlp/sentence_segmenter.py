@@ -0,0 +1,85 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from researcher_system.core.config import SEGMENTER_BACKEND, SEGMENTER_CHUNK_CHARS
+from researcher_system.core.model_registry import SPACY_SENTER_MODEL, SPACY_SENTENCIZER, get_model
+
+# A sentence with its [start, end) character span in the segmented text
+Sentence = namedtuple("Sentence", ["text", "start", "end"])
+
+_REGEX_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+def _chunks(text, max_chars):
+    """
+    Yields (offset, chunk) pieces of at most ~max_chars, cut at the last paragraph
+    or line break before the limit so no sentence is split mid-way in practice.
+    """
+    start = 0
+    n = len(text)
+    while start < n:
+        end = min(n, start + max_chars)
+        if end < n:
+            cut = text.rfind("\n\n", start, end)
+            if cut <= start:
+                cut = text.rfind("\n", start, end)
+            if cut > start:
+                end = cut + 1
+        yield start, text[start:end]
+        start = end
+
+def _strip_span(text, start, end):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+def _segment_regex(text):
+    sentences = []
+    pos = 0
+    for m in _REGEX_BOUNDARY.finditer(text):
+        sentences.append((pos, m.start()))
+        pos = m.end()
+    sentences.append((pos, len(text)))
+    return sentences
+
+def _segment_spacy(text, model_name, chunk_chars):
+    nlp = get_model(model_name)
+    pieces = list(_chunks(text, chunk_chars))
+    spans = []
+    for (offset, _), doc in zip(pieces, nlp.pipe((chunk for _, chunk in pieces), batch_size=8)):
+        for sent in doc.sents:
+            spans.append((offset + sent.start_char, offset + sent.end_char))
+    return spans
+
+@lru_cache(maxsize=8)
+def _segment_cached(text, backend, chunk_chars):
+    if backend == "regex":
+        spans = _segment_regex(text)
+    else:
+        model_name = SPACY_SENTENCIZER if backend == "sentencizer" else SPACY_SENTER_MODEL
+        spans = _segment_spacy(text, model_name, chunk_chars)
+
+    sentences = []
+    for start, end in spans:
+        start, end = _strip_span(text, start, end)
+        if end > start:
+            sentences.append(Sentence(text[start:end], start, end))
+    return tuple(sentences)
+
+def segment(text, backend=None, chunk_chars=None):
+    """
+    Splits text into sentences with character offsets, shared by every stage that
+    needs sentence boundaries (claims, citation contexts, novelty).
+
+    Long documents are cut into ~SEGMENTER_CHUNK_CHARS pieces at line breaks and
+    streamed through nlp.pipe. The last few results are memoized, so stages that
+    segment the same body text in one run reuse a single pass.
+
+    Returns:
+        tuple of Sentence(text, start, end): text == original[start:end].
+    """
+    if not text:
+        return ()
+    return _segment_cached(text, backend or SEGMENTER_BACKEND, chunk_chars or SEGMENTER_CHUNK_CHARS)
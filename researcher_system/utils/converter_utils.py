@@ -1,16 +1,39 @@
 import subprocess
 import os
 import logging
+from researcher_system.core.config import OFFICE_BINARY, OFFICE_JOB_TIMEOUT
+from researcher_system.utils.office_pool import get_office_pool
 
 def convert_docx_to_pdf(docx_path, output_dir):
     """
     Converts a .docx file to .pdf using LibreOffice headless mode.
+    Uses the shared pool of long-lived LibreOffice workers when available,
+    otherwise one soffice process per call.
+    Returns the path to the generated PDF.
+    """
+    pool = get_office_pool()
+    if pool is None:
+        return convert_docx_to_pdf_subprocess(docx_path, output_dir)
+
+    base_name = os.path.splitext(os.path.basename(docx_path))[0]
+    pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
+    try:
+        logging.info(f"Converting {docx_path} to PDF in {output_dir} (office pool)")
+        pool.convert(docx_path, pdf_path, block_timeout=OFFICE_JOB_TIMEOUT)
+        return pdf_path if os.path.exists(pdf_path) else None
+    except Exception as e:
+        logging.error(f"Error in DOCX to PDF conversion: {e}")
+        return None
+
+def convert_docx_to_pdf_subprocess(docx_path, output_dir):
+    """
+    Converts a .docx file to .pdf with a fresh LibreOffice headless process.
     Returns the path to the generated PDF.
     """
     try:
         # Command for LibreOffice headless conversion
         cmd = [
-            'libreoffice',
+            OFFICE_BINARY,
             '--headless',
             '--convert-to', 'pdf',
             '--outdir', output_dir,
@@ -18,7 +41,7 @@ def convert_docx_to_pdf(docx_path, output_dir):
         ]
         
         logging.info(f"Converting {docx_path} to PDF in {output_dir}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=OFFICE_JOB_TIMEOUT)
         
         # Determine the output filename
         base_name = os.path.splitext(os.path.basename(docx_path))[0]
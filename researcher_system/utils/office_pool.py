@@ -0,0 +1,244 @@
+import atexit
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+class PoolBusy(Exception):
+    """The conversion queue is full."""
+
+class ConversionTimeout(Exception):
+    """A conversion did not finish within the job timeout; its worker was restarted."""
+
+def uno_available():
+    try:
+        import uno  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class OfficeWorker:
+    """
+    One long-lived headless LibreOffice process with its own user profile,
+    listening on a named UNO pipe. Conversions run inside the already-started
+    office, so only the first job pays the cold start.
+    """
+
+    def __init__(self, index, pipe_name, binary="soffice", start_timeout=60.0):
+        self.index = index
+        self.pipe_name = pipe_name
+        self.binary = binary
+        self.start_timeout = start_timeout
+        # Separate profile per worker so instances never contend for the same lock files
+        self.profile_dir = tempfile.mkdtemp(prefix=f"office_worker_{index}_")
+        self.process = None
+        self.desktop = None
+        self.started = False
+        self.jobs_done = 0
+        self.restarts = 0
+
+    def start(self):
+        import uno
+
+        self.started = True
+        cmd = [
+            self.binary, "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+            f"-env:UserInstallation={uno.systemPathToFileUrl(self.profile_dir)}",
+            f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+        ]
+        self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext")
+                self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+                return
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"LibreOffice worker {self.index} failed to start on pipe {self.pipe_name}")
+                time.sleep(0.25)
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None and self.desktop is not None
+
+    def stop(self):
+        self.desktop = None
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            try: self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired: pass
+        self.process = None
+
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        self.start()
+
+    def close(self):
+        self.stop()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def convert(self, docx_path, pdf_path, timeout):
+        """
+        Converts docx_path to pdf_path inside this office. A watchdog kills the
+        process when the job exceeds timeout, which aborts the blocking UNO call.
+        """
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name = name
+            p.Value = value
+            return p
+
+        timed_out = threading.Event()
+        def _expire():
+            timed_out.set()
+            if self.process is not None:
+                self.process.kill()
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.start()
+        try:
+            doc = self.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(docx_path)), "_blank", 0, (prop("Hidden", True),)
+            )
+            if doc is None:
+                raise RuntimeError(f"LibreOffice could not open {docx_path}")
+            try:
+                doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(pdf_path)), (prop("FilterName", "writer_pdf_Export"),))
+            finally:
+                doc.close(True)
+        except Exception as e:
+            if timed_out.is_set():
+                raise ConversionTimeout(f"Conversion of {docx_path} exceeded {timeout}s") from e
+            raise
+        finally:
+            watchdog.cancel()
+        self.jobs_done += 1
+        return pdf_path
+
+class OfficePool:
+    """
+    Fixed-size pool of OfficeWorkers fed from a bounded job queue.
+
+    Each worker thread owns one office process. A worker that crashed or was
+    killed by a job timeout is restarted before it takes the next job; a job
+    that failed because its office died (not a timeout) is retried once on
+    the fresh process.
+    """
+
+    def __init__(self, size=2, queue_size=16, job_timeout=120.0, binary="soffice"):
+        self.size = size
+        self.job_timeout = job_timeout
+        self._jobs = queue.Queue(maxsize=queue_size)
+        # Pipe names include the PID: every API / job worker process runs its own pool, and a shared
+        # endpoint would connect one process's pool to (and let its watchdog kill) another's office
+        self._workers = [OfficeWorker(i, f"office_{os.getpid()}_{i}", binary) for i in range(size)]
+        self._threads = []
+        self._closed = False
+        for worker in self._workers:
+            t = threading.Thread(target=self._run, args=(worker,), daemon=True, name=f"office-worker-{worker.index}")
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, docx_path, pdf_path, block_timeout=0):
+        """
+        Queues a conversion and returns a Future resolving to pdf_path.
+        Raises PoolBusy if the queue stays full for block_timeout seconds.
+        """
+        if self._closed:
+            raise RuntimeError("Office pool is shut down")
+        future = Future()
+        job = (docx_path, pdf_path, future)
+        try:
+            if block_timeout:
+                self._jobs.put(job, timeout=block_timeout)
+            else:
+                self._jobs.put_nowait(job)
+        except queue.Full:
+            raise PoolBusy(f"Conversion queue is full ({self._jobs.maxsize} pending)")
+        return future
+
+    def convert(self, docx_path, pdf_path, block_timeout=0):
+        return self.submit(docx_path, pdf_path, block_timeout).result()
+
+    def _run(self, worker):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            docx_path, pdf_path, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._convert_with_recovery(worker, docx_path, pdf_path))
+            except Exception as e:
+                future.set_exception(e)
+        worker.close()
+
+    def _convert_with_recovery(self, worker, docx_path, pdf_path):
+        for attempt in range(2):
+            if not worker.alive():
+                # First job starts the office; later ones recover from a crash or timeout kill
+                if worker.started:
+                    worker.restart()
+                else:
+                    worker.start()
+            try:
+                return worker.convert(docx_path, pdf_path, self.job_timeout)
+            except ConversionTimeout:
+                worker.stop()
+                raise
+            except Exception as e:
+                if worker.alive() or attempt:
+                    raise
+                logging.warning(f"LibreOffice worker {worker.index} died during conversion, restarting: {e}")
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "queued": self._jobs.qsize(),
+            "queue_size": self._jobs.maxsize,
+            "workers": [{"pipe": w.pipe_name, "alive": w.alive(), "jobs_done": w.jobs_done, "restarts": w.restarts}
+                        for w in self._workers]
+        }
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for t in self._threads:
+            t.join(timeout=30)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_office_pool():
+    """
+    The process-wide pool, started on first use; None when pooling is disabled
+    (OFFICE_POOL_SIZE=0) or the LibreOffice Python bindings are not installed.
+    """
+    global _pool
+    from researcher_system.core.config import (
+        OFFICE_BINARY, OFFICE_JOB_TIMEOUT, OFFICE_POOL_QUEUE, OFFICE_POOL_SIZE
+    )
+    if OFFICE_POOL_SIZE <= 0 or not uno_available():
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = OfficePool(OFFICE_POOL_SIZE, OFFICE_POOL_QUEUE, OFFICE_JOB_TIMEOUT, OFFICE_BINARY)
+                atexit.register(_pool.shutdown)
+    return _pool
@@ -1,28 +1,99 @@
 import pymupdf
 import os
+import re
+from bisect import bisect_right
+
+from researcher_system.nlp.multi_pattern import AhoCorasick, fold_case
+
+MIN_HIGHLIGHT_CHARS = 5
+
+def _normalize(text):
+    return fold_case(re.sub(r'\s+', ' ', text).strip())
+
+def _page_index(page):
+    """
+    The page's words joined by single spaces and lowercased, with the start
+    offset of each word in that string and the word boxes.
+    """
+    words = page.get_text("words", sort=False)
+    starts = []
+    parts = []
+    pos = 0
+    for w in words:
+        starts.append(pos)
+        parts.append(w[4])
+        pos += len(w[4]) + 1
+    return fold_case(" ".join(parts)), starts, words
+
+def _match_rects(words, starts, start, end):
+    # One rectangle per text line covered by the words in [start, end)
+    first = bisect_right(starts, start) - 1
+    last = bisect_right(starts, end - 1) - 1
+    lines = {}
+    for w in words[first:last + 1]:
+        key = (w[5], w[6])
+        rect = pymupdf.Rect(w[:4])
+        lines[key] = lines[key] | rect if key in lines else rect
+    return list(lines.values())
 
 def highlight_text_in_pdf(pdf_path, highlights, output_path):
     """
     Highlights instances of text strings in a PDF with specific colors.
+    pdf_path may also be an open pymupdf.Document; with output_path=None
+    nothing is saved and the annotated document is returned.
+
+    highlights is a list of (text, color) or (text, color, pages) where pages,
+    when given, lists the 0-based pages the text can be on; other pages are not
+    searched for it, and pages no highlight can be on are not read at all.
+    Each page's words are extracted once and all highlight strings are matched
+    against them in a single multi-pattern pass; the matches of one color on a
+    page go into a single annotation.
     """
     try:
-        doc = pymupdf.open(pdf_path)
-        
-        for text, color in highlights:
-            if not text or len(text) < 5:
+        # An already opened document (shared with the parser) is annotated in place and left open
+        owned = not isinstance(pdf_path, pymupdf.Document)
+        doc = pymupdf.open(pdf_path) if owned else pdf_path
+
+        patterns = []
+        colors = []
+        hints = []
+        for item in highlights:
+            text, color = item[0], item[1]
+            pages = item[2] if len(item) > 2 else None
+            if not text or len(text) < MIN_HIGHLIGHT_CHARS:
                 continue
-                
+            patterns.append(_normalize(text))
+            colors.append(color)
+            hints.append(set(pages) if pages is not None else None)
+
+        if patterns:
+            matcher = AhoCorasick(patterns)
+            unhinted = any(h is None for h in hints)
+            hinted_pages = set().union(*(h for h in hints if h is not None))
+
             for page in doc:
-                # Use QUAD search for better precision in modern PDFs
-                text_instances = page.search_for(text)
-                for inst in text_instances:
-                    highlight = page.add_highlight_annot(inst)
+                if not unhinted and page.number not in hinted_pages:
+                    continue
+                page_text, starts, words = _page_index(page)
+                quads_by_color = {}
+                for start, end, i in matcher.find_all(page_text):
+                    if hints[i] is not None and page.number not in hints[i]:
+                        continue
+                    rects = _match_rects(words, starts, start, end)
+                    quads_by_color.setdefault(tuple(colors[i]), []).extend(r.quad for r in rects)
+                # Bulk: one highlight annotation per color per page carrying all of its quads
+                for color, quads in quads_by_color.items():
+                    if not quads:
+                        continue
+                    highlight = page.add_highlight_annot(quads=quads)
                     highlight.set_colors(stroke=color)
                     highlight.update()
                     
-        doc.save(output_path)
-        doc.close()
-        return output_path
+        if output_path:
+            doc.save(output_path)
+        if owned:
+            doc.close()
+        return output_path if output_path else doc
         
     except Exception as e:
         print(f"Error highlighting PDF: {e}")
@@ -2,9 +2,10 @@ import pymupdf
 import os
 import datetime
 
-def generate_summary_page(data, output_path):
+def generate_summary_page(data, output_path=None):
     """
     Generates a stylized one-page executive summary PDF using PyMuPDF.
+    Returns the open document instead of saving it when output_path is None.
     """
     try:
         doc = pymupdf.open()
@@ -121,6 +122,8 @@ def generate_summary_page(data, output_path):
             
             if y > 750: break # Page safety
             
+        if output_path is None:
+            return doc
         doc.save(output_path)
         doc.close()
         return output_path
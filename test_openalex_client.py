@@ -0,0 +1,194 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for api.openalex.org: 120 works W0..W119, each with one author and a two-word abstract.
+# Paths listed in FAIL_FIRST answer 503 (with Retry-After: 0) that many times before succeeding.
+WORKS = {f"W{i}": {
+    "id": f"https://openalex.org/W{i}",
+    "doi": f"https://doi.org/10.1234/w{i}",
+    "title": f"Work {i}",
+    "publication_year": 2000 + i % 25,
+    "authorships": [{"author": {"id": f"https://openalex.org/A{i}", "display_name": f"Author {i}"}}],
+    "abstract_inverted_index": {"abstract": [0], str(i): [1]},
+    "referenced_works": []
+} for i in range(120)}
+
+FAIL_FIRST = {}
+requests_seen = []
+connections = set()
+lock = threading.Lock()
+in_flight = {"now": 0, "max": 0}
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=()):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in headers:
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        with lock:
+            requests_seen.append((url.path, params))
+            connections.add(self.client_address)
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            failing = FAIL_FIRST.get(url.path, 0)
+            if failing:
+                FAIL_FIRST[url.path] = failing - 1
+        try:
+            time.sleep(0.05)
+            if failing:
+                return self._send(503, {"error": "busy"}, [("Retry-After", "0")])
+            if url.path.startswith("/works/https://doi.org/"):
+                doi = url.path.split("doi.org/", 1)[1]
+                work = next((w for w in WORKS.values() if w["doi"].endswith(doi)), None)
+                return self._send(200, work) if work else self._send(404, {"error": "not found"})
+            if url.path == "/works":
+                flt = params.get("filter", "")
+                if flt.startswith("openalex:"):
+                    ids = flt[len("openalex:"):].split("|")
+                    assert len(ids) <= 50
+                    fields = params.get("select", "").split(",")
+                    results = [{k: WORKS[i][k] for k in fields} for i in ids if i in WORKS]
+                    return self._send(200, {"results": results})
+                if flt.startswith("title.search:"):
+                    title = flt[len("title.search:"):]
+                    return self._send(200, {"results": [w for w in WORKS.values() if w["title"] == title][:1]})
+            self._send(400, {"error": "bad request"})
+        finally:
+            with lock:
+                in_flight["now"] -= 1
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+# The module-level fetch_* helpers read these at import time
+cache_dir = tempfile.mkdtemp()
+os.environ["OPENALEX_BASE_URL"] = base_url
+os.environ["OPENALEX_CACHE_PATH"] = os.path.join(cache_dir, "openalex.sqlite")
+os.environ["OPENALEX_RATE_LIMIT"] = "1000"
+
+from researcher_system.api.openalex_client import (
+    OpenAlexClient, AsyncOpenAlexClient, RateLimiter, fetch_paper_by_doi, fetch_authors_for_works, fetch_abstracts_for_works
+)
+from researcher_system.api.openalex_cache import OpenAlexCache, get_openalex_cache
+
+def reset():
+    requests_seen.clear()
+    connections.clear()
+    FAIL_FIRST.clear()
+    in_flight["max"] = 0
+
+def make_client(**kwargs):
+    options = dict(base_url=base_url, mailto="dev@example.org", rate_limit=0, max_concurrency=4, backoff_base=0.01)
+    options.update(kwargs)
+    return OpenAlexClient(**options)
+
+print("1. Single lookups")
+client = make_client()
+paper = client.paper_by_doi("https://doi.org/10.1234/W7")
+assert paper["id"] == "https://openalex.org/W7" and paper["authors"][0]["display_name"] == "Author 7"
+assert client.paper_by_doi("10.1234/missing") is None
+assert client.paper_by_title("Work 12")["publication_year"] == 2012
+assert all(params.get("mailto") == "dev@example.org" for _, params in requests_seen), "polite pool mailto missing"
+
+print("2. Concurrent chunks")
+reset()
+ids = [f"https://openalex.org/W{i}" for i in range(120)] + ["https://openalex.org/W3"]
+authors = client.authors_for_works(ids)
+assert len(authors) == 120 and authors["https://openalex.org/W5"] == ["https://openalex.org/A5"]
+assert len(requests_seen) == 3, requests_seen
+assert in_flight["max"] > 1, "chunks were fetched one after another"
+abstracts = client.abstracts_for_works(ids[:60])
+assert abstracts["https://openalex.org/W42"] == "abstract 42"
+assert len(connections) <= 4, f"{len(connections)} connections for {len(requests_seen)} requests"
+
+print("3. Retries on 503")
+reset()
+FAIL_FIRST["/works/https://doi.org/10.1234/w9"] = 2
+assert client.paper_by_doi("10.1234/w9")["title"] == "Work 9"
+assert client.stats()["retries"] == 2
+
+reset()
+FAIL_FIRST["/works"] = 100
+few_retries = make_client(max_retries=1)
+assert few_retries.authors_for_works(["W1"]) == {}
+assert few_retries.stats() == {"requests": 2, "retries": 1, "failures": 1}
+
+print("4. Rate limit")
+reset()
+limited = make_client(rate_limit=20, max_concurrency=1)
+start = time.perf_counter()
+limited.authors_for_works([f"W{i}" for i in range(120)])
+limited.abstracts_for_works([f"W{i}" for i in range(120)])
+elapsed = time.perf_counter() - start
+assert elapsed >= 5 / 20, elapsed
+
+limiter = RateLimiter(100, burst=1)
+start = time.perf_counter()
+for _ in range(21):
+    limiter.acquire()
+assert time.perf_counter() - start >= 0.19
+
+print("5. Async client")
+reset()
+async def run_async():
+    async with AsyncOpenAlexClient(base_url=base_url, rate_limit=0, max_concurrency=4, backoff_base=0.01) as aclient:
+        FAIL_FIRST["/works/https://doi.org/10.1234/w1"] = 1
+        paper = await aclient.paper_by_doi("10.1234/w1")
+        authors, abstracts = await asyncio.gather(
+            aclient.authors_for_works([f"W{i}" for i in range(120)]),
+            aclient.abstracts_for_works([f"W{i}" for i in range(10)])
+        )
+        return paper, authors, abstracts, aclient.stats()
+paper, authors, abstracts, stats = asyncio.run(run_async())
+assert paper["title"] == "Work 1" and stats["retries"] == 1
+assert len(authors) == 120 and abstracts["https://openalex.org/W3"] == "abstract 3"
+assert in_flight["max"] > 1
+
+print("6. Persistent cache")
+reset()
+refs = [f"https://openalex.org/W{i}" for i in range(100)]
+first = (fetch_paper_by_doi("10.1234/W8"), fetch_authors_for_works(refs), fetch_abstracts_for_works(refs))
+cold_requests = len(requests_seen)
+assert cold_requests == 5, requests_seen
+reset()
+second = (fetch_paper_by_doi("https://doi.org/10.1234/w8"), fetch_authors_for_works(refs), fetch_abstracts_for_works(refs))
+assert second == first and len(requests_seen) == 0, requests_seen
+more = fetch_authors_for_works(refs + ["W110"])
+assert len(requests_seen) == 1 and requests_seen[0][1]["filter"] == "openalex:W110"
+assert more["https://openalex.org/W110"] == ["https://openalex.org/A110"]
+
+stats = get_openalex_cache().stats()
+assert stats["fields"]["abstract"]["hits"] == 100 and stats["fields"]["abstract"]["misses"] == 100
+assert stats["fields"]["record"]["stored"] == 1
+
+# Work records expire after their own TTL while abstracts stay fresh
+short_ttl = OpenAlexCache(os.environ["OPENALEX_CACHE_PATH"], ttl={"record": 0.0})
+time.sleep(0.01)
+assert short_ttl.work_by_doi("10.1234/w8") is None
+assert len(short_ttl.get_many(refs, "abstract")) == 100
+short_ttl = OpenAlexCache(os.environ["OPENALEX_CACHE_PATH"], ttl={"record": 0.0, "authors": 0.0, "abstract": 0.0})
+assert short_ttl.prune() == 101 and short_ttl.stats()["works"] == 0
+
+client.close()
+server.shutdown()
+print("All OpenAlex client checks passed.")